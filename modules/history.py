@@ -0,0 +1,136 @@
+import array
+import contextlib
+import sqlite3
+
+HISTORY_SIZE = 100
+FAILURE_HISTORY_SIZE = 16
+LOCK_TIMEOUT = 10
+
+
+class LatencyHistory:
+    def __init__(self, path, size=HISTORY_SIZE):
+        self.size = size
+        self.connection = sqlite3.connect(
+            path, timeout=LOCK_TIMEOUT, isolation_level=None,
+            check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS latency ("
+            "host TEXT, tenant TEXT, report TEXT, rtype TEXT, samples BLOB, "
+            "PRIMARY KEY (host, tenant, report, rtype)"
+            ") WITHOUT ROWID"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS failures ("
+            "host TEXT, tenant TEXT, report TEXT, rtype TEXT, "
+            "runs INTEGER, "
+            "PRIMARY KEY (host, tenant, report, rtype)"
+            ") WITHOUT ROWID"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS checks ("
+            "host TEXT, tenant TEXT, report TEXT, rtype TEXT, "
+            "checked REAL, "
+            "PRIMARY KEY (host, tenant, report, rtype)"
+            ") WITHOUT ROWID"
+        )
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+
+        self.connection.execute("COMMIT")
+
+    @staticmethod
+    def _unpack(blob):
+        samples = array.array("f")
+        samples.frombytes(blob)
+        return samples
+
+    def load(self, host, rtype):
+        history = dict()
+        for tenant, report, blob in self.connection.execute(
+                "SELECT tenant, report, samples FROM latency "
+                "WHERE host = ? AND rtype = ?", (host, rtype)
+        ):
+            history.update({(tenant, report): list(self._unpack(blob))})
+
+        return history
+
+    def record(self, host, rtype, latencies):
+        if not latencies:
+            return
+
+        with self._transaction():
+            for (tenant, report), values in latencies.items():
+                row = self.connection.execute(
+                    "SELECT samples FROM latency WHERE host = ? AND "
+                    "tenant = ? AND report = ? AND rtype = ?",
+                    (host, tenant, report, rtype)
+                ).fetchone()
+                samples = self._unpack(row[0]) if row else array.array("f")
+                samples.extend(values)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO latency VALUES (?, ?, ?, ?, ?)", (
+                        host, tenant, report, rtype,
+                        samples[-self.size:].tobytes()
+                    )
+                )
+
+    def load_failures(self, host, rtype):
+        return dict(
+            ((tenant, report), runs)
+            for tenant, report, runs in self.connection.execute(
+                "SELECT tenant, report, runs FROM failures "
+                "WHERE host = ? AND rtype = ?", (host, rtype)
+            )
+        )
+
+    def record_failures(self, host, rtype, outcomes):
+        if not outcomes:
+            return
+
+        with self._transaction():
+            for (tenant, report), failed in outcomes.items():
+                row = self.connection.execute(
+                    "SELECT runs FROM failures WHERE host = ? AND "
+                    "tenant = ? AND report = ? AND rtype = ?",
+                    (host, tenant, report, rtype)
+                ).fetchone()
+                runs = ((row[0] if row else 0) << 1 | int(failed)) & \
+                    ((1 << FAILURE_HISTORY_SIZE) - 1)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO failures VALUES (?, ?, ?, ?, ?)",
+                    (host, tenant, report, rtype, runs)
+                )
+
+    def load_checks(self, host, rtype):
+        return dict(
+            ((tenant, report), checked)
+            for tenant, report, checked in self.connection.execute(
+                "SELECT tenant, report, checked FROM checks "
+                "WHERE host = ? AND rtype = ?", (host, rtype)
+            )
+        )
+
+    def record_checks(self, host, rtype, keys, checked):
+        if not keys:
+            return
+
+        with self._transaction():
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO checks VALUES (?, ?, ?, ?, ?)", [
+                    (host, tenant, report, rtype, checked)
+                    for tenant, report in keys
+                ]
+            )
+
+    def close(self):
+        self.connection.close()
@@ -1,17 +1,148 @@
 #!/usr/bin/env python3
+import collections
+import concurrent.futures
 import datetime
+import importlib.util
+import itertools
+import json
+import math
+import os
+import queue
+import socket
+import sqlite3
+import ssl
+import threading
 import time
 
 import requests
+import urllib3
+
+from argo_probe_webapi.history import LatencyHistory
+
+httpx = None
 
 API_RESULTS = '/api/v2/results'
 API_STATUS = '/api/v2/status'
+API_VERSION = '/api/v2/version'
+
+CHUNK_SIZE = 64 * 1024
+PHASES = ("dns", "connect", "tls", "wait", "download")
+THRESHOLD_METRICS = ("time", "size", "p95", "bytes")
+BACKOFF_STATUS_CODES = (429, 503)
+MAX_ATTEMPTS = 3
+MIN_BACKOFF_DELAY = 0.1
+MAX_BACKOFF_DELAY = 10.
+LATENCY_SPIKE_FACTOR = 3.
+RETRY = object()
+DNS_CACHE_TTL = 60.
+MIN_SETTLE_TIMEOUT = 0.05
+HOST_ERRORS = ("dns", "connect", "tls", "server", "decode")
+TENANT_ERRORS = ("auth", "invalid")
+MIN_HEDGE_SAMPLES = 5
+MIN_HISTORY_SAMPLES = 10
+MIN_REPORT_TIMEOUT = 1.
+JSON_DECODE_ERROR = "CRITICAL - JSON decode error"
+ACCEPT_ENCODING = urllib3.util.make_headers(
+    accept_encoding=True
+)["accept-encoding"]
 
 
 def get_today():
     return datetime.datetime.today()
 
 
+def percentile(values, percent):
+    if not values:
+        return 0
+
+    return values[max(0, math.ceil(percent / 100. * len(values)) - 1)]
+
+
+def perfdata_label(name):
+    if any(char in name for char in " '="):
+        name = name.replace("'", "''")
+        return f"'{name}'"
+
+    return name
+
+
+def validate_results(rtype, name, results):
+    if not results:
+        return None
+
+    try:
+        if rtype == "ar":
+            assert results["results"][0][
+                "endpoints"
+            ][0]["results"][0]["availability"]
+
+        else:
+            assert results["groups"][0]["statuses"]
+
+        return "OK"
+
+    except (KeyError, AssertionError, TypeError):
+        return invalid_results(rtype, name)
+
+
+def invalid_results(rtype, name):
+    if rtype == "ar":
+        obj = "availability"
+
+    else:
+        obj = "status"
+
+    return f"CRITICAL - Unable to retrieve {obj} from report {name}"
+
+
+def classify_verdict(rtype, name, verdict):
+    if verdict == JSON_DECODE_ERROR:
+        return "decode"
+
+    if verdict == invalid_results(rtype, name):
+        return "invalid"
+
+    return None
+
+
+def decode_and_validate(rtype, name, content, performance):
+    try:
+        results = json.loads(content)
+
+    except ValueError:
+        return JSON_DECODE_ERROR, None
+
+    performance.update({"size": len(content)})
+
+    return validate_results(rtype, name, results), performance
+
+
+def decoded_outcome(outcome):
+    if not isinstance(outcome, concurrent.futures.Future):
+        return outcome
+
+    try:
+        return outcome.result()
+
+    except concurrent.futures.BrokenExecutor as e:
+        return f"CRITICAL - Decode worker failed: {str(e)}", None
+
+
+def failure_recency(runs):
+    if not runs:
+        return math.inf, 0
+
+    return (runs & -runs).bit_length(), -bin(runs).count("1")
+
+
+def discard_responses(arrivals, count):
+    for i in range(count):
+        hedge, outcome = arrivals.get()
+        if not isinstance(outcome, Exception):
+            abort_response(outcome[0])
+            outcome[0].close()
+
+
 class WebAPIReportsException(Exception):
     def __init__(self, msg):
         self.msg = msg
@@ -20,6 +151,730 @@ class WebAPIReportsException(Exception):
         return self.msg
 
 
+def parse_retry_after(value):
+    if not value:
+        return 0.
+
+    try:
+        return max(0., float(value))
+
+    except ValueError:
+        import email.utils
+
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+
+        except (TypeError, ValueError):
+            return 0.
+
+        return max(
+            0., (date - datetime.datetime.now(date.tzinfo)).total_seconds()
+        )
+
+
+class AdaptiveController:
+    def __init__(self, maximum, adaptive, delay, max_pause):
+        self.maximum = maximum
+        self.adaptive = adaptive
+        self.limit = 1 if adaptive else maximum
+        self.peak = self.limit
+        self.delay = delay
+        self.max_pause = max_pause
+        self.resume_at = 0.
+        self.backoffs = 0
+        self.successes = 0
+        self.baselines = dict()
+        self.lock = threading.Lock()
+
+    def pause(self):
+        if not self.resume_at:
+            return 0.
+
+        return self.resume_at - time.monotonic()
+
+    def backoff(self, retry_after=0.):
+        with self.lock:
+            self.limit = max(1, self.limit // 2)
+            self.delay = min(
+                max(2 * self.delay, MIN_BACKOFF_DELAY), MAX_BACKOFF_DELAY
+            )
+            self.successes = 0
+            self.backoffs += 1
+            if retry_after:
+                self.resume_at = max(
+                    self.resume_at,
+                    time.monotonic() + min(retry_after, self.max_pause)
+                )
+
+    def record(self, latency, status_code, retry_after=None, key=None):
+        retry_after = parse_retry_after(retry_after)
+        if status_code in BACKOFF_STATUS_CODES or retry_after:
+            self.backoff(retry_after)
+            return True
+
+        with self.lock:
+            baseline = self.baselines.get(key)
+            spike = baseline is not None and \
+                latency > LATENCY_SPIKE_FACTOR * baseline
+            if baseline is None:
+                self.baselines.update({key: latency})
+
+            else:
+                self.baselines.update({key: 0.8 * baseline + 0.2 * latency})
+
+        if spike:
+            self.backoff()
+            return True
+
+        with self.lock:
+            self.successes += 1
+            if self.successes >= self.limit:
+                self.successes = 0
+                self.limit = min(self.maximum, self.limit + 1)
+                self.peak = max(self.peak, self.limit)
+                if self.delay > MIN_BACKOFF_DELAY:
+                    self.delay = self.delay / 2.
+
+                else:
+                    self.delay = 0.
+
+        return False
+
+
+class ReportQueue:
+    def __init__(self, jobs, fair=False, caps=None, clock=None):
+        self.fair = fair
+        self.caps = caps if caps else dict()
+        self.clock = clock
+        self.queues = collections.OrderedDict()
+        self.running = collections.Counter()
+        self.waits = collections.defaultdict(list)
+        self.sequence = itertools.count()
+        self.turn = 0
+        for job in jobs:
+            self.put(job, 1)
+
+    def __len__(self):
+        return sum(len(jobs) for jobs in self.queues.values())
+
+    def put(self, job, attempt):
+        self.queues.setdefault(job[0], collections.deque()).append((
+            next(self.sequence), job, attempt,
+            self.clock() if self.clock else 0.
+        ))
+
+    def _eligible(self, tenant):
+        cap = self.caps.get(tenant, self.caps.get(None, 0))
+        return self.queues[tenant] and \
+            (not cap or self.running[tenant] < cap)
+
+    def get(self):
+        tenants = list(self.queues.keys())
+        eligible = [tenant for tenant in tenants if self._eligible(tenant)]
+        if not eligible:
+            return None
+
+        if self.fair:
+            tenant = min(
+                eligible,
+                key=lambda name: (tenants.index(name) - self.turn) %
+                len(tenants)
+            )
+            self.turn = tenants.index(tenant) + 1
+
+        else:
+            tenant = min(
+                eligible, key=lambda name: self.queues[name][0][0]
+            )
+
+        sequence, job, attempt, queued = self.queues[tenant].popleft()
+        self.running[tenant] += 1
+        if self.clock:
+            self.waits[tenant].append(self.clock() - queued)
+
+        return job, attempt
+
+    def done(self, tenant):
+        self.running[tenant] -= 1
+
+    def drop(self, tenant):
+        dropped = len(self.queues.get(tenant, list()))
+        self.queues.pop(tenant, None)
+        return dropped
+
+
+class NagiosRange:
+    def __init__(self, text):
+        self.text = text
+        self.inside = text.startswith("@")
+        try:
+            if ":" in text.lstrip("@"):
+                start, end = text.lstrip("@").split(":", 1)
+                if start == "~":
+                    self.start = -math.inf
+
+                else:
+                    self.start = float(start or 0)
+
+                self.end = float(end) if end else math.inf
+
+            else:
+                self.start = 0
+                self.end = float(text.lstrip("@"))
+
+        except ValueError:
+            raise WebAPIReportsException(f"Invalid threshold range: {text}")
+
+        if self.start > self.end:
+            raise WebAPIReportsException(f"Invalid threshold range: {text}")
+
+    def __str__(self):
+        return self.text
+
+    def alert(self, value):
+        if self.inside:
+            return self.start <= value <= self.end
+
+        else:
+            return value < self.start or value > self.end
+
+
+def parse_thresholds(definitions):
+    thresholds = dict()
+    for definition in definitions or list():
+        try:
+            metric, text = definition.split("=")
+
+        except ValueError:
+            raise WebAPIReportsException(
+                f"Wrong threshold definition: {definition}; threshold "
+                f"needs to be defined as <METRIC>=<RANGE>"
+            )
+
+        if metric not in THRESHOLD_METRICS:
+            raise WebAPIReportsException(
+                f"Wrong threshold metric: {metric}; metric needs to be "
+                f"one of {', '.join(THRESHOLD_METRICS)}"
+            )
+
+        thresholds.update({metric: NagiosRange(text)})
+
+    return thresholds
+
+
+class ResponseTooLargeException(Exception):
+    def __init__(self, size):
+        self.size = size
+
+
+class PhaseTimeoutException(Exception):
+    def __init__(self, phase, timeout):
+        self.phase = phase
+        self.timeout = timeout
+
+    def __str__(self):
+        return f"{self.phase} timed out after {self.timeout:g} s"
+
+
+def caused_by(error, cause_type):
+    seen = set()
+    causes = [error]
+    while causes:
+        cause = causes.pop()
+        if not isinstance(cause, BaseException) or id(cause) in seen:
+            continue
+
+        if isinstance(cause, cause_type):
+            return True
+
+        seen.add(id(cause))
+        causes.extend(cause.args)
+        causes.extend([
+            cause.__cause__, cause.__context__, getattr(cause, "reason", None)
+        ])
+
+    return False
+
+
+def classify_error(error, status_code=None):
+    response = getattr(error, "response", None)
+    if response is not None:
+        status_code = response.status_code
+
+    if status_code and status_code >= 400:
+        if status_code in (401, 403):
+            return "auth"
+
+        if status_code < 500:
+            return "client"
+
+        return "server"
+
+    if isinstance(error, json.JSONDecodeError):
+        return "decode"
+
+    if isinstance(error, (
+            PhaseTimeoutException, requests.exceptions.Timeout
+    )):
+        return "timeout"
+
+    if isinstance(error, requests.exceptions.SSLError):
+        return "tls"
+
+    if isinstance(error, requests.exceptions.ConnectionError):
+        if caused_by(error, socket.gaierror):
+            return "dns"
+
+        return "connect"
+
+    return "request"
+
+
+class DNSCache:
+    def __init__(self, ttl=DNS_CACHE_TTL):
+        self.ttl = ttl
+        self.entries = dict()
+        self.lock = threading.Lock()
+
+    def resolve(self, host, port):
+        now = time.monotonic()
+        with self.lock:
+            expires, addresses = self.entries.get((host, port), (0., None))
+            if addresses and now < expires:
+                return addresses
+
+        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        with self.lock:
+            self.entries.update({(host, port): (now + self.ttl, addresses)})
+
+        return addresses
+
+
+DNS_CACHE = DNSCache()
+PHASE_TIMINGS = threading.local()
+
+
+class TimedConnectionMixin:
+    def _new_conn(self):
+        phases = getattr(PHASE_TIMINGS, "current", None)
+        start = time.monotonic()
+        try:
+            addresses = DNS_CACHE.resolve(self._dns_host, self.port)
+
+        except socket.gaierror:
+            return super()._new_conn()
+
+        resolved = time.monotonic()
+
+        host = self._dns_host
+        error = None
+        try:
+            for address in addresses:
+                self._dns_host = address[4][0]
+                try:
+                    sock = super()._new_conn()
+                    break
+
+                except urllib3.exceptions.NewConnectionError as e:
+                    error = e
+
+            else:
+                raise error
+
+        finally:
+            self._dns_host = host
+
+        self._new_conn_time = time.monotonic() - start
+        if phases is not None:
+            phases["dns"] += resolved - start
+            phases["connect"] += time.monotonic() - resolved
+
+        return sock
+
+    def getresponse(self, *args, **kwargs):
+        phases = getattr(PHASE_TIMINGS, "current", None)
+        start = time.monotonic()
+        response = super().getresponse(*args, **kwargs)
+        if phases is not None:
+            phases["wait"] += time.monotonic() - start
+
+        return response
+
+
+class TimedHTTPConnection(
+    TimedConnectionMixin, urllib3.connection.HTTPConnection
+):
+    pass
+
+
+class TimedHTTPSConnection(
+    TimedConnectionMixin, urllib3.connection.HTTPSConnection
+):
+    def connect(self):
+        phases = getattr(PHASE_TIMINGS, "current", None)
+        self._new_conn_time = 0.
+        start = time.monotonic()
+        super().connect()
+        if phases is not None:
+            phases["tls"] += time.monotonic() - start - self._new_conn_time
+
+
+class TimedHTTPConnectionPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TLSSessionContext(ssl.SSLContext):
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.sockets = dict()
+        self.sessions = dict()
+        self.handshakes = collections.Counter()
+
+    def wrap_socket(
+            self, sock, *args, server_hostname=None, session=None, **kwargs
+    ):
+        with self.lock:
+            previous = self.sockets.get(server_hostname)
+            if previous is not None and previous.session is not None:
+                self.sessions.update({server_hostname: previous.session})
+
+            if session is None:
+                session = self.sessions.get(server_hostname)
+
+        sslsock = super().wrap_socket(
+            sock, *args, server_hostname=server_hostname, session=session,
+            **kwargs
+        )
+        with self.lock:
+            self.sockets.update({server_hostname: sslsock})
+            if sslsock.session_reused:
+                self.handshakes["resumed"] += 1
+
+            else:
+                self.handshakes["full"] += 1
+
+        return sslsock
+
+
+class TimedHTTPAdapter(requests.adapters.HTTPAdapter):
+    def __init__(self, *args, ssl_context=None, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.ssl_context is not None:
+            kwargs.update({"ssl_context": self.ssl_context})
+
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool
+        }
+
+
+class RequestsTransport:
+    def __init__(self, session=None):
+        self.session = session
+
+    def get(self, url, headers, timeout, stream=False):
+        request_args = dict()
+        if stream:
+            request_args.update({"stream": True})
+
+        if self.session:
+            get = self.session.get
+
+        else:
+            get = requests.get
+
+        return get(url, headers=headers, timeout=timeout, **request_args)
+
+    def connection_pool(self, url):
+        adapter = self.session.get_adapter(url)
+        verify = self.session.merge_environment_settings(
+            url, dict(), None, None, None
+        )["verify"]
+        try:
+            return adapter.get_connection_with_tls_context(
+                requests.Request("GET", url).prepare(), verify
+            )
+
+        except AttributeError:
+            return adapter.get_connection(url)
+
+    def close(self):
+        if self.session:
+            self.session.close()
+
+
+def ca_bundle():
+    return os.environ.get("REQUESTS_CA_BUNDLE") or \
+        os.environ.get("CURL_CA_BUNDLE") or requests.certs.where()
+
+
+class TransportResponse:
+    def __init__(self, url, status_code, reason, headers, elapsed):
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.elapsed = datetime.timedelta(seconds=elapsed)
+        self._content = None
+
+    @property
+    def content(self):
+        if self._content is None:
+            self._content = b"".join(self.iter_content())
+
+        return self._content
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 500:
+            kind = "Client"
+
+        elif 500 <= self.status_code < 600:
+            kind = "Server"
+
+        else:
+            return
+
+        raise requests.exceptions.HTTPError(
+            f"{self.status_code} {kind} Error: {self.reason} for url: "
+            f"{self.url}", response=self
+        )
+
+
+class Urllib3Response(TransportResponse):
+    def __init__(self, raw, url, elapsed):
+        super().__init__(url, raw.status, raw.reason, raw.headers, elapsed)
+        self.raw = raw
+
+    def iter_content(self, chunk_size=CHUNK_SIZE):
+        try:
+            yield from self.raw.stream(chunk_size, decode_content=True)
+
+        except urllib3.exceptions.ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+
+        except urllib3.exceptions.DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e)
+
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise requests.exceptions.ConnectionError(e)
+
+        except urllib3.exceptions.SSLError as e:
+            raise requests.exceptions.SSLError(e)
+
+    def close(self):
+        self.raw.close()
+        self.raw.release_conn()
+
+
+class Urllib3Transport:
+    def __init__(self, maxsize, ssl_context=None):
+        self.manager = urllib3.PoolManager(
+            maxsize=maxsize,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=ca_bundle(),
+            ssl_context=ssl_context
+        )
+        self.manager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool
+        }
+        self.retries = urllib3.Retry(0, read=False)
+
+    def get(self, url, headers, timeout, stream=False):
+        if isinstance(timeout, tuple):
+            timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+
+        else:
+            timeout = urllib3.Timeout(connect=timeout, read=timeout)
+
+        headers = dict(headers)
+        headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
+        start = time.monotonic()
+        try:
+            raw = self.manager.request(
+                "GET", url, headers=headers, timeout=timeout,
+                retries=self.retries, redirect=False, preload_content=False
+            )
+
+        except urllib3.exceptions.MaxRetryError as e:
+            if isinstance(
+                    e.reason, urllib3.exceptions.ConnectTimeoutError
+            ) and not isinstance(
+                e.reason, urllib3.exceptions.NewConnectionError
+            ):
+                raise requests.exceptions.ConnectTimeout(e)
+
+            if isinstance(e.reason, urllib3.exceptions.SSLError):
+                raise requests.exceptions.SSLError(e)
+
+            raise requests.exceptions.ConnectionError(e)
+
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise requests.exceptions.ReadTimeout(e)
+
+        except urllib3.exceptions.SSLError as e:
+            raise requests.exceptions.SSLError(e)
+
+        except (urllib3.exceptions.ProtocolError, OSError) as e:
+            raise requests.exceptions.ConnectionError(e)
+
+        response = Urllib3Response(raw, url, time.monotonic() - start)
+        if not stream:
+            response.content
+
+        return response
+
+    def connection_pool(self, url):
+        return self.manager.connection_from_url(url)
+
+    def close(self):
+        self.manager.clear()
+
+
+class HTTP2Response(TransportResponse):
+    def __init__(self, response, elapsed):
+        super().__init__(
+            str(response.url), response.status_code, response.reason_phrase,
+            response.headers, elapsed
+        )
+        self.response = response
+        self.http_version = response.http_version
+
+    @property
+    def raw(self):
+        return self
+
+    def tell(self):
+        return self.response.num_bytes_downloaded
+
+    def iter_content(self, chunk_size=CHUNK_SIZE):
+        try:
+            yield from self.response.iter_bytes(chunk_size)
+
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ConnectionError(
+                urllib3.exceptions.ReadTimeoutError(None, self.url, str(e))
+            )
+
+        except httpx.DecodingError as e:
+            raise requests.exceptions.ContentDecodingError(e)
+
+        except httpx.TransportError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+
+    def close(self):
+        self.response.close()
+
+
+class HTTP2Transport:
+    def __init__(self, maxsize, ssl_context=None):
+        global httpx
+        import httpx
+
+        if ssl_context is None:
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+        ssl_context.load_verify_locations(ca_bundle())
+        self.client = httpx.Client(
+            http2=True, verify=ssl_context, trust_env=False,
+            limits=httpx.Limits(max_connections=maxsize)
+        )
+        self.lock = threading.Lock()
+        self.versions = collections.Counter()
+
+    def get(self, url, headers, timeout, stream=False):
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+
+        else:
+            timeout = httpx.Timeout(None, connect=timeout, read=timeout)
+
+        start = time.monotonic()
+        try:
+            response = self.client.send(
+                self.client.build_request(
+                    "GET", url, headers=headers, timeout=timeout
+                ), stream=True
+            )
+
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e)
+
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e)
+
+        except httpx.ConnectError as e:
+            if caused_by(e, ssl.SSLError):
+                raise requests.exceptions.SSLError(e)
+
+            raise requests.exceptions.ConnectionError(e)
+
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e)
+
+        response = HTTP2Response(response, time.monotonic() - start)
+        with self.lock:
+            self.versions[response.http_version] += 1
+
+        if not stream:
+            response.content
+            response.close()
+
+        return response
+
+    def close(self):
+        self.client.close()
+
+
+def settle_connection(sock, timeout):
+    if not isinstance(sock, ssl.SSLSocket):
+        return True
+
+    previous = sock.gettimeout()
+    try:
+        while urllib3.util.wait.wait_for_read(sock, timeout=timeout):
+            sock.settimeout(0)
+            try:
+                sock.recv(1)
+                return False
+
+            except ssl.SSLWantReadError:
+                pass
+
+            finally:
+                sock.settimeout(previous)
+
+    except OSError:
+        return False
+
+    return True
+
+
+def abort_response(response, expired=None):
+    if expired is not None:
+        expired.set()
+
+    try:
+        socket.socket.shutdown(
+            response.raw.connection.sock, socket.SHUT_RDWR
+        )
+
+    except (AttributeError, OSError):
+        pass
+
+
 class WebAPIReports:
     def __init__(self, arguments):
         self.hostname = arguments.hostname
@@ -28,6 +883,163 @@ class WebAPIReports:
         self.day = arguments.day
         self.timeout = arguments.timeout
         self.buffer_time = arguments.buffer_time / 1000.
+        self.decode_workers = arguments.decode_workers
+        self.max_size = arguments.max_size
+        self.connect_timeout = arguments.connect_timeout or self.timeout
+        self.read_timeout = arguments.read_timeout or self.timeout
+        self.download_timeout = arguments.download_timeout
+        self.wire_size = arguments.wire_size
+        self.timing = arguments.timing
+        self.phase_timing = arguments.phase_timing
+        self.stream = bool(
+            self.max_size or self.download_timeout or self.timing or
+            self.phase_timing
+        )
+        self.concurrency = max(1, arguments.concurrency)
+        self.adaptive = arguments.adaptive
+        self.controller = AdaptiveController(
+            self.concurrency, self.adaptive, self.buffer_time, self.timeout
+        )
+        self.hedge_after = None
+        if arguments.hedge_after:
+            if arguments.hedge_after == "p95":
+                self.hedge_after = arguments.hedge_after
+
+            else:
+                try:
+                    self.hedge_after = float(arguments.hedge_after)
+
+                except ValueError:
+                    raise WebAPIReportsException(
+                        f"Invalid hedge delay: {arguments.hedge_after}"
+                    )
+
+        self.hedge_budget = arguments.hedge_budget
+        self.hedge_limit = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.latencies = list()
+        self.lock = threading.Lock()
+        self.timeout_factor = arguments.timeout_factor
+        self.history = None
+        self.history_samples = dict()
+        self.new_samples = dict()
+        self.history_failures = dict()
+        self.history_checks = dict()
+        if arguments.history:
+            try:
+                self.history = LatencyHistory(arguments.history)
+
+            except sqlite3.Error as e:
+                raise WebAPIReportsException(
+                    f"Unable to open latency history {arguments.history}: "
+                    f"{str(e)}"
+                )
+
+        self.order = arguments.order
+        if self.order != "list" and not self.history:
+            raise WebAPIReportsException(
+                f"Ordering of reports by {self.order} requires --history"
+            )
+
+        self.sample = None
+        if arguments.sample:
+            try:
+                if arguments.sample.endswith("%"):
+                    self.sample = (float(arguments.sample[:-1]), True)
+
+                else:
+                    self.sample = (int(arguments.sample), False)
+
+                assert self.sample[0] > 0
+
+            except (ValueError, AssertionError):
+                raise WebAPIReportsException(
+                    f"Invalid sample size: {arguments.sample}"
+                )
+
+            if not self.history:
+                raise WebAPIReportsException(
+                    "Sampling of reports requires --history"
+                )
+
+        self.sampling = None
+        self.preflight = arguments.preflight
+        self.host_error = None
+        self.phases = None
+        self.short_circuit = arguments.short_circuit
+        self.error_classes = dict()
+        self.tenant_errors = dict()
+        self.streaks = dict()
+        self.fair = arguments.fair
+        self.tenant_caps = dict()
+        for value in arguments.tenant_concurrency or list():
+            try:
+                if "=" in value:
+                    tenant, cap = value.split("=", 1)
+                    self.tenant_caps.update({tenant: int(cap)})
+
+                else:
+                    self.tenant_caps.update({None: int(value)})
+
+            except ValueError:
+                raise WebAPIReportsException(
+                    f"Invalid tenant concurrency: {value}"
+                )
+
+            if min(self.tenant_caps.values()) < 0:
+                raise WebAPIReportsException(
+                    f"Invalid tenant concurrency: {value}"
+                )
+
+        self.fail_fast = arguments.fail_fast
+        self.failed = 0
+        self.abandoned = False
+        self.stats = dict()
+        self.warm_up = arguments.warm_up
+        self.tls_context = None
+        if arguments.tls_session_reuse:
+            self.tls_context = TLSSessionContext(ssl.PROTOCOL_TLS_CLIENT)
+
+        maxsize = max(requests.adapters.DEFAULT_POOLSIZE, self.concurrency)
+        self.session = None
+        if arguments.transport == "http2":
+            for package in ("httpx", "h2"):
+                if importlib.util.find_spec(package) is None:
+                    raise WebAPIReportsException(
+                        f"HTTP/2 transport requires {package} package"
+                    )
+
+            if self.phase_timing or self.warm_up or self.download_timeout:
+                raise WebAPIReportsException(
+                    "Phase timing, warm-up and download timeout are not "
+                    "supported with HTTP/2 transport"
+                )
+
+            self.transport = HTTP2Transport(
+                maxsize, ssl_context=self.tls_context
+            )
+
+        elif arguments.transport == "urllib3":
+            self.transport = Urllib3Transport(
+                maxsize, ssl_context=self.tls_context
+            )
+
+        else:
+            if self.phase_timing or self.warm_up or self.tls_context:
+                self.session = requests.Session()
+                for prefix in ["http://", "https://"]:
+                    self.session.mount(prefix, TimedHTTPAdapter(
+                        pool_maxsize=maxsize, ssl_context=self.tls_context
+                    ))
+
+            self.transport = RequestsTransport(self.session)
+
+        if arguments.connect_timeout or arguments.read_timeout:
+            self.request_timeout = (self.connect_timeout, self.read_timeout)
+
+        else:
+            self.request_timeout = self.timeout
 
     @staticmethod
     def _get_tokens(tenant_tokens):
@@ -45,17 +1057,105 @@ class WebAPIReports:
                 "<TENANT_NAME>:<TENANT_TOKEN>"
             )
 
+    def _warm_up(self):
+        url = f"https://{self.hostname}/"
+        start = time.monotonic()
+        pool = self.transport.connection_pool(url)
+
+        try:
+            DNS_CACHE.resolve(pool.host, pool.port)
+
+        except socket.gaierror:
+            pass
+
+        def connect(connection):
+            started = time.monotonic()
+            try:
+                connection.connect()
+                if not settle_connection(
+                        connection.sock,
+                        max(MIN_SETTLE_TIMEOUT, time.monotonic() - started)
+                ):
+                    raise ConnectionResetError()
+
+            except (OSError, urllib3.exceptions.HTTPError):
+                connection.close()
+                pool._put_conn(None)
+                return 0
+
+            pool._put_conn(connection)
+            return 1
+
+        connections = [pool._get_conn() for i in range(self.concurrency)]
+        opened = 0
+        if self.tls_context:
+            opened = connect(connections.pop())
+
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, len(connections))
+        ) as executor:
+            opened += sum(executor.map(connect, connections))
+
+        self.stats.update({
+            "warm_up": f"{time.monotonic() - start:.6f}s",
+            "warm_connections": f"{opened};;;0;{self.concurrency}"
+        })
+
+    def _add_phases(self, phases, dispatched, first_byte):
+        if phases is None:
+            return
+
+        phases.update({
+            "download": time.monotonic() - dispatched - first_byte
+        })
+        if self.phases is None:
+            self.phases = dict.fromkeys(PHASES, 0.)
+
+        for phase in PHASES:
+            self.phases[phase] += phases[phase]
+
+    def _preflight(self):
+        start = time.monotonic()
+        try:
+            response, dispatched, phases = self._get(
+                f"https://{self.hostname}{API_VERSION}", None
+            )
+            self._add_phases(phases, dispatched, time.monotonic() - dispatched)
+            if response.status_code >= 500:
+                response.raise_for_status()
+
+        except (
+            requests.exceptions.RequestException,
+            requests.exceptions.HTTPError,
+            PhaseTimeoutException
+        ) as e:
+            self.host_error = (
+                f"Web-API host {self.hostname} unavailable: {str(e)}"
+            )
+
+        finally:
+            self.stats.update({
+                "preflight": f"{time.monotonic() - start:.6f}s"
+            })
+
     def _get_reports(self):
         reports = dict()
         for tenant, token in self.tenant_tokens.items():
             try:
-                response = requests.get(
-                    f"https://{self.hostname}/api/v2/reports",
-                    headers={"Accept": "application/json", "x-api-key": token},
-                    timeout=self.timeout
+                response, dispatched, phases = self._get(
+                    f"https://{self.hostname}/api/v2/reports", token,
+                    stream=bool(self.download_timeout)
                 )
-                time.sleep(self.buffer_time)
-                response.raise_for_status()
+                first_byte = time.monotonic() - dispatched
+                try:
+                    response.raise_for_status()
+
+                    if self.download_timeout:
+                        self._read_body(response, dispatched)
+
+                finally:
+                    self._add_phases(phases, dispatched, first_byte)
+                    time.sleep(self.buffer_time)
 
                 reports.update({tenant: {
                     "data": [
@@ -63,10 +1163,13 @@ class WebAPIReports:
                         report["disabled"] is False
                     ]
                 }})
+                self._track_error("host")
 
             except (
                 requests.exceptions.RequestException,
-                requests.exceptions.HTTPError
+                requests.exceptions.HTTPError,
+                PhaseTimeoutException,
+                ValueError
             ) as e:
                 reports.update({
                     tenant: {
@@ -74,116 +1177,731 @@ class WebAPIReports:
                                      f"tenant {tenant}: {str(e)}"
                     }
                 })
+                error_class = classify_error(e)
+                failed = self._track_error("host", error_class, str(e))
+                if self.short_circuit and error_class in HOST_ERRORS and \
+                        failed >= self.short_circuit:
+                    self.host_error = (
+                        f"Web-API host {self.hostname} unavailable: "
+                        f"{error_class} error for {failed} tenant(s), "
+                        f"{len(self.tenant_tokens) - len(reports)} not "
+                        f"checked: {str(e)}"
+                    )
+                    break
 
         return reports
 
-    def check(self):
-        reports = self._get_reports()
+    def _get(self, url, token, stream=False, read_timeout=None):
+        headers = {"Accept": "application/json"}
+        if token:
+            headers.update({"x-api-key": token})
 
-        check_results = dict()
-        for tenant, tenants_reports in reports.items():
-            tenant_results = dict()
-            tenant_performance = dict()
-            if self.type == "ar":
-                path = API_RESULTS
+        phases = None
+        if self.phase_timing:
+            phases = {"dns": 0., "connect": 0., "tls": 0., "wait": 0.}
 
-            else:
-                path = API_STATUS
-
-            date_considered = get_today() - datetime.timedelta(days=self.day)
-
-            if "data" in tenants_reports.keys():
-                for report in tenants_reports["data"]:
-                    name = report["info"]["name"]
-                    url = (
-                        f"https://{self.hostname}{path}/{name}/"
-                        f"{report['topology_schema']['group']['group']['type']}"
-                        f"?start_time="
-                        f"{date_considered.strftime('%Y-%m-%dT00:00:00Z')}&"
-                        f"end_time="
-                        f"{date_considered.strftime('%Y-%m-%dT23:59:59Z')}"
+        timeout = self.request_timeout
+        if read_timeout:
+            timeout = (self.connect_timeout, read_timeout)
+
+        else:
+            read_timeout = self.read_timeout
+
+        PHASE_TIMINGS.current = phases
+        dispatched = time.monotonic()
+        try:
+            response = self.transport.get(
+                url, headers=headers, timeout=timeout, stream=stream
+            )
+
+        except requests.exceptions.ConnectTimeout:
+            raise PhaseTimeoutException("connect", self.connect_timeout)
+
+        except requests.exceptions.ReadTimeout:
+            raise PhaseTimeoutException("first byte", read_timeout)
+
+        finally:
+            PHASE_TIMINGS.current = None
+
+        return response, dispatched, phases
+
+    def _report_timeout(self, key):
+        samples = self.history_samples.get(key, list())
+        if len(samples) < MIN_HISTORY_SAMPLES:
+            return None
+
+        return min(
+            self.read_timeout,
+            max(
+                MIN_REPORT_TIMEOUT,
+                self.timeout_factor * percentile(sorted(samples), 99)
+            )
+        )
+
+    def _expected_duration(self, key):
+        samples = self.history_samples.get(key)
+        if not samples:
+            return math.inf
+
+        return percentile(sorted(samples), 50)
+
+    def _sample_jobs(self, jobs):
+        if not self.sample:
+            return jobs
+
+        size, percent = self.sample
+        if percent:
+            size = math.ceil(len(jobs) * size / 100.)
+
+        chosen = set(
+            (tenant, report["info"]["name"])
+            for tenant, report in sorted(
+                jobs,
+                key=lambda job: self.history_checks.get(
+                    (job[0], job[1]["info"]["name"]), -math.inf
+                )
+            )[:max(1, size)]
+        )
+
+        return [
+            job for job in jobs if (job[0], job[1]["info"]["name"]) in chosen
+        ]
+
+    def _update_coverage(self, jobs, checked):
+        now = get_today().timestamp()
+        self.history_checks.update(dict((key, now) for key in checked))
+        keys = [(tenant, report["info"]["name"]) for tenant, report in jobs]
+        covered = [
+            self.history_checks[key] for key in keys
+            if key in self.history_checks
+        ]
+        self.sampling = {
+            "checked": len(checked),
+            "total": len(keys),
+            "coverage": 100. * len(covered) / len(keys) if keys else 100.,
+            "oldest": now - min(covered) if covered else 0.,
+            "never": len(keys) - len(covered)
+        }
+
+    def _order_jobs(self, jobs):
+        if self.order == "failures":
+            return sorted(
+                jobs,
+                key=lambda job: failure_recency(self.history_failures.get(
+                    (job[0], job[1]["info"]["name"]), 0
+                ))
+            )
+
+        if self.order == "longest":
+            return sorted(
+                jobs,
+                key=lambda job: self._expected_duration(
+                    (job[0], job[1]["info"]["name"])
+                ),
+                reverse=True
+            )
+
+        return jobs
+
+    def _record_latency(self, key, latency):
+        if self.history:
+            with self.lock:
+                self.new_samples.setdefault(key, list()).append(latency)
+
+    def _hedge_delay(self, key=None):
+        if self.hedge_after != "p95":
+            return self.hedge_after
+
+        samples = self.history_samples.get(key, list())
+        if len(samples) >= MIN_HISTORY_SAMPLES:
+            return percentile(sorted(samples), 95)
+
+        with self.lock:
+            if len(self.latencies) < MIN_HEDGE_SAMPLES:
+                return None
+
+            return percentile(sorted(self.latencies), 95)
+
+    def _take_hedge(self):
+        with self.lock:
+            if self.hedges >= self.hedge_limit:
+                return False
+
+            self.hedges += 1
+            return True
+
+    def _get_hedged(
+            self, url, token, stream=False, read_timeout=None, key=None
+    ):
+        if not self.hedge_after:
+            return self._get(
+                url, token, stream=stream, read_timeout=read_timeout
+            )
+
+        delay = self._hedge_delay(key)
+        arrivals = queue.Queue()
+
+        def attempt(hedge):
+            try:
+                arrivals.put((hedge, self._get(
+                    url, token, stream=True, read_timeout=read_timeout
+                )))
+
+            except (
+                requests.exceptions.RequestException,
+                PhaseTimeoutException
+            ) as e:
+                arrivals.put((hedge, e))
+
+        started = time.monotonic()
+        threading.Thread(target=attempt, args=(False,), daemon=True).start()
+        pending = 1
+        try:
+            arrival = arrivals.get(timeout=delay)
+
+        except queue.Empty:
+            arrival = None
+            if self._take_hedge():
+                threading.Thread(
+                    target=attempt, args=(True,), daemon=True
+                ).start()
+                pending += 1
+
+        error = None
+        while pending:
+            if arrival is None:
+                arrival = arrivals.get()
+
+            pending -= 1
+            hedge, outcome = arrival
+            arrival = None
+            if isinstance(outcome, Exception):
+                error = error or outcome
+                continue
+
+            if pending:
+                threading.Thread(
+                    target=discard_responses, args=(arrivals, pending),
+                    daemon=True
+                ).start()
+
+            response, dispatched, phases = outcome
+            with self.lock:
+                self.latencies.append(time.monotonic() - started)
+                if hedge:
+                    self.hedge_wins += 1
+
+            if not stream:
+                response.content
+
+            return response, started, phases
+
+        raise error
+
+    def _read_body(self, response, dispatched, max_size=0):
+        expired = threading.Event()
+        watchdog = None
+        if self.download_timeout:
+            remaining = self.download_timeout - (time.monotonic() - dispatched)
+            if remaining <= 0:
+                response.close()
+                raise PhaseTimeoutException("download", self.download_timeout)
+
+            watchdog = threading.Timer(
+                remaining, abort_response, args=(response, expired)
+            )
+            watchdog.daemon = True
+            watchdog.start()
+
+        try:
+            content_length = response.headers.get("Content-Length")
+            if max_size and content_length and int(content_length) > max_size:
+                response.close()
+                raise ResponseTooLargeException(int(content_length))
+
+            content = bytearray()
+            try:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    content.extend(chunk)
+                    if max_size and len(content) > max_size:
+                        response.close()
+                        raise ResponseTooLargeException(len(content))
+
+                    if self.download_timeout and \
+                            time.monotonic() - dispatched > \
+                            self.download_timeout:
+                        expired.set()
+                        response.close()
+                        break
+
+            except (requests.exceptions.RequestException, OSError) as e:
+                if expired.is_set():
+                    raise PhaseTimeoutException(
+                        "download", self.download_timeout
                     )
-                    if self.type == "ar":
-                        url = f"{url}&granularity=daily"
-                        obj = "availability"
 
-                    else:
-                        obj = "status"
+                if e.args and isinstance(
+                        e.args[0], urllib3.exceptions.ReadTimeoutError
+                ):
+                    raise PhaseTimeoutException("body read", self.read_timeout)
+
+                raise
+
+            if expired.is_set():
+                raise PhaseTimeoutException("download", self.download_timeout)
+
+            response._content = bytes(content)
+
+        finally:
+            if watchdog:
+                watchdog.cancel()
+
+    def _check_report(
+            self, tenant, report, path, date_considered, pool, attempt=1
+    ):
+        name = report["info"]["name"]
+        url = (
+            f"https://{self.hostname}{path}/{name}/"
+            f"{report['topology_schema']['group']['group']['type']}"
+            f"?start_time="
+            f"{date_considered.strftime('%Y-%m-%dT00:00:00Z')}&"
+            f"end_time="
+            f"{date_considered.strftime('%Y-%m-%dT23:59:59Z')}"
+        )
+        if self.type == "ar":
+            url = f"{url}&granularity=daily"
+            obj = "availability"
+
+        else:
+            obj = "status"
 
+        key = (tenant, name)
+        read_timeout = self._report_timeout(key)
+        status_code = None
+        try:
+            response, dispatched, phases = self._get_hedged(
+                url, self.tenant_tokens[tenant], stream=self.stream,
+                read_timeout=read_timeout, key=key
+            )
+            status_code = response.status_code
+            first_byte = time.monotonic() - dispatched
+            try:
+                if self.adaptive:
+                    backoff = self.controller.record(
+                        response.elapsed.total_seconds(),
+                        response.status_code,
+                        response.headers.get("Retry-After"), key
+                    )
+                    if backoff and attempt < MAX_ATTEMPTS and \
+                            response.status_code in BACKOFF_STATUS_CODES:
+                        response.close()
+                        return RETRY
+
+                response.raise_for_status()
+
+                performance = {"time": response.elapsed.total_seconds()}
+                self._record_latency(key, performance["time"])
+
+                if self.stream:
                     try:
-                        response = requests.get(
-                            url,
-                            headers={
-                                "Accept": "application/json",
-                                "x-api-key": self.tenant_tokens[tenant]
-                            },
-                            timeout=self.timeout
+                        self._read_body(response, dispatched, self.max_size)
+
+                    except ResponseTooLargeException as e:
+                        return (
+                            f"CRITICAL - Response for report {name} exceeds "
+                            f"maximum size of {self.max_size} B",
+                            {"time": performance["time"], "size": e.size}
                         )
-                        time.sleep(self.buffer_time)
 
-                        response.raise_for_status()
+                if self.wire_size:
+                    performance.update({"wire_size": response.raw.tell()})
+
+                if self.timing or self.phase_timing:
+                    total = time.monotonic() - dispatched
+
+                if self.timing:
+                    transferred = performance.get(
+                        "wire_size", len(response.content)
+                    )
+                    throughput = 0.
+                    if total > first_byte:
+                        throughput = transferred / (total - first_byte)
+
+                    performance.update({
+                        "time": total,
+                        "ttfb": first_byte,
+                        "throughput": throughput
+                    })
+
+                if self.phase_timing:
+                    phases.update({"download": total - first_byte})
+                    performance.update({"phases": phases})
+
+            finally:
+                time.sleep(self.controller.delay)
+
+            if pool:
+                try:
+                    return pool.submit(
+                        decode_and_validate, self.type, name,
+                        response.content, performance
+                    )
+
+                except concurrent.futures.BrokenExecutor as e:
+                    return f"CRITICAL - Decode worker failed: {str(e)}", None
+
+            try:
+                results = response.json()
+
+            except ValueError:
+                return JSON_DECODE_ERROR, None
+
+            performance.update({"size": len(response.content)})
+
+            return validate_results(self.type, name, results), performance
+
+        except (
+                requests.exceptions.RequestException,
+                requests.exceptions.HTTPError,
+                PhaseTimeoutException
+        ) as e:
+            if self.adaptive and isinstance(e, (
+                    requests.exceptions.Timeout, PhaseTimeoutException
+            )):
+                self.controller.backoff()
+
+            if isinstance(e, PhaseTimeoutException) and \
+                    e.phase == "first byte":
+                self._record_latency(key, e.timeout)
+
+            self.error_classes.update({
+                key: (classify_error(e, status_code), str(e))
+            })
+
+            return (
+                f"CRITICAL - Unable to retrieve {obj} for report {name}: "
+                f"{str(e)}",
+                None
+            )
+
+    def _track_error(self, scope, error_class=None, message=None):
+        with self.lock:
+            if error_class is None:
+                self.streaks.pop(scope, None)
+                return 0
+
+            streak = self.streaks.get(scope)
+            if streak and streak[0] == error_class:
+                streak[1] += 1
 
-                        try:
-                            results = response.json()
-                        except ValueError as e:
-                            tenant_results.update({
-                                name: f"CRITICAL - JSON decode error"
-                            })
+            else:
+                streak = [error_class, 1, message]
+                self.streaks.update({scope: streak})
+
+            return streak[1]
+
+    def _short_circuit(self, key, outcome, pending):
+        tenant = key[0]
+        if key not in self.error_classes:
+            verdict, performance = decoded_outcome(outcome)
+            error_class = classify_verdict(self.type, key[1], verdict)
+            if error_class is None:
+                if verdict == "OK":
+                    self._track_error("host")
+                    self._track_error(tenant)
+
+                return False
+
+            self.error_classes.update({
+                key: (error_class, verdict.split(" - ", 1)[1])
+            })
+
+        error_class, message = self.error_classes[key]
+        failed_host = self._track_error("host", error_class, message)
+        failed_tenant = self._track_error(tenant, error_class, message)
+        if error_class in HOST_ERRORS and failed_host >= self.short_circuit:
+            self.host_error = (
+                f"Web-API host {self.hostname} unavailable: {error_class} "
+                f"error for {failed_host} report(s), {len(pending)} not "
+                f"checked: {self.streaks['host'][2]}"
+            )
+            return True
+
+        if error_class in TENANT_ERRORS and \
+                failed_tenant >= self.short_circuit:
+            skipped = pending.drop(tenant)
+            self.tenant_errors.update({
+                tenant: f"CRITICAL - {error_class} error for {failed_tenant} "
+                        f"report(s) of tenant {tenant}, {skipped} not "
+                        f"checked: {self.streaks[tenant][2]}"
+            })
+
+        return False
+
+    def _count_failure(self, outcome):
+        if isinstance(outcome, concurrent.futures.Future):
+            outcome.add_done_callback(
+                lambda future: self._count_failure(decoded_outcome(future))
+            )
+            return
+
+        verdict, performance = outcome
+        if verdict and verdict.startswith("CRITICAL"):
+            with self.lock:
+                self.failed += 1
+
+    def _dispatch(self, jobs, path, date_considered, pool):
+        outcomes = dict()
+        pending = ReportQueue(
+            jobs, fair=self.fair, caps=self.tenant_caps,
+            clock=time.monotonic if self.fair or self.tenant_caps else None
+        )
+        running = dict()
+        if self.hedge_after:
+            self.hedge_limit = max(
+                1, math.floor(len(jobs) * self.hedge_budget / 100.)
+            )
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.concurrency
+        )
+        stopped = False
+        try:
+            while pending or running:
+                if stopped or (
+                        self.fail_fast and self.failed >= self.fail_fast
+                ):
+                    stopped = True
+                    self.stats.update({
+                        "unchecked": f"{len(jobs) - len(outcomes)}"
+                    })
+                    break
+
+                while pending and len(running) < self.controller.limit:
+                    pause = self.controller.pause()
+                    if pause > 0:
+                        if running:
+                            break
+
+                        time.sleep(pause)
+
+                    item = pending.get()
+                    if item is None:
+                        break
+
+                    (tenant, report), attempt = item
+                    running.update({
+                        executor.submit(
+                            self._check_report, tenant, report, path,
+                            date_considered, pool, attempt
+                        ): ((tenant, report), attempt)
+                    })
+
+                if not running:
+                    self.stats.update({
+                        "unchecked": f"{len(jobs) - len(outcomes)}"
+                    })
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    (tenant, report), attempt = running.pop(future)
+                    pending.done(tenant)
+                    outcome = future.result()
+                    if outcome is RETRY:
+                        pending.put((tenant, report), attempt + 1)
+
+                    else:
+                        key = (tenant, report["info"]["name"])
+                        outcomes.update({key: outcome})
+                        if self.fail_fast:
+                            self._count_failure(outcome)
+
+                        if self.short_circuit and self._short_circuit(
+                                key, outcome, pending
+                        ):
+                            stopped = True
+
+        finally:
+            self.abandoned = stopped and bool(running)
+            executor.shutdown(wait=not stopped, cancel_futures=True)
+
+        if self.adaptive:
+            self.stats.update({
+                "concurrency":
+                    f"{self.controller.peak};;;1;{self.concurrency}",
+                "backoffs": f"{self.controller.backoffs}c"
+            })
+
+        for tenant, waits in pending.waits.items():
+            self.stats.update({
+                f"{tenant}::wait": f"{sum(waits) / len(waits):.6f}s",
+                f"{tenant}::wait_max": f"{max(waits):.6f}s"
+            })
+
+        if self.hedge_after:
+            self.stats.update({
+                "hedges": f"{self.hedges};;;0;{self.hedge_limit}",
+                "hedge_wins": f"{self.hedge_wins}c"
+            })
+
+        return outcomes
+
+    def check(self):
+        if self.type == "ar":
+            path = API_RESULTS
+
+        else:
+            path = API_STATUS
+
+        date_considered = get_today() - datetime.timedelta(days=self.day)
+
+        pool = None
+        if self.decode_workers > 0:
+            import multiprocessing
+            pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.decode_workers,
+                mp_context=multiprocessing.get_context("forkserver")
+            )
+
+        try:
+            if self.history:
+                try:
+                    self.history_samples = self.history.load(
+                        self.hostname, self.type
+                    )
+                    self.history_failures = self.history.load_failures(
+                        self.hostname, self.type
+                    )
+                    self.history_checks = self.history.load_checks(
+                        self.hostname, self.type
+                    )
+
+                except sqlite3.Error as e:
+                    raise WebAPIReportsException(
+                        f"Unable to read latency history: {str(e)}"
+                    )
+
+                self.controller.baselines.update(
+                    (key, percentile(sorted(samples), 50))
+                    for key, samples in self.history_samples.items()
+                    if samples
+                )
+
+            if self.preflight:
+                self._preflight()
+                if self.host_error:
+                    return dict()
+
+            if self.warm_up:
+                self._warm_up()
+
+            reports = self._get_reports()
+            if self.host_error:
+                return dict()
+
+            jobs = [
+                (tenant, report)
+                for tenant, tenants_reports in reports.items()
+                for report in tenants_reports.get("data", list())
+            ]
+            outcomes = self._dispatch(
+                self._order_jobs(self._sample_jobs(jobs)),
+                path, date_considered, pool
+            )
+
+            check_results = dict()
+            failures = dict()
+            for tenant, tenants_reports in reports.items():
+                if "data" in tenants_reports.keys():
+                    tenant_results = dict()
+                    tenant_performance = dict()
+                    for report in tenants_reports["data"]:
+                        name = report["info"]["name"]
+                        if (tenant, name) not in outcomes:
                             continue
-                            
-                        response_time = response.elapsed.total_seconds()
-                        response_size = len(response.content)
-
-                        tenant_performance.update({
-                            name: {
-                                "time": response_time,
-                                "size": response_size
-                            }
-                        })
 
-                        if results:
-                            try:
-                                if self.type == "ar":
-                                    obj = "availability"
-                                    assert results["results"][0][
-                                        "endpoints"
-                                    ][0]["results"][0]["availability"]
-
-                                else:
-                                    assert results["groups"][0]["statuses"]
-
-                                tenant_results.update({name: "OK"})
-
-                            except (KeyError, AssertionError, TypeError):
-                                tenant_results.update({
-                                    name:
-                                        f"CRITICAL - Unable to retrieve {obj} "
-                                        f"from report {name}"
-                                })
-
-                    except (
-                            requests.exceptions.RequestException,
-                            requests.exceptions.HTTPError
-                    ) as e:
-                        tenant_results.update({
-                            name: f"CRITICAL - Unable to retrieve {obj} for "
-                                  f"report {name}: {str(e)}"
+                        verdict, performance = decoded_outcome(
+                            outcomes[(tenant, name)]
+                        )
+                        failures.update({
+                            (tenant, name):
+                                verdict is not None and verdict != "OK"
                         })
+                        if performance is not None:
+                            tenant_performance.update({name: performance})
+
+                        if verdict is not None:
+                            tenant_results.update({name: verdict})
+
+                    check_results.update({
+                        tenant: {
+                            "results": tenant_results,
+                            "performance": tenant_performance
+                        }
+                    })
+
+                if tenant in self.tenant_errors:
+                    check_results.update({
+                        tenant: {
+                            "REPORTS_EXCEPTION": self.tenant_errors[tenant]
+                        }
+                    })
+
+                if "exception" in tenants_reports.keys():
+                    check_results.update({
+                        tenant: {
+                            "REPORTS_EXCEPTION": tenants_reports["exception"]
+                        }
+                    })
+
+            if self.sample:
+                self._update_coverage(jobs, list(outcomes.keys()))
+
+            if self.history:
+                try:
+                    self.history.record(
+                        self.hostname, self.type, self.new_samples
+                    )
+                    self.history.record_failures(
+                        self.hostname, self.type, failures
+                    )
+                    if self.sample:
+                        self.history.record_checks(
+                            self.hostname, self.type, list(outcomes.keys()),
+                            get_today().timestamp()
+                        )
 
-                check_results.update({
-                    tenant: {
-                        "results": tenant_results,
-                        "performance": tenant_performance
-                    }
+                except sqlite3.Error as e:
+                    raise WebAPIReportsException(
+                        f"Unable to write latency history: {str(e)}"
+                    )
+
+        finally:
+            if pool:
+                pool.shutdown()
+
+            self.transport.close()
+            if isinstance(self.transport, HTTP2Transport):
+                self.stats.update({
+                    "http2_responses":
+                        f"{self.transport.versions['HTTP/2']}c",
+                    "http1_responses":
+                        f"{self.transport.versions['HTTP/1.1']}c"
                 })
 
-            if "exception" in tenants_reports.keys():
-                check_results.update({
-                    tenant: {
-                        "REPORTS_EXCEPTION": tenants_reports["exception"]
-                    }
+            if self.tls_context:
+                self.stats.update({
+                    "tls_full": f"{self.tls_context.handshakes['full']}c",
+                    "tls_resumed":
+                        f"{self.tls_context.handshakes['resumed']}c"
                 })
 
+            if self.history:
+                self.history.close()
+
         return check_results
 
 
@@ -193,12 +1911,86 @@ class Status:
     CRITICAL = 2
     UNKNOWN = 3
 
-    def __init__(self, rtype, data, verbosity):
+    def __init__(
+            self, rtype, data, verbosity, max_size=None, perfdata="basic",
+            warning=None, critical=None, stats=None, sampling=None,
+            host_error=None, phases=None
+    ):
         if rtype == "ar":
             rtype = "AR"
         self.rtype = rtype
         self.data = data
         self.verbosity = verbosity
+        self.max_size = max_size
+        self.perfdata = perfdata
+        self.stats = stats if stats else dict()
+        self.sampling = sampling
+        self.host_error = host_error
+        self.phases = phases
+        self.thresholds = {
+            "warning": parse_thresholds(warning),
+            "critical": parse_thresholds(critical)
+        }
+        if perfdata == "basic" and (
+                {"p95", "bytes"} & set(self.thresholds["warning"]) or
+                {"p95", "bytes"} & set(self.thresholds["critical"])
+        ):
+            self.perfdata = "summary"
+
+        self._info = None
+
+    def _threshold_fields(self, metric):
+        if not (metric in self.thresholds["warning"] or
+                metric in self.thresholds["critical"]):
+            return ""
+
+        warning = self.thresholds["warning"].get(metric, "")
+        critical = self.thresholds["critical"].get(metric, "")
+
+        return f";{warning};{critical}"
+
+    def _check_thresholds(self, measurements, aggregates):
+        code = self.OK
+        problems = list()
+        for metric in THRESHOLD_METRICS:
+            alerted = set()
+            for kind, kind_code in [
+                ("critical", self.CRITICAL), ("warning", self.WARNING)
+            ]:
+                if metric not in self.thresholds[kind]:
+                    continue
+
+                threshold = self.thresholds[kind][metric]
+                if metric in aggregates:
+                    if threshold.alert(aggregates[metric]):
+                        code = max(code, kind_code)
+                        problems.append(
+                            f"{metric} {aggregates[metric]}"
+                            f"{'s' if metric == 'p95' else 'B'} outside "
+                            f"{kind} range {threshold}"
+                        )
+                        break
+
+                else:
+                    reports = list()
+                    for tenant, report, perf_data in measurements:
+                        if (tenant, report) not in alerted and \
+                                threshold.alert(perf_data[metric]):
+                            alerted.add((tenant, report))
+                            if self._number_of_tenants() == 1:
+                                reports.append(report)
+
+                            else:
+                                reports.append(f"{report} ({tenant})")
+
+                    if reports:
+                        code = max(code, kind_code)
+                        problems.append(
+                            f"{metric} outside {kind} range {threshold} "
+                            f"for report(s) {', '.join(reports)}"
+                        )
+
+        return code, problems
 
     def _capitalize_rtype(self):
         if self.rtype != "AR":
@@ -207,14 +1999,78 @@ class Status:
         else:
             return self.rtype
 
+    @staticmethod
+    def _report_details(data, report):
+        perf_data = data.get("performance", dict()).get(report, dict())
+        details = list()
+        if "ttfb" in perf_data:
+            details.append(
+                f"{perf_data['time']:.6f} s total, "
+                f"{perf_data['ttfb']:.6f} s to first byte, "
+                f"{round(perf_data['throughput'])} B/s"
+            )
+
+        if "phases" in perf_data:
+            details.append(", ".join([
+                f"{phase} {perf_data['phases'][phase]:.6f} s"
+                for phase in PHASES
+            ]))
+
+        if "wire_size" in perf_data:
+            details.append(
+                f"{perf_data['wire_size']} B on wire, "
+                f"{perf_data['size']} B decoded"
+            )
+
+        if details:
+            return f" ({', '.join(details)})"
+
+        else:
+            return ""
+
+    def _aggregate_labels(self, prefix, latencies, size):
+        latencies = sorted(latencies)
+        bytes_fields = ""
+        p95_fields = ""
+        if not prefix:
+            bytes_fields = self._threshold_fields("bytes")
+            p95_fields = self._threshold_fields("p95")
+
+        return [
+            f"{perfdata_label(f'{prefix}reports')}={len(latencies)}",
+            f"{perfdata_label(f'{prefix}bytes')}={size}B{bytes_fields}",
+            f"{perfdata_label(f'{prefix}p50')}="
+            f"{percentile(latencies, 50):.6f}s",
+            f"{perfdata_label(f'{prefix}p95')}="
+            f"{percentile(latencies, 95):.6f}s{p95_fields}",
+            f"{perfdata_label(f'{prefix}max')}="
+            f"{percentile(latencies, 100):.6f}s"
+        ]
+
     def _number_of_tenants(self):
         return len(self.data.keys())
 
     def _get_info(self):
+        if self._info is not None:
+            return self._info
+
         report_errors = dict()
         tenants_with_errors = list()
         time = 0
         size = 0
+        largest = 0
+        wire_size = None
+        decoded_size = 0
+        ttfb = None
+        transferred = 0
+        download_time = 0
+        phases = None
+        if self.phases is not None:
+            phases = dict(self.phases)
+
+        tenant_latencies = dict()
+        tenant_sizes = dict()
+        measurements = list()
         for tenant, data in self.data.items():
             report_with_error = list()
             for key, value in data.items():
@@ -229,33 +2085,168 @@ class Status:
                                 report_with_error.append(report)
 
                     else:
+                        tenant_latencies.update({tenant: list()})
+                        tenant_sizes.update({tenant: 0})
                         for report, perf_data in value.items():
+                            measurements.append((tenant, report, perf_data))
+                            tenant_latencies[tenant].append(perf_data["time"])
+                            tenant_sizes[tenant] += perf_data["size"]
+
                             if perf_data["time"] > time:
                                 time = perf_data["time"]
                                 size = perf_data["size"]
 
+                            largest = max(largest, perf_data["size"])
+
+                            if "wire_size" in perf_data:
+                                wire_size = (wire_size or 0) + \
+                                    perf_data["wire_size"]
+                                decoded_size += perf_data["size"]
+
+                            if "ttfb" in perf_data:
+                                ttfb = max(ttfb or 0, perf_data["ttfb"])
+                                transferred += perf_data.get(
+                                    "wire_size", perf_data["size"]
+                                )
+                                download_time += \
+                                    perf_data["time"] - perf_data["ttfb"]
+
+                            if "phases" in perf_data:
+                                if phases is None:
+                                    phases = dict.fromkeys(PHASES, 0)
+
+                                for phase in PHASES:
+                                    phases[phase] += perf_data["phases"][phase]
+
             if len(report_with_error) > 0:
                 report_errors.update({tenant: report_with_error})
 
+        latencies = sorted([
+            t for tenant_times in tenant_latencies.values()
+            for t in tenant_times
+        ])
+        threshold_state = self._check_thresholds(
+            measurements, {
+                "p95": round(percentile(latencies, 95), 6),
+                "bytes": sum(tenant_sizes.values())
+            }
+        )
+
+        labels = list()
+        if self.thresholds["warning"] or self.thresholds["critical"]:
+            if time != 0 and size != 0:
+                labels.append(
+                    f"time={time:.6f}s{self._threshold_fields('time')}"
+                )
+                labels.append(
+                    f"size={largest}B{self._threshold_fields('size')}"
+                )
+
+        elif time != 0 and size != 0:
+            labels.append(f"time={time:.6f}s;size={size}B")
+
+        if self.max_size:
+            labels.append(f"max_body={largest}B;;{self.max_size}")
+
+        if wire_size is not None:
+            labels.append(f"wire_size={wire_size}B")
+            labels.append(f"decoded_size={decoded_size}B")
+
+        if ttfb is not None:
+            throughput = 0
+            if download_time > 0:
+                throughput = round(transferred / download_time)
+
+            labels.append(f"ttfb={ttfb:.6f}s")
+            labels.append(f"throughput={throughput}")
+
+        if phases is not None:
+            for phase in PHASES:
+                labels.append(f"{phase}={phases[phase]:.6f}s")
+
+        if self.perfdata != "basic":
+            labels.extend(self._aggregate_labels(
+                "", latencies, sum(tenant_sizes.values())
+            ))
+
+        if self.perfdata in ("tenant", "report"):
+            for tenant, latencies in tenant_latencies.items():
+                labels.extend(self._aggregate_labels(
+                    f"{tenant}::", latencies, tenant_sizes[tenant]
+                ))
+
+        if self.perfdata == "report":
+            for tenant, data in self.data.items():
+                for report, perf_data in data.get(
+                        "performance", dict()
+                ).items():
+                    labels.append(
+                        f"{perfdata_label(f'{tenant}::{report}::time')}="
+                        f"{perf_data['time']:.6f}s"
+                    )
+                    labels.append(
+                        f"{perfdata_label(f'{tenant}::{report}::size')}="
+                        f"{perf_data['size']}B"
+                    )
+
+        if self.sampling:
+            labels.append(
+                f"coverage={math.floor(self.sampling['coverage'])}%;;;0;100"
+            )
+            labels.append(f"oldest_check={round(self.sampling['oldest'])}s")
+            labels.append(f"never_checked={self.sampling['never']}")
+
+        for label, value in self.stats.items():
+            labels.append(f"{perfdata_label(label)}={value}")
+
         performance_data = ""
-        if time != 0 and size != 0:
-            performance_data = f"|time={round(time, 6)}s;size={size}B"
+        if labels:
+            performance_data = f"|{' '.join(labels)}"
+
+        self._info = (
+            report_errors, tenants_with_errors, performance_data,
+            threshold_state
+        )
 
-        return report_errors, tenants_with_errors, performance_data
+        return self._info
 
     def get_message(self):
-        reports_errors, tenants_errors, perf_data = self._get_info()
+        reports_errors, tenants_errors, perf_data, threshold_state = \
+            self._get_info()
+        if self.host_error:
+            return f"CRITICAL - {self.host_error}{perf_data}"
+
+        code, problems = threshold_state
+        threshold_problems = ""
+        if problems:
+            threshold_problems = f"; {'; '.join(problems)}"
+
+        coverage = ""
+        if self.sampling:
+            oldest = f"oldest check {round(self.sampling['oldest'])} s ago"
+            if self.sampling["never"]:
+                oldest = f"{self.sampling['never']} never checked"
+
+            coverage = (
+                f"; checked {self.sampling['checked']} of "
+                f"{self.sampling['total']} reports, coverage "
+                f"{math.floor(self.sampling['coverage'])}%, {oldest}"
+            )
+
         if not (reports_errors or tenants_errors):
+            state = ["OK", "WARNING", "CRITICAL"][code]
             if self._number_of_tenants() == 1:
                 first_line = (
-                    f"OK - {self._capitalize_rtype()} results available for "
-                    f"all reports{perf_data}"
+                    f"{state} - {self._capitalize_rtype()} results available "
+                    f"for all reports{threshold_problems}{coverage}"
+                    f"{perf_data}"
                 )
 
             else:
                 first_line = (
-                    f"OK - {self._capitalize_rtype()} results available for "
-                    f"all tenants and reports{perf_data}"
+                    f"{state} - {self._capitalize_rtype()} results available "
+                    f"for all tenants and reports{threshold_problems}"
+                    f"{coverage}{perf_data}"
                 )
 
         else:
@@ -291,7 +2282,9 @@ class Status:
                                   f"for tenant(s) {', '.join(tenants_errors)}")
 
             first_line = first_line.strip(";")
-            first_line = f"{first_line}{perf_data}"
+            first_line = (
+                f"{first_line}{threshold_problems}{coverage}{perf_data}"
+            )
 
         if self.verbosity == 0:
             return first_line
@@ -299,6 +2292,9 @@ class Status:
         else:
             multiline = [first_line]
             for tenant, data in self.data.items():
+                if not (data.get("results") or "REPORTS_EXCEPTION" in data):
+                    continue
+
                 if self._number_of_tenants() > 1:
                     multiline.append(f"{tenant}:")
 
@@ -311,6 +2307,7 @@ class Status:
                             multiline.append(
                                 f"{self._capitalize_rtype()} for report "
                                 f"{report} - {status}"
+                                f"{self._report_details(data, report)}"
                             )
 
                     else:
@@ -321,9 +2318,10 @@ class Status:
             return "\n".join(multiline).strip()
 
     def get_code(self):
-        reports_errors, tenant_errors, perf_data = self._get_info()
-        if reports_errors or tenant_errors:
+        reports_errors, tenant_errors, perf_data, threshold_state = \
+            self._get_info()
+        if self.host_error or reports_errors or tenant_errors:
             return self.CRITICAL
 
         else:
-            return self.OK
+            return threshold_state[0]
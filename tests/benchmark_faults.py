@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import statistics
+
+from benchmark_probe import run_probe
+from mock_webapi import MockWebAPI, synthetic_tenants, load_scenarios
+
+SCENARIOS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fault_scenarios.json"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the probe against a local mock Web-API under each "
+                    "fault scenario from a scenario file, and report how "
+                    "long it takes to reach a verdict; arguments after -- "
+                    "are passed to the probe"
+    )
+    parser.add_argument(
+        "--scenarios", default=SCENARIOS,
+        help=f"JSON scenario file (default: {SCENARIOS})"
+    )
+    parser.add_argument(
+        "--only", action="append",
+        help="run only the named scenario; can be given multiple times"
+    )
+    parser.add_argument("--tenants", type=int, default=2)
+    parser.add_argument("--reports", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("probe_arguments", nargs="*")
+    arguments = parser.parse_args()
+
+    probe_arguments = arguments.probe_arguments
+    if not any(argument == "--rtype" for argument in probe_arguments):
+        probe_arguments = ["--rtype", "status"] + probe_arguments
+
+    scenarios = [
+        scenario for scenario in load_scenarios(arguments.scenarios)
+        if not arguments.only or scenario.name in arguments.only
+    ]
+    webapi = MockWebAPI(
+        synthetic_tenants(arguments.tenants, arguments.reports),
+        seed=arguments.seed
+    )
+    webapi.start()
+    results = list()
+    try:
+        for scenario in scenarios:
+            webapi.scenario = scenario
+            runs = list()
+            for i in range(arguments.runs):
+                scenario.reset()
+                runs.append(run_probe(webapi, probe_arguments))
+
+            results.append((scenario.name, runs))
+
+    finally:
+        webapi.stop()
+
+    print(
+        f"{arguments.tenants} tenant(s) x {arguments.reports} reports, "
+        f"probe arguments: {' '.join(probe_arguments)}, "
+        f"median of {arguments.runs} run(s)"
+    )
+    print(f"{'scenario':<20}  verdict s   CPU s  status")
+    for name, runs in results:
+        wall = statistics.median(run["wall"] for run in runs)
+        cpu = statistics.median(run["cpu"] for run in runs)
+        print(f"{name:<20}  {wall:9.3f}  {cpu:6.3f}  {runs[-1]['status']}")
+
+
+if __name__ == "__main__":
+    main()
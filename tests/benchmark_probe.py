@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from mock_webapi import MockWebAPI, synthetic_tenants, latency_distribution
+from synthetic_payloads import PayloadGenerator
+
+PROBE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src", "web-api"
+)
+
+
+def run_probe(webapi, probe_arguments):
+    command = [
+        sys.executable, PROBE, "-H", webapi.hostname, "-t", "60", "-b", "0"
+    ] + probe_arguments
+    for tenant, value in webapi.tenants.items():
+        command.extend(["-k", f"{tenant}:{value['token']}"])
+
+    env = dict(os.environ)
+    env.update({
+        "PYTHONPATH": os.path.dirname(os.path.abspath(__file__)),
+        "REQUESTS_CA_BUNDLE": webapi.ca_file
+    })
+    requests = webapi.requests
+    with tempfile.TemporaryFile() as output:
+        start = time.monotonic()
+        process = subprocess.Popen(
+            command, env=env, stdout=output, stderr=subprocess.STDOUT
+        )
+        pid, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.monotonic() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        output.seek(0)
+        message = output.read().decode()
+
+    if process.returncode not in (0, 1, 2, 3):
+        raise RuntimeError(message)
+
+    return {
+        "wall": elapsed,
+        "rps": (webapi.requests - requests) / elapsed,
+        "cpu": usage.ru_utime + usage.ru_stime,
+        "rss": usage.ru_maxrss / 1024.,
+        "status": message.split(" - ")[0]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the probe against a local mock Web-API serving "
+                    "synthetic tenants, and report wall time, requests per "
+                    "second, CPU time and peak RSS of the probe process; "
+                    "arguments after -- are passed to the probe"
+    )
+    parser.add_argument("--tenants", type=int, default=2)
+    parser.add_argument("--reports", type=int, default=20)
+    parser.add_argument(
+        "--payload-size", type=int, default=0,
+        help="approximate size of each report result in bytes"
+    )
+    parser.add_argument(
+        "--latency", type=latency_distribution, default="constant:0",
+        help="latency of report results, as constant:SECONDS, "
+             "uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA"
+    )
+    parser.add_argument(
+        "--groups", type=int, default=0,
+        help="serve generated results with this many groups per report "
+             "instead of padded ones"
+    )
+    parser.add_argument(
+        "--endpoints", type=int, default=20,
+        help="endpoints per group of generated results (default: 20)"
+    )
+    parser.add_argument(
+        "--days", type=int, default=1,
+        help="days per generated AR result (default: 1)"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--http2", action="store_true")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("probe_arguments", nargs="*")
+    arguments = parser.parse_args()
+
+    probe_arguments = arguments.probe_arguments
+    if not any(argument == "--rtype" for argument in probe_arguments):
+        probe_arguments = ["--rtype", "status"] + probe_arguments
+
+    generator = None
+    if arguments.groups:
+        generator = PayloadGenerator(
+            seed=arguments.seed, groups=arguments.groups,
+            endpoints=arguments.endpoints, days=arguments.days
+        )
+
+    webapi = MockWebAPI(
+        synthetic_tenants(arguments.tenants, arguments.reports),
+        latency=arguments.latency, error_rate=arguments.error_rate,
+        payload_size=arguments.payload_size, seed=arguments.seed,
+        http2=arguments.http2, generator=generator
+    )
+    webapi.start()
+    try:
+        runs = [
+            run_probe(webapi, probe_arguments)
+            for i in range(arguments.runs)
+        ]
+
+    finally:
+        webapi.stop()
+
+    print(
+        f"{arguments.tenants} tenant(s) x {arguments.reports} reports, "
+        f"probe arguments: {' '.join(probe_arguments)}"
+    )
+    print(" run    wall s     req/s     CPU s   RSS MiB  status")
+    for i, run in enumerate(runs):
+        print(
+            f"{i + 1:4d}  {run['wall']:8.3f}  {run['rps']:8.1f}  "
+            f"{run['cpu']:8.3f}  {run['rss']:8.1f}  {run['status']}"
+        )
+
+    print(
+        f"  md  {statistics.median(run['wall'] for run in runs):8.3f}  "
+        f"{statistics.median(run['rps'] for run in runs):8.1f}  "
+        f"{statistics.median(run['cpu'] for run in runs):8.3f}  "
+        f"{statistics.median(run['rss'] for run in runs):8.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
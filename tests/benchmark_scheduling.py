@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from mock_webapi import MockWebAPI
+
+PROBE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src", "web-api"
+)
+
+
+def run_probe(webapi, history, order, concurrency):
+    command = [
+        sys.executable, PROBE, "-H", webapi.hostname, "-t", "30",
+        "--rtype", "status", "-b", "0", "--concurrency", str(concurrency),
+        "--history", history, "--order", order
+    ]
+    for tenant, value in webapi.tenants.items():
+        command.extend(["-k", f"{tenant}:{value['token']}"])
+
+    env = dict(os.environ)
+    env.update({
+        "PYTHONPATH": os.path.dirname(os.path.abspath(__file__)),
+        "REQUESTS_CA_BUNDLE": webapi.ca_file
+    })
+    start = time.monotonic()
+    output = subprocess.run(
+        command, env=env, capture_output=True, text=True
+    )
+    elapsed = time.monotonic() - start
+    if output.returncode != 0:
+        raise RuntimeError(output.stdout + output.stderr)
+
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare makespan of a probe run with reports checked "
+                    "in list order and longest first against a local mock "
+                    "Web-API"
+    )
+    parser.add_argument("--reports", type=int, default=24)
+    parser.add_argument("--slow", type=int, default=2)
+    parser.add_argument("--fast-delay", type=float, default=0.1)
+    parser.add_argument("--slow-delay", type=float, default=1.5)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=3)
+    arguments = parser.parse_args()
+
+    names = [f"REPORT{i + 1}" for i in range(arguments.reports)]
+    tenants = {
+        "TENANT1": {"token": "tenant1-token", "reports": names[::2]},
+        "TENANT2": {"token": "tenant2-token", "reports": names[1::2]}
+    }
+    delays = dict()
+    for tenant, value in tenants.items():
+        for name in value["reports"]:
+            delays.update({(tenant, name): arguments.fast_delay})
+
+    tenant_reports = [
+        (tenant, name) for tenant, value in tenants.items()
+        for name in value["reports"]
+    ]
+    for key in tenant_reports[-arguments.slow:]:
+        delays.update({key: arguments.slow_delay})
+
+    webapi = MockWebAPI(tenants, delays)
+    webapi.start()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            history = os.path.join(directory, "history.db")
+            run_probe(webapi, history, "list", arguments.concurrency)
+            results = dict()
+            for order in ["list", "longest"]:
+                results.update({order: [
+                    run_probe(webapi, history, order, arguments.concurrency)
+                    for i in range(arguments.runs)
+                ]})
+
+    finally:
+        webapi.stop()
+
+    print(
+        f"{arguments.reports} reports ({arguments.slow} slow), "
+        f"concurrency {arguments.concurrency}, "
+        f"median of {arguments.runs} runs"
+    )
+    for order, times in results.items():
+        print(f"{order:>8}: {statistics.median(times):.3f} s")
+
+    speedup = statistics.median(results["list"]) / \
+        statistics.median(results["longest"])
+    print(f" speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import argparse
+import collections
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROBE = os.path.join(ROOT, "src", "web-api")
+
+SCENARIOS = {
+    "help": [PROBE, "--help"],
+    "probe": ["-c", "import argo_probe_webapi.web_api"]
+}
+
+
+def import_times(command):
+    env = dict(os.environ)
+    env.update({"PYTHONPATH": os.path.dirname(os.path.abspath(__file__))})
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime"] + command, env=env,
+        capture_output=True, text=True
+    )
+    times = dict()
+    for line in output.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith(" ") and not name.startswith("  "):
+            times.update({name.strip(): int(cumulative) / 1000.})
+
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure import time of the probe with python -X "
+                    "importtime, and fail if it exceeds the given limit"
+    )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument(
+        "--max-help", type=float, default=0.,
+        help="maximum import time in ms for --help (default: no limit)"
+    )
+    parser.add_argument(
+        "--max-probe", type=float, default=0.,
+        help="maximum import time in ms for a probe run (default: no limit)"
+    )
+    arguments = parser.parse_args()
+
+    limits = {"help": arguments.max_help, "probe": arguments.max_probe}
+    failed = False
+    for scenario, command in SCENARIOS.items():
+        import_times(command)
+        totals = list()
+        modules = collections.defaultdict(list)
+        for i in range(arguments.runs):
+            times = import_times(command)
+            totals.append(sum(times.values()))
+            for name, value in times.items():
+                modules[name].append(value)
+
+        total = statistics.median(totals)
+        print(
+            f"{scenario}: {total:.1f} ms imports, median of "
+            f"{arguments.runs} runs"
+        )
+        heaviest = sorted(
+            modules.items(), key=lambda item: -statistics.median(item[1])
+        )
+        for name, values in heaviest[:arguments.top]:
+            print(f"  {statistics.median(values):8.1f} ms  {name}")
+
+        if limits[scenario] and total > limits[scenario]:
+            print(
+                f"  exceeds limit of {limits[scenario]:.1f} ms",
+                file=sys.stderr
+            )
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+import requests
+from argo_probe_webapi.web_api import WebAPIReports, RequestsTransport
+from mock_webapi import MockWebAPI
+
+PROBE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src", "web-api"
+)
+
+
+def run_probe(webapi, transport):
+    command = [
+        sys.executable, PROBE, "-H", webapi.hostname, "-t", "30",
+        "--rtype", "status", "-b", "0", "--transport", transport
+    ]
+    for tenant, value in webapi.tenants.items():
+        command.extend(["-k", f"{tenant}:{value['token']}"])
+
+    env = dict(os.environ)
+    env.update({
+        "PYTHONPATH": os.path.dirname(os.path.abspath(__file__)),
+        "REQUESTS_CA_BUNDLE": webapi.ca_file
+    })
+    start = time.monotonic()
+    output = subprocess.run(
+        command, env=env, capture_output=True, text=True
+    )
+    elapsed = time.monotonic() - start
+    if output.returncode != 0:
+        raise RuntimeError(output.stdout + output.stderr)
+
+    return elapsed
+
+
+def request_cpu(webapi, transport, count):
+    arguments = SimpleNamespace(
+        hostname=webapi.hostname, tenant_token=[["TENANT1:tenant1-token"]],
+        rtype="status", day=1, timeout=30, buffer_time=0, decode_workers=0,
+        max_size=0, connect_timeout=None, read_timeout=None,
+        download_timeout=None, wire_size=False, timing=False,
+        phase_timing=False, concurrency=1, adaptive=False, hedge_after="",
+        hedge_budget=10, history="", timeout_factor=3, order="list",
+        fail_fast=0, sample="", preflight=False, short_circuit=0,
+        fair=False, tenant_concurrency=None, warm_up=False,
+        tls_session_reuse=False, transport=transport
+    )
+    check = WebAPIReports(arguments)
+    if transport == "requests":
+        check.transport = RequestsTransport(requests.Session())
+
+    url = f"https://{webapi.hostname}/api/v2/reports"
+    check._get(url, "tenant1-token")
+    start = time.thread_time()
+    for i in range(count):
+        response, dispatched, phases = check._get(url, "tenant1-token")
+        response.json()
+
+    elapsed = time.thread_time() - start
+    check.transport.close()
+    return elapsed / count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare startup time and per-request CPU time of the "
+                    "requests, urllib3 and (if httpx and h2 are installed) "
+                    "http2 transports against a local mock Web-API"
+    )
+    parser.add_argument("--reports", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=5)
+    arguments = parser.parse_args()
+
+    tenants = {
+        "TENANT1": {
+            "token": "tenant1-token",
+            "reports": [f"REPORT{i + 1}" for i in range(arguments.reports)]
+        }
+    }
+    webapi = MockWebAPI(tenants, http2=True)
+    webapi.start()
+    os.environ["REQUESTS_CA_BUNDLE"] = webapi.ca_file
+    transports = ["requests", "urllib3"]
+    if importlib.util.find_spec("httpx") and importlib.util.find_spec("h2"):
+        transports.append("http2")
+
+    try:
+        startup = dict(
+            (transport, [
+                run_probe(webapi, transport) for i in range(arguments.runs)
+            ]) for transport in transports
+        )
+        cpu = dict(
+            (transport, [
+                request_cpu(webapi, transport, arguments.requests)
+                for i in range(arguments.runs)
+            ]) for transport in transports
+        )
+
+    finally:
+        webapi.stop()
+
+    print(
+        f"probe run with {arguments.reports} reports, "
+        f"{arguments.requests} requests for CPU time, "
+        f"median of {arguments.runs} runs"
+    )
+    for transport in transports:
+        print(
+            f"{transport:>8}: run {statistics.median(startup[transport]):.3f}"
+            f" s, {statistics.median(cpu[transport]) * 1e6:.0f} us CPU "
+            f"per request"
+        )
+
+
+if __name__ == "__main__":
+    main()
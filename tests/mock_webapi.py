@@ -0,0 +1,419 @@
+import fnmatch
+import heapq
+import http
+import http.server
+import json
+import os
+import random
+import select
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.parse
+
+
+def report_definition(name, group_type="SITES"):
+    return {
+        "id": name.lower(),
+        "tenant": "",
+        "disabled": False,
+        "info": {"name": name, "description": ""},
+        "thresholds": dict(),
+        "topology_schema": {
+            "group": {"type": "PROJECT", "group": {"type": group_type}}
+        },
+        "profiles": list(),
+        "filter_tags": list()
+    }
+
+
+def status_results(name, endpoints=1):
+    return {
+        "groups": [{
+            "name": name,
+            "type": "PROJECT",
+            "statuses": [
+                {"timestamp": "2024-02-04T00:00:00Z", "value": "OK"}
+            ],
+            "endpoints": [{
+                "name": f"SITE{i + 1}",
+                "type": "SITES",
+                "statuses": [
+                    {"timestamp": "2024-02-04T00:00:00Z", "value": "OK"}
+                ]
+            } for i in range(endpoints - 1)]
+        }]
+    }
+
+
+def ar_results(name, endpoints=1):
+    return {
+        "results": [{
+            "name": name,
+            "type": "PROJECT",
+            "endpoints": [{
+                "name": "SITE" if i == 0 else f"SITE{i + 1}",
+                "type": "SITES",
+                "results": [{
+                    "date": "2024-02-04",
+                    "availability": "100",
+                    "reliability": "100"
+                }]
+            } for i in range(endpoints)]
+        }]
+    }
+
+
+def endpoint_count(results, payload_size):
+    base = len(json.dumps(results("REPORT")))
+    endpoint = len(json.dumps(results("REPORT", 2))) - base
+    return 1 + max(0, round((payload_size - base) / endpoint))
+
+
+def synthetic_tenants(tenants, reports):
+    return dict(
+        (f"TENANT{i + 1}", {
+            "token": f"tenant{i + 1}-token",
+            "reports": [f"REPORT{j + 1}" for j in range(reports)]
+        }) for i in range(tenants)
+    )
+
+
+def fault_content(body, fault):
+    content = json.dumps(body).encode()
+    if "truncate" in fault:
+        content = content[:int(len(content) * fault["truncate"])]
+
+    return content
+
+
+def fault_headers(fault):
+    if "retry_after" in fault:
+        return [("retry-after", str(fault["retry_after"]))]
+
+    return list()
+
+
+def latency_distribution(spec):
+    kind, *values = spec.split(":")
+    values = [float(value) for value in values]
+    if kind == "constant" and len(values) == 1:
+        return lambda rng: values[0]
+
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(*values)
+
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: rng.lognormvariate(0., values[1]) * values[0]
+
+    raise ValueError(f"Invalid latency distribution: {spec}")
+
+
+class FaultScenario:
+    ACTIONS = ("latency", "status", "retry_after", "truncate", "cut", "drip")
+
+    def __init__(self, name, faults):
+        self.name = name
+        self.faults = faults
+        self.applied = [0] * len(faults)
+
+    def reset(self):
+        self.applied = [0] * len(self.faults)
+
+    def match(self, route, tenant, report, rng):
+        fault = dict()
+        for i, rule in enumerate(self.faults):
+            if not fnmatch.fnmatchcase(route, rule.get("route", "*")) or \
+                    not fnmatch.fnmatchcase(
+                        tenant or "", rule.get("tenant", "*")
+                    ) or not fnmatch.fnmatchcase(
+                        report or "", rule.get("report", "*")
+                    ):
+                continue
+
+            if "times" in rule and self.applied[i] >= rule["times"]:
+                continue
+
+            if rng.random() >= rule.get("probability", 1.):
+                continue
+
+            self.applied[i] += 1
+            fault.update(
+                (key, value) for key, value in rule.items()
+                if key in self.ACTIONS
+            )
+
+        return fault
+
+
+def load_scenarios(path):
+    with open(path) as f:
+        scenarios = json.load(f)
+
+    return [
+        FaultScenario(scenario["name"], scenario.get("faults", list()))
+        for scenario in scenarios
+    ]
+
+
+class MockWebAPIRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.webapi.lock:
+            self.server.webapi.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle(self):
+        if self.connection.selected_alpn_protocol() == "h2":
+            self._handle_h2()
+
+        else:
+            super().handle()
+
+    def _handle_h2(self):
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        webapi = self.server.webapi
+        connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(
+                client_side=False, header_encoding="utf-8"
+            )
+        )
+        connection.initiate_connection()
+        self.connection.sendall(connection.data_to_send())
+        pending = list()
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0., pending[0][0] - time.monotonic())
+
+            if self.connection.pending() or select.select(
+                    [self.connection], [], [], timeout
+            )[0]:
+                data = self.connection.recv(65535)
+                if not data:
+                    return
+
+                for event in connection.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        headers = dict(event.headers)
+                        code, body, delay, fault = webapi.respond(
+                            headers[":path"], headers.get("x-api-key")
+                        )
+                        with webapi.lock:
+                            webapi.streams += 1
+
+                        heapq.heappush(pending, (
+                            time.monotonic() + delay, event.stream_id, code,
+                            fault_content(body, fault),
+                            fault_headers(fault)
+                        ))
+
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+
+            while pending and pending[0][0] <= time.monotonic():
+                due, stream_id, code, content, headers = heapq.heappop(
+                    pending
+                )
+                connection.send_headers(stream_id, [
+                    (":status", str(code)),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(content)))
+                ] + headers)
+                connection.send_data(stream_id, content, end_stream=True)
+
+            self.connection.sendall(connection.data_to_send())
+
+    def do_GET(self):
+        code, body, delay, fault = self.server.webapi.respond(
+            self.path, self.headers.get("x-api-key")
+        )
+        time.sleep(delay)
+        content = fault_content(body, fault)
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for header, value in fault_headers(fault):
+            self.send_header(header, value)
+
+        self.end_headers()
+        if "cut" in fault:
+            self.wfile.write(content[:int(len(content) * fault["cut"])])
+            self.wfile.flush()
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+
+        if "drip" in fault:
+            chunk = fault["drip"].get("chunk", 1024)
+            try:
+                for i in range(0, len(content), chunk):
+                    self.wfile.write(content[i:i + chunk])
+                    self.wfile.flush()
+                    time.sleep(fault["drip"].get("interval", 0.1))
+
+            except OSError:
+                self.close_connection = True
+
+            return
+
+        self.wfile.write(content)
+
+
+class MockWebAPI:
+    def __init__(
+            self, tenants, delays=None, http2=False, latency=None,
+            error_rate=0., payload_size=0, seed=None, generator=None,
+            scenario=None
+    ):
+        self.tenants = tenants
+        self.delays = delays if delays else dict()
+        self.http2 = http2
+        self.latency = latency
+        self.error_rate = error_rate
+        self.generator = generator
+        self.scenario = scenario
+        self.endpoints = {
+            "results": endpoint_count(ar_results, payload_size),
+            "status": endpoint_count(status_results, payload_size)
+        }
+
+        self.random = random.Random(seed)
+        self.tokens = dict(
+            (value["token"], tenant) for tenant, value in tenants.items()
+        )
+        self.connections = 0
+        self.streams = 0
+        self.requests = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+        self.directory = None
+        self.server = None
+
+    @property
+    def ca_file(self):
+        return os.path.join(self.directory.name, "cert.pem")
+
+    @property
+    def hostname(self):
+        return f"localhost:{self.server.server_port}"
+
+    def respond(self, path, token):
+        with self.lock:
+            self.requests += 1
+
+        path = urllib.parse.urlparse(path).path.strip("/").split("/")
+        tenant = self.tokens.get(token)
+        route = path[2] if len(path) > 2 else ""
+        name = path[3] if route in ("results", "status") and \
+            len(path) == 5 else None
+        code, body, delay = self._respond(path, tenant, name)
+        fault = dict()
+        if self.scenario:
+            with self.lock:
+                fault = self.scenario.match(
+                    route, tenant, name, self.random
+                )
+
+        delay += fault.get("latency", 0.)
+        if "status" in fault:
+            code = fault["status"]
+            body = {"status": {"message": http.HTTPStatus(code).phrase}}
+
+        return code, body, delay, fault
+
+    def _respond(self, path, tenant, name):
+        if path == ["api", "v2", "version"]:
+            return 200, {"build_time": "", "golang": "", "version": "2"}, 0.
+
+        if tenant is None:
+            return 401, {"status": {"message": "Unauthorized"}}, 0.
+
+        if path == ["api", "v2", "reports"]:
+            if self.generator:
+                return 200, self.generator.reports(
+                    tenant, self.tenants[tenant]["reports"]
+                ), 0.
+
+            return 200, {
+                "status": {"message": "Success", "code": "200"},
+                "data": [
+                    report_definition(name)
+                    for name in self.tenants[tenant]["reports"]
+                ]
+            }, 0.
+
+        if name in self.tenants[tenant]["reports"]:
+            with self.lock:
+                delay = self.delays.get((tenant, name))
+                if delay is None:
+                    delay = self.latency(self.random) if self.latency else 0.
+
+                if self.random.random() < self.error_rate:
+                    self.errors += 1
+                    return 500, {
+                        "status": {"message": "Internal Server Error"}
+                    }, delay
+
+            if self.generator and path[2] == "results":
+                return 200, self.generator.ar_results(
+                    tenant, name, path[4]
+                ), delay
+
+            if self.generator:
+                return 200, self.generator.status_results(
+                    tenant, name, path[4]
+                ), delay
+
+            endpoints = self.endpoints[path[2]]
+            if path[2] == "results":
+                return 200, ar_results(name, endpoints), delay
+
+            return 200, status_results(name, endpoints), delay
+
+        return 404, {"status": {"message": "Not Found"}}, 0.
+
+    def _create_certificate(self):
+        subprocess.run([
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-days", "1", "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+            "-keyout", os.path.join(self.directory.name, "key.pem"),
+            "-out", self.ca_file
+        ], check=True, capture_output=True)
+
+    def start(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self._create_certificate()
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(
+            self.ca_file, os.path.join(self.directory.name, "key.pem")
+        )
+        if self.http2:
+            context.set_alpn_protocols(["h2", "http/1.1"])
+
+        self.server = http.server.ThreadingHTTPServer(
+            ("localhost", 0), MockWebAPIRequestHandler
+        )
+        self.server.daemon_threads = True
+        self.server.socket = context.wrap_socket(
+            self.server.socket, server_side=True
+        )
+        self.server.webapi = self
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
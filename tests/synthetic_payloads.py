@@ -0,0 +1,161 @@
+import datetime
+import random
+
+GROUP_TYPES = ("SITES", "SERVICEGROUPS")
+STATUS_VALUES = ("OK", "WARNING", "CRITICAL", "UNKNOWN", "MISSING", "DOWNTIME")
+STATUS_WEIGHTS = (90, 3, 3, 2, 1, 1)
+
+
+class PayloadGenerator:
+    def __init__(
+            self, seed=0, groups=10, endpoints=20, days=1, changes=4,
+            date=datetime.date(2024, 2, 4)
+    ):
+        self.seed = seed
+        self.groups = groups
+        self.endpoints = endpoints
+        self.days = days
+        self.changes = changes
+        self.date = date
+
+    def _random(self, *key):
+        return random.Random(":".join(str(item) for item in (self.seed, *key)))
+
+    def report_definition(self, tenant, name):
+        rng = self._random("report", tenant, name)
+        return {
+            "id": f"{rng.getrandbits(128):032x}",
+            "tenant": tenant,
+            "disabled": False,
+            "info": {
+                "name": name,
+                "description": f"Synthetic report {name}",
+                "created": "2018-09-28 15:08:48",
+                "updated": "2023-06-20 14:56:11"
+            },
+            "computations": {
+                "ar": True,
+                "status": True,
+                "trends": ["flapping", "status", "tags"]
+            },
+            "thresholds": {
+                "availability": 80,
+                "reliability": 85,
+                "uptime": 0.8,
+                "unknown": 0.1,
+                "downtime": 0.1
+            },
+            "topology_schema": {
+                "group": {
+                    "type": "PROJECT",
+                    "group": {"type": rng.choice(GROUP_TYPES)}
+                }
+            },
+            "profiles": [
+                {
+                    "id": f"{rng.getrandbits(64):016x}",
+                    "name": f"{tenant}_MON",
+                    "type": "metric"
+                },
+                {
+                    "id": f"{rng.getrandbits(64):016x}",
+                    "name": f"{name.lower()}_aggregation",
+                    "type": "aggregation"
+                },
+                {
+                    "id": f"{rng.getrandbits(64):016x}",
+                    "name": "ops",
+                    "type": "operations"
+                }
+            ],
+            "filter_tags": [
+                {
+                    "name": "scope",
+                    "value": name,
+                    "context": "argo.group.filter.tags.array"
+                },
+                {
+                    "name": "production",
+                    "value": "1",
+                    "context": "argo.endpoint.filter.tags"
+                }
+            ]
+        }
+
+    def reports(self, tenant, names):
+        return {
+            "status": {"message": "Success", "code": "200"},
+            "data": [self.report_definition(tenant, name) for name in names]
+        }
+
+    def _dates(self):
+        return [
+            (self.date - datetime.timedelta(days=i)).isoformat()
+            for i in reversed(range(self.days))
+        ]
+
+    def _availability(self, rng, date):
+        uptime = rng.betavariate(20, 1)
+        unknown = rng.uniform(0, 1 - uptime) * rng.random()
+        downtime = (1 - uptime - unknown) * rng.random()
+        known = 1 - unknown
+        return {
+            "date": date,
+            "availability": f"{100 * uptime / known:.5f}",
+            "reliability": f"{100 * uptime / (known - downtime):.5f}",
+            "unknown": f"{unknown:.5f}",
+            "uptime": f"{uptime:.5f}",
+            "downtime": f"{downtime:.5f}"
+        }
+
+    def ar_results(self, tenant, name, group_type="SITES"):
+        rng = self._random("ar", tenant, name)
+        dates = self._dates()
+        return {
+            "results": [{
+                "name": f"{name}_GROUP{i + 1}",
+                "type": "PROJECT",
+                "results": [
+                    self._availability(rng, date) for date in dates
+                ],
+                "endpoints": [{
+                    "name": f"{name}_GROUP{i + 1}_{group_type}{j + 1}",
+                    "type": group_type,
+                    "results": [
+                        self._availability(rng, date) for date in dates
+                    ]
+                } for j in range(self.endpoints)]
+            } for i in range(self.groups)]
+        }
+
+    def _statuses(self, rng):
+        statuses = list()
+        for date in self._dates():
+            start = datetime.datetime.fromisoformat(date)
+            offsets = sorted(
+                rng.randrange(1, 86399) for i in range(self.changes)
+            )
+            for offset in [0] + offsets + [86399]:
+                statuses.append({
+                    "timestamp": (
+                        start + datetime.timedelta(seconds=offset)
+                    ).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "value": rng.choices(STATUS_VALUES, STATUS_WEIGHTS)[0]
+                })
+
+        return statuses
+
+    def status_results(self, tenant, name, group_type="SITES"):
+        rng = self._random("status", tenant, name)
+        return {
+            "groups": [{
+                "name": f"{name}_GROUP{i + 1}",
+                "type": "PROJECT",
+                "statuses": self._statuses(rng),
+                "endpoints": [{
+                    "name": f"{name}_GROUP{i + 1}_{group_type}{j + 1}",
+                    "type": group_type,
+                    "statuses": self._statuses(rng)
+                } for j in range(self.endpoints)]
+            } for i in range(self.groups)]
+        }
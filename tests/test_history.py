@@ -0,0 +1,167 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+from argo_probe_webapi.history import LatencyHistory
+
+
+def record_latencies(path, tenant, count):
+    history = LatencyHistory(path)
+    try:
+        for i in range(count):
+            history.record(
+                "api.devel.argo.grnet.gr", "status",
+                {(tenant, "REPORT1"): [0.1 * (i + 1)]}
+            )
+
+    finally:
+        history.close()
+
+
+class LatencyHistoryTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "history.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_record_and_load(self):
+        history = LatencyHistory(self.path)
+        history.record(
+            "api.devel.argo.grnet.gr", "status", {
+                ("TENANT1", "REPORT1"): [0.5, 0.25],
+                ("TENANT1", "REPORT2"): [2.]
+            }
+        )
+        history.record(
+            "api.devel.argo.grnet.gr", "status", {
+                ("TENANT1", "REPORT1"): [0.75]
+            }
+        )
+        history.record(
+            "api.devel.argo.grnet.gr", "ar", {
+                ("TENANT1", "REPORT1"): [4.]
+            }
+        )
+        history.record(
+            "api.argo.grnet.gr", "status", {("TENANT1", "REPORT1"): [8.]}
+        )
+        self.assertEqual(
+            history.load("api.devel.argo.grnet.gr", "status"), {
+                ("TENANT1", "REPORT1"): [0.5, 0.25, 0.75],
+                ("TENANT1", "REPORT2"): [2.]
+            }
+        )
+        self.assertEqual(
+            history.load("api.devel.argo.grnet.gr", "ar"),
+            {("TENANT1", "REPORT1"): [4.]}
+        )
+        self.assertEqual(history.load("api.argo.grnet.gr", "ar"), dict())
+        history.close()
+
+    def test_keep_only_latest_samples(self):
+        history = LatencyHistory(self.path, size=4)
+        history.record(
+            "api.devel.argo.grnet.gr", "status",
+            {("TENANT1", "REPORT1"): [1., 2., 3.]}
+        )
+        history.record(
+            "api.devel.argo.grnet.gr", "status",
+            {("TENANT1", "REPORT1"): [4., 5., 6.]}
+        )
+        self.assertEqual(
+            history.load("api.devel.argo.grnet.gr", "status"),
+            {("TENANT1", "REPORT1"): [3., 4., 5., 6.]}
+        )
+        history.close()
+
+    def test_record_nothing(self):
+        history = LatencyHistory(self.path)
+        history.record("api.devel.argo.grnet.gr", "status", dict())
+        self.assertEqual(
+            history.load("api.devel.argo.grnet.gr", "status"), dict()
+        )
+        history.close()
+
+    def test_record_and_load_failures(self):
+        history = LatencyHistory(self.path)
+        for failed in [True, False, True]:
+            history.record_failures(
+                "api.devel.argo.grnet.gr", "status", {
+                    ("TENANT1", "REPORT1"): failed,
+                    ("TENANT1", "REPORT2"): False
+                }
+            )
+
+        history.record_failures(
+            "api.devel.argo.grnet.gr", "ar", {("TENANT1", "REPORT1"): True}
+        )
+        self.assertEqual(
+            history.load_failures("api.devel.argo.grnet.gr", "status"),
+            {("TENANT1", "REPORT1"): 5, ("TENANT1", "REPORT2"): 0}
+        )
+        self.assertEqual(
+            history.load_failures("api.devel.argo.grnet.gr", "ar"),
+            {("TENANT1", "REPORT1"): 1}
+        )
+        history.close()
+
+    def test_keep_only_latest_failures(self):
+        history = LatencyHistory(self.path)
+        for i in range(20):
+            history.record_failures(
+                "api.devel.argo.grnet.gr", "status",
+                {("TENANT1", "REPORT1"): i < 10}
+            )
+
+        self.assertEqual(
+            history.load_failures("api.devel.argo.grnet.gr", "status"),
+            {("TENANT1", "REPORT1"): 0b1111110000000000}
+        )
+        history.close()
+
+    def test_record_and_load_checks(self):
+        history = LatencyHistory(self.path)
+        history.record_checks(
+            "api.devel.argo.grnet.gr", "status",
+            [("TENANT1", "REPORT1"), ("TENANT1", "REPORT2")], 1707143604.
+        )
+        history.record_checks(
+            "api.devel.argo.grnet.gr", "status",
+            [("TENANT1", "REPORT2")], 1707147204.
+        )
+        history.record_checks("api.devel.argo.grnet.gr", "status", [], 0.)
+        self.assertEqual(
+            history.load_checks("api.devel.argo.grnet.gr", "status"), {
+                ("TENANT1", "REPORT1"): 1707143604.,
+                ("TENANT1", "REPORT2"): 1707147204.
+            }
+        )
+        self.assertEqual(
+            history.load_checks("api.devel.argo.grnet.gr", "ar"), dict()
+        )
+        history.close()
+
+    def test_shared_between_processes(self):
+        processes = [
+            multiprocessing.Process(
+                target=record_latencies, args=(self.path, f"TENANT{i}", 20)
+            ) for i in range(4)
+        ]
+        for process in processes:
+            process.start()
+
+        for process in processes:
+            process.join()
+
+        self.assertEqual(
+            [process.exitcode for process in processes], [0, 0, 0, 0]
+        )
+        history = LatencyHistory(self.path)
+        loaded = history.load("api.devel.argo.grnet.gr", "status")
+        history.close()
+        self.assertEqual(len(loaded), 4)
+        for i in range(4):
+            self.assertEqual(len(loaded[(f"TENANT{i}", "REPORT1")]), 20)
@@ -1,12 +1,34 @@
+import collections
+import concurrent.futures
 import datetime
+import importlib.util
 import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
 from types import SimpleNamespace
 from unittest.mock import patch, call
 
 import requests
+import urllib3
+from argo_probe_webapi.history import LatencyHistory
 from argo_probe_webapi.web_api import WebAPIReports, Status, \
-    WebAPIReportsException
+    WebAPIReportsException, decode_and_validate, ACCEPT_ENCODING, \
+    percentile, perfdata_label, NagiosRange, AdaptiveController, \
+    parse_retry_after, classify_error, PhaseTimeoutException, ReportQueue, \
+    DNSCache, classify_verdict
+from mock_webapi import MockWebAPI, FaultScenario, synthetic_tenants, \
+    latency_distribution, load_scenarios
+from synthetic_payloads import PayloadGenerator
+
+HTTP2 = importlib.util.find_spec("h2") is not None and \
+    importlib.util.find_spec("httpx") is not None
 
 mock_reports1 = {
     "status": {
@@ -833,6 +855,57 @@ class MockResponse:
             raise requests.exceptions.RequestException("Error has occurred")
 
 
+class MockStreamResponse(MockResponse):
+    def __init__(self, data, status_code, headers=None):
+        super().__init__(data=data, status_code=status_code)
+        self.content = self.content.encode()
+        self.headers = headers if headers else dict()
+        self.chunks_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            self.chunks_read += 1
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class MockSlowStreamResponse(MockStreamResponse):
+    def __init__(self, data, status_code, delay):
+        super().__init__(data=data, status_code=status_code)
+        self.delay = delay
+
+    def iter_content(self, chunk_size=1):
+        for i in range(len(self.content)):
+            threading.Event().wait(self.delay)
+            yield self.content[i:i + 1]
+
+
+class MockStalledStreamResponse(MockStreamResponse):
+    def __init__(self, data, status_code):
+        super().__init__(data=data, status_code=status_code)
+        self.server_sock, client_sock = socket.socketpair()
+        self.raw = SimpleNamespace(
+            connection=SimpleNamespace(sock=client_sock)
+        )
+
+    def iter_content(self, chunk_size=1):
+        chunk = self.raw.connection.sock.recv(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = self.raw.connection.sock.recv(chunk_size)
+
+        raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+
+class MockCompressedResponse(MockResponse):
+    def __init__(self, data, status_code, wire_size):
+        super().__init__(data=data, status_code=status_code)
+        self.raw = SimpleNamespace(tell=lambda: wire_size)
+
+
 def mock_check_ar_result(*args, **kwargs):
     if "REPORT1" in args[0]:
         return MockResponse(
@@ -1068,7 +1141,31 @@ class WebAPIReportsTests(unittest.TestCase):
             "rtype": "status",
             "day": 1,
             "debug": 0,
-            "buffer_time": 100
+            "buffer_time": 100,
+            "decode_workers": 0,
+            "max_size": 0,
+            "connect_timeout": 0,
+            "read_timeout": 0,
+            "download_timeout": 0,
+            "wire_size": False,
+            "timing": False,
+            "phase_timing": False,
+            "concurrency": 1,
+            "adaptive": False,
+            "hedge_after": "",
+            "hedge_budget": 10,
+            "history": "",
+            "timeout_factor": 3,
+            "order": "list",
+            "fail_fast": 0,
+            "sample": "",
+            "preflight": False,
+            "short_circuit": 0,
+            "fair": False,
+            "tenant_concurrency": None,
+            "warm_up": False,
+            "tls_session_reuse": False,
+            "transport": "requests"
         }
 
     @patch("argo_probe_webapi.web_api.time.sleep")
@@ -2360,173 +2457,2781 @@ class WebAPIReportsTests(unittest.TestCase):
             }
         )
 
-
-class StatusTests(unittest.TestCase):
-    def test_ok_ar_reports(self):
-        results = {
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_ar_results_all_ok_with_decode_workers(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
             "TENANT1": {
-                "results": {
-                    "REPORT1": "OK",
-                    "REPORT2": "OK",
-                    "REPORT3": "OK"
-                },
-                "performance": {
-                    "REPORT1": {
-                        "time": 0.210245,
-                        "size": 5987
-                    },
-                    "REPORT2": {
-                        "time": 0.093002,
-                        "size": 1507
-                    },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
-                    }
-                }
+                "data": [mock_reports1["data"][0], mock_reports1["data"][1]]
             },
-            "TENANT2": {
-                "results": {
-                    "REPORT4": "OK",
-                    "REPORT5": "OK"
-                },
-                "performance": {
-                    "REPORT4": {
-                        "time": 0.079089,
-                        "size": 17968
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = mock_check_ar_result
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["rtype"] = "ar"
+        arguments["decode_workers"] = 2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 3)
+        self.assertEqual(
+            results, {
+                "TENANT1": {
+                    "results": {
+                        "REPORT1": "OK",
+                        "REPORT2": "OK"
                     },
-                    "REPORT5": {
-                        "time": 0.565367,
-                        "size": 54741
+                    "performance": {
+                        "REPORT1": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_ar_results11))
+                        },
+                        "REPORT2": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_ar_results12))
+                        }
                     }
-                }
-            },
-            "TENANT3": {
-                "results": {
-                    "REPORT6": "OK"
                 },
-                "performance": {
-                    "REPORT6": {
-                        "time": 0.204673,
-                        "size": 54893
+                "TENANT2": {
+                    "results": {
+                        "CORE": "OK"
+                    },
+                    "performance": {
+                        "CORE": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_ar_results21))
+                        }
                     }
                 }
             }
-        }
-        status = Status(rtype="ar", data=results, verbosity=0)
-        self.assertEqual(
-            status.get_message(),
-            "OK - AR results available for all tenants and reports"
-            "|time=0.565367s;size=54741B"
         )
-        self.assertEqual(status.get_code(), 0)
 
-    def test_ok_ar_reports_verbose(self):
-        results = {
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_error_with_decode_workers(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
             "TENANT1": {
-                "results": {
-                    "REPORT1": "OK",
-                    "REPORT2": "OK",
-                    "REPORT3": "OK"
-                },
-                "performance": {
-                    "REPORT1": {
-                        "time": 0.210245,
-                        "size": 5987
-                    },
-                    "REPORT2": {
-                        "time": 0.093002,
-                        "size": 1507
-                    },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
-                    }
-                }
+                "data": [mock_reports1["data"][0], mock_reports1["data"][1]]
             },
-            "TENANT2": {
-                "results": {
-                    "REPORT4": "OK",
-                    "REPORT5": "OK"
-                },
-                "performance": {
-                    "REPORT4": {
-                        "time": 0.079089,
-                        "size": 17968
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = mock_check_status_result_with_response_error
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["decode_workers"] = 2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(
+            results, {
+                "TENANT1": {
+                    "results": {
+                        "REPORT1": "CRITICAL - Unable to retrieve status for "
+                                   "report REPORT1: Error has occurred",
+                        "REPORT2": "OK"
                     },
-                    "REPORT5": {
-                        "time": 0.565367,
-                        "size": 54741
+                    "performance": {
+                        "REPORT2": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_status_results12))
+                        }
                     }
-                }
-            },
-            "TENANT3": {
-                "results": {
-                    "REPORT6": "OK"
                 },
-                "performance": {
-                    "REPORT6": {
-                        "time": 0.204673,
-                        "size": 54893
+                "TENANT2": {
+                    "results": {
+                        "CORE": "OK"
+                    },
+                    "performance": {
+                        "CORE": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_status_results21))
+                        }
                     }
                 }
             }
-        }
-        status = Status(rtype="ar", data=results, verbosity=1)
-        self.assertEqual(
-            status.get_message(),
-            "OK - AR results available for all tenants and reports"
-            "|time=0.565367s;size=54741B\n"
-            "TENANT1:\n"
-            "AR for report REPORT1 - OK\n"
-            "AR for report REPORT2 - OK\n"
-            "AR for report REPORT3 - OK\n\n"
-            "TENANT2:\n"
-            "AR for report REPORT4 - OK\n"
-            "AR for report REPORT5 - OK\n\n"
-            "TENANT3:\n"
-            "AR for report REPORT6 - OK"
         )
-        self.assertEqual(status.get_code(), 0)
 
-    def test_ok_ar_reports_single_tenant(self):
-        results = {
-            "TENANT": {
-                "results": {
-                    "REPORT1": "OK",
-                    "REPORT2": "OK",
-                    "REPORT3": "OK"
-                },
-                "performance": {
-                    "REPORT1": {
-                        "time": 0.210245,
-                        "size": 5987
-                    },
-                    "REPORT2": {
-                        "time": 0.093002,
-                        "size": 1507
-                    },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
-                    }
-                }
+    @patch("argo_probe_webapi.web_api.concurrent.futures."
+           "ProcessPoolExecutor")
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_broken_decode_workers(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep,
+            mock_executor
+    ):
+        broken = concurrent.futures.process.BrokenProcessPool(
+            "A child process terminated abruptly"
+        )
+        future = concurrent.futures.Future()
+        future.set_exception(broken)
+        mock_executor.return_value.submit.side_effect = [future, broken]
+        mock_get_reports.return_value = {
+            "TENANT1": {
+                "data": [mock_reports1["data"][0], mock_reports1["data"][1]]
             }
         }
-        status = Status(rtype="ar", data=results, verbosity=0)
+        mock_get.side_effect = mock_check_status_result
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["decode_workers"] = 2
+        arguments["fail_fast"] = 5
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
         self.assertEqual(
-            status.get_message(),
-            "OK - AR results available for all reports"
-            "|time=0.210245s;size=5987B"
+            results["TENANT1"]["results"], {
+                "REPORT1": "CRITICAL - Decode worker failed: A child "
+                           "process terminated abruptly",
+                "REPORT2": "CRITICAL - Decode worker failed: A child "
+                           "process terminated abruptly"
+            }
+        )
+        self.assertEqual(webapi.failed, 2)
+        self.assertEqual(
+            mock_executor.call_args.kwargs["mp_context"].get_start_method(),
+            "forkserver"
         )
-        self.assertEqual(status.get_code(), 0)
 
-    def test_ok_ar_reports_single_tenant_verbose(self):
-        results = {
-            "TENANT1": {
-                "results": {
-                    "REPORT1": "OK",
-                    "REPORT2": "OK",
+    def test_decode_and_validate(self):
+        self.assertEqual(
+            decode_and_validate(
+                "ar", "REPORT1", json.dumps(mock_ar_results11).encode(),
+                {"time": 0.2}
+            ),
+            ("OK", {
+                "time": 0.2, "size": len(json.dumps(mock_ar_results11))
+            })
+        )
+        self.assertEqual(
+            decode_and_validate(
+                "status", "REPORT2",
+                json.dumps(mock_wrong_status_results12).encode(),
+                {"time": 0.2}
+            ),
+            ("CRITICAL - Unable to retrieve status from report REPORT2", {
+                "time": 0.2,
+                "size": len(json.dumps(mock_wrong_status_results12))
+            })
+        )
+        self.assertEqual(
+            decode_and_validate(
+                "ar", "REPORT1", b"this is not json", {"time": 0.2}
+            ),
+            ("CRITICAL - JSON decode error", None)
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_ar_results_within_max_size(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = lambda *args, **kwargs: MockStreamResponse(
+            data=mock_ar_results21, status_code=200
+        )
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["rtype"] = "ar"
+        arguments["max_size"] = 100000
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        mock_get.assert_called_once_with(
+            "https://api.devel.argo.grnet.gr/api/v2/results/CORE/"
+            "SITES?start_time=2024-02-04T00:00:00Z&end_time="
+            "2024-02-04T23:59:59Z&granularity=daily",
+            headers={
+                "Accept": "application/json", "x-api-key": "tenant2-token"
+            },
+            timeout=30,
+            stream=True
+        )
+        self.assertEqual(
+            results, {
+                "TENANT2": {
+                    "results": {
+                        "CORE": "OK"
+                    },
+                    "performance": {
+                        "CORE": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_ar_results21))
+                        }
+                    }
+                }
+            }
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_ar_results_exceeding_max_size(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        response = MockStreamResponse(data=mock_ar_results21, status_code=200)
+        mock_get.return_value = response
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["rtype"] = "ar"
+        arguments["max_size"] = 100
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(
+            results, {
+                "TENANT2": {
+                    "results": {
+                        "CORE": "CRITICAL - Response for report CORE exceeds "
+                                "maximum size of 100 B"
+                    },
+                    "performance": {
+                        "CORE": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_ar_results21))
+                        }
+                    }
+                }
+            }
+        )
+        self.assertEqual(response.chunks_read, 1)
+        self.assertTrue(response.closed)
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_exceeding_declared_max_size(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        response = MockStreamResponse(
+            data=mock_status_results21, status_code=200,
+            headers={"Content-Length": "5000000"}
+        )
+        mock_get.return_value = response
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["max_size"] = 1000000
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(
+            results, {
+                "TENANT2": {
+                    "results": {
+                        "CORE": "CRITICAL - Response for report CORE exceeds "
+                                "maximum size of 1000000 B"
+                    },
+                    "performance": {
+                        "CORE": {
+                            "time": 0.3827,
+                            "size": 5000000
+                        }
+                    }
+                }
+            }
+        )
+        self.assertEqual(response.chunks_read, 0)
+        self.assertTrue(response.closed)
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    def test_get_reports_with_connect_and_read_timeouts(
+            self, mock_get, mock_sleep
+    ):
+        mock_get.side_effect = [
+            MockResponse(data=mock_reports1, status_code=200),
+            requests.exceptions.ConnectTimeout("Connection timed out")
+        ]
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["connect_timeout"] = 5
+        arguments["read_timeout"] = 20
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        reports = webapi._get_reports()
+        mock_get.assert_has_calls([
+            call(
+                "https://api.devel.argo.grnet.gr/api/v2/reports",
+                headers={
+                    "Accept": "application/json", "x-api-key": "tenant1-token"
+                },
+                timeout=(5, 20)
+            ),
+            call(
+                "https://api.devel.argo.grnet.gr/api/v2/reports",
+                headers={
+                    "Accept": "application/json", "x-api-key": "tenant2-token"
+                },
+                timeout=(5, 20)
+            )
+        ], any_order=True)
+        self.assertEqual(
+            reports, {
+                "TENANT1": {
+                    "data": [
+                        mock_reports1["data"][0],
+                        mock_reports1["data"][1],
+                    ]
+                },
+                "TENANT2": {
+                    "exception": "CRITICAL - Error fetching reports for tenant "
+                                 "TENANT2: connect timed out after 5 s"
+                }
+            }
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_timeouts(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        def mock_timeouts(*args, **kwargs):
+            if "REPORT1" in args[0]:
+                raise requests.exceptions.ConnectTimeout("Connect timed out")
+
+            elif "REPORT2" in args[0]:
+                raise requests.exceptions.ReadTimeout("Read timed out")
+
+            else:
+                return MockResponse(
+                    data=mock_status_results21, status_code=200
+                )
+
+        mock_get_reports.return_value = {
+            "TENANT1": {
+                "data": [mock_reports1["data"][0], mock_reports1["data"][1]]
+            },
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = mock_timeouts
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["connect_timeout"] = 2.5
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], (2.5, 30))
+        self.assertEqual(
+            results["TENANT1"]["results"], {
+                "REPORT1": "CRITICAL - Unable to retrieve status for report "
+                           "REPORT1: connect timed out after 2.5 s",
+                "REPORT2": "CRITICAL - Unable to retrieve status for report "
+                           "REPORT2: first byte timed out after 30 s"
+            }
+        )
+        self.assertEqual(results["TENANT2"]["results"], {"CORE": "OK"})
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_slow_download(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        response = MockSlowStreamResponse(
+            data=mock_status_results21, status_code=200, delay=0.01
+        )
+        mock_get.return_value = response
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["download_timeout"] = 0.2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        start = time.monotonic()
+        results = webapi.check()
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        self.assertTrue(response.closed)
+        self.assertEqual(
+            results, {
+                "TENANT2": {
+                    "results": {
+                        "CORE": "CRITICAL - Unable to retrieve status for "
+                                "report CORE: download timed out after 0.2 s"
+                    },
+                    "performance": {}
+                }
+            }
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_stalled_download(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        response = MockStalledStreamResponse(
+            data=mock_status_results21, status_code=200
+        )
+        response.server_sock.sendall(response.content[:100])
+        mock_get.return_value = response
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["download_timeout"] = 0.3
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        start = time.monotonic()
+        results = webapi.check()
+        self.assertLess(time.monotonic() - start, 2)
+        response.server_sock.close()
+        response.raw.connection.sock.close()
+        self.assertEqual(
+            results["TENANT2"]["results"], {
+                "CORE": "CRITICAL - Unable to retrieve status for report "
+                        "CORE: download timed out after 0.3 s"
+            }
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_wire_size(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.return_value = MockCompressedResponse(
+            data=mock_status_results21, status_code=200, wire_size=213
+        )
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["wire_size"] = True
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        mock_get.assert_called_once_with(
+            "https://api.devel.argo.grnet.gr/api/v2/status/CORE/"
+            "SITES?start_time=2024-02-04T00:00:00Z&end_time="
+            "2024-02-04T23:59:59Z",
+            headers={
+                "Accept": "application/json",
+                "x-api-key": "tenant2-token"
+            },
+            timeout=30
+        )
+        self.assertEqual(
+            results, {
+                "TENANT2": {
+                    "results": {
+                        "CORE": "OK"
+                    },
+                    "performance": {
+                        "CORE": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_status_results21)),
+                            "wire_size": 213
+                        }
+                    }
+                }
+            }
+        )
+
+    @patch("argo_probe_webapi.web_api.time.monotonic")
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_timing(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep,
+            mock_monotonic
+    ):
+        mock_get_reports.return_value = {
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.return_value = MockStreamResponse(
+            data=mock_status_results21, status_code=200
+        )
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        mock_monotonic.side_effect = [10.0, 10.25, 12.25]
+        arguments = self.arguments.copy()
+        arguments["timing"] = True
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        size = len(json.dumps(mock_status_results21))
+        self.assertEqual(
+            results, {
+                "TENANT2": {
+                    "results": {
+                        "CORE": "OK"
+                    },
+                    "performance": {
+                        "CORE": {
+                            "time": 2.25,
+                            "ttfb": 0.25,
+                            "throughput": size / 2.,
+                            "size": size
+                        }
+                    }
+                }
+            }
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    def test_get_with_phase_timing(self, mock_sleep):
+        mock_sleep.side_effect = mock_function
+        server = MockWebAPI({
+            "TENANT1": {"token": "tenant1-token", "reports": ["REPORT1"]},
+            "TENANT2": {"token": "tenant2-token", "reports": ["REPORT2"]}
+        })
+        server.start()
+        arguments = self.arguments.copy()
+        arguments["phase_timing"] = True
+        url = f"https://{server.hostname}/api/v2/reports"
+        try:
+            with patch.dict(
+                    os.environ, {"REQUESTS_CA_BUNDLE": server.ca_file}
+            ):
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+                response1, dispatched1, phases1 = webapi._get(
+                    url, "tenant1-token", stream=True
+                )
+                self.assertEqual(
+                    response1.json()["data"][0]["info"]["name"], "REPORT1"
+                )
+                response2, dispatched2, phases2 = webapi._get(
+                    url, "tenant2-token", stream=True
+                )
+                self.assertEqual(
+                    response2.json()["data"][0]["info"]["name"], "REPORT2"
+                )
+
+        finally:
+            server.stop()
+
+        self.assertEqual(server.connections, 1)
+        self.assertEqual(
+            sorted(phases1.keys()), ["connect", "dns", "tls", "wait"]
+        )
+        self.assertGreater(phases1["connect"], 0)
+        self.assertGreater(phases1["tls"], 0)
+        self.assertGreater(phases1["wait"], 0)
+        self.assertEqual(phases2["dns"], 0)
+        self.assertEqual(phases2["connect"], 0)
+        self.assertEqual(phases2["tls"], 0)
+        self.assertGreater(phases2["wait"], 0)
+
+    @patch("argo_probe_webapi.web_api.time.monotonic")
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_phase_timing(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep,
+            mock_monotonic
+    ):
+        mock_get_reports.return_value = {
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.return_value = (
+            MockStreamResponse(data=mock_status_results21, status_code=200),
+            10.,
+            {"dns": 0.125, "connect": 0.25, "tls": 0.5, "wait": 1.}
+        )
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        mock_monotonic.side_effect = [12., 13.5]
+        arguments = self.arguments.copy()
+        arguments["phase_timing"] = True
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        mock_get.assert_called_once_with(
+            "https://api.devel.argo.grnet.gr/api/v2/status/CORE/"
+            "SITES?start_time=2024-02-04T00:00:00Z&end_time="
+            "2024-02-04T23:59:59Z",
+            "tenant2-token",
+            stream=True,
+            read_timeout=None
+        )
+        self.assertEqual(
+            results, {
+                "TENANT2": {
+                    "results": {
+                        "CORE": "OK"
+                    },
+                    "performance": {
+                        "CORE": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_status_results21)),
+                            "phases": {
+                                "dns": 0.125,
+                                "connect": 0.25,
+                                "tls": 0.5,
+                                "wait": 1.,
+                                "download": 1.5
+                            }
+                        }
+                    }
+                }
+            }
+        )
+
+    def test_check_status_results_with_phase_timing_of_listing(self):
+        server = MockWebAPI({
+            "TENANT1": {
+                "token": "tenant1-token",
+                "reports": ["REPORT1", "REPORT2"]
+            }
+        })
+        server.start()
+        try:
+            arguments = self.arguments.copy()
+            arguments["hostname"] = server.hostname
+            arguments["buffer_time"] = 0
+            arguments["phase_timing"] = True
+            arguments["preflight"] = True
+            with patch.dict(
+                    os.environ, {"REQUESTS_CA_BUNDLE": server.ca_file}
+            ):
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+                results = webapi.check()
+
+        finally:
+            server.stop()
+
+        self.assertEqual(server.connections, 1)
+        for performance in results["TENANT1"]["performance"].values():
+            self.assertEqual(performance["phases"]["connect"], 0)
+            self.assertEqual(performance["phases"]["tls"], 0)
+
+        self.assertGreater(webapi.phases["connect"], 0)
+        self.assertGreater(webapi.phases["tls"], 0)
+        status = Status(
+            rtype="status", data=results, verbosity=0,
+            phases=webapi.phases
+        )
+        labels = dict(
+            label.split("=", 1) for label in
+            status.get_message().split("|")[1].split()
+        )
+        self.assertGreater(float(labels["connect"].rstrip("s")), 0)
+        self.assertGreater(float(labels["tls"].rstrip("s")), 0)
+        self.assertGreater(
+            float(labels["wait"].rstrip("s")),
+            sum(
+                performance["phases"]["wait"] for performance in
+                results["TENANT1"]["performance"].values()
+            )
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_ar_results_concurrently(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def mock_concurrent_ar_result(*args, **kwargs):
+            barrier.wait()
+            return mock_check_ar_result(*args, **kwargs)
+
+        mock_get_reports.return_value = {
+            "TENANT1": {
+                "data": [mock_reports1["data"][0], mock_reports1["data"][1]]
+            },
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = mock_concurrent_ar_result
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["rtype"] = "ar"
+        arguments["concurrency"] = 3
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 3)
+        self.assertEqual(
+            results, {
+                "TENANT1": {
+                    "results": {
+                        "REPORT1": "OK",
+                        "REPORT2": "OK"
+                    },
+                    "performance": {
+                        "REPORT1": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_ar_results11))
+                        },
+                        "REPORT2": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_ar_results12))
+                        }
+                    }
+                },
+                "TENANT2": {
+                    "results": {
+                        "CORE": "OK"
+                    },
+                    "performance": {
+                        "CORE": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_ar_results21))
+                        }
+                    }
+                }
+            }
+        )
+        self.assertEqual(webapi.stats, dict())
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_adaptive_with_backoff(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT1": {
+                "data": [mock_reports1["data"][0], mock_reports1["data"][1]]
+            }
+        }
+        mock_get.side_effect = [
+            MockStreamResponse(
+                data=mock_status_results11, status_code=200
+            ),
+            MockStreamResponse(
+                data=None, status_code=429, headers={"Retry-After": "2"}
+            ),
+            MockStreamResponse(
+                data=mock_status_results12, status_code=200
+            )
+        ]
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["concurrency"] = 4
+        arguments["adaptive"] = True
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(
+            mock_get.call_args_list[1], mock_get.call_args_list[2]
+        )
+        self.assertEqual(
+            results["TENANT1"]["results"], {"REPORT1": "OK", "REPORT2": "OK"}
+        )
+        self.assertEqual(webapi.controller.backoffs, 1)
+        self.assertGreater(webapi.controller.resume_at, 0)
+        self.assertEqual(mock_sleep.call_count, 4)
+        self.assertAlmostEqual(mock_sleep.call_args_list[1][0][0], 0.1)
+        self.assertAlmostEqual(
+            mock_sleep.call_args_list[2][0][0], 2, delta=0.5
+        )
+        self.assertEqual(
+            webapi.stats, {"concurrency": "2;;;1;4", "backoffs": "1c"}
+        )
+
+    def test_adaptive_controller(self):
+        controller = AdaptiveController(
+            maximum=4, adaptive=True, delay=0.1, max_pause=30
+        )
+        self.assertEqual(controller.limit, 1)
+        self.assertFalse(controller.record(0.2, 200))
+        self.assertEqual(controller.limit, 2)
+        self.assertFalse(controller.record(0.2, 200))
+        self.assertFalse(controller.record(0.25, 200))
+        self.assertEqual(controller.limit, 3)
+        for i in range(10):
+            controller.record(0.2, 200)
+        self.assertEqual(controller.limit, 4)
+        self.assertEqual(controller.peak, 4)
+        self.assertAlmostEqual(controller.delay, 0)
+        self.assertEqual(controller.pause(), 0)
+        self.assertTrue(controller.record(0.2, 503))
+        self.assertEqual(controller.limit, 2)
+        self.assertEqual(controller.delay, 0.1)
+        self.assertTrue(controller.record(1.5, 200))
+        self.assertEqual(controller.limit, 1)
+        self.assertEqual(controller.delay, 0.2)
+        self.assertTrue(controller.record(0.2, 200, "120"))
+        self.assertEqual(controller.limit, 1)
+        self.assertEqual(controller.backoffs, 3)
+        self.assertGreater(controller.pause(), 25)
+        self.assertLessEqual(controller.pause(), 30)
+        self.assertEqual(controller.peak, 4)
+
+    def test_adaptive_controller_recovers_without_buffer_time(self):
+        controller = AdaptiveController(
+            maximum=4, adaptive=True, delay=0., max_pause=30
+        )
+        for i in range(10):
+            controller.record(0.1, 200)
+
+        self.assertTrue(controller.record(0.1, 429))
+        self.assertEqual(controller.delay, 0.1)
+        for i in range(10):
+            controller.record(0.1, 200)
+
+        self.assertEqual(controller.delay, 0.)
+        for i in range(3):
+            controller.backoff()
+
+        self.assertEqual(controller.delay, 0.4)
+        for i in range(20):
+            controller.record(0.1, 200)
+
+        self.assertEqual(controller.delay, 0.)
+
+    def test_adaptive_controller_spikes_per_report(self):
+        controller = AdaptiveController(
+            maximum=4, adaptive=True, delay=0., max_pause=30
+        )
+        for i in range(200):
+            if i % 5 == 0:
+                self.assertFalse(controller.record(1., 200, key="SLOW"))
+
+            else:
+                self.assertFalse(controller.record(0.1, 200, key="FAST"))
+
+        self.assertEqual(controller.limit, 4)
+        self.assertEqual(controller.backoffs, 0)
+        self.assertTrue(controller.record(1., 200, key="FAST"))
+        self.assertEqual(controller.backoffs, 1)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after(None), 0)
+        self.assertEqual(parse_retry_after("5"), 5)
+        self.assertEqual(parse_retry_after("-5"), 0)
+        self.assertEqual(parse_retry_after("soon"), 0)
+        self.assertEqual(
+            parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0
+        )
+        in_a_minute = datetime.datetime.now(
+            datetime.timezone.utc
+        ) + datetime.timedelta(seconds=60)
+        self.assertAlmostEqual(
+            parse_retry_after(
+                in_a_minute.strftime("%a, %d %b %Y %H:%M:%S GMT")
+            ), 60, delta=2
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_hedged(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        release = threading.Event()
+        slow = MockStreamResponse(data=mock_status_results11, status_code=200)
+        fast = MockStreamResponse(data=mock_status_results11, status_code=200)
+
+        def mock_slow_then_fast(*args, **kwargs):
+            if mock_get.call_count == 1:
+                release.wait(5)
+                return slow
+
+            return fast
+
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": [mock_reports1["data"][0]]}
+        }
+        mock_get.side_effect = mock_slow_then_fast
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["hedge_after"] = "0.05"
+        arguments["hedge_budget"] = 10
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        release.set()
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(
+            mock_get.call_args_list[0], mock_get.call_args_list[1]
+        )
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        self.assertEqual(
+            results, {
+                "TENANT1": {
+                    "results": {
+                        "REPORT1": "OK"
+                    },
+                    "performance": {
+                        "REPORT1": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_status_results11))
+                        }
+                    }
+                }
+            }
+        )
+        self.assertEqual(
+            webapi.stats, {"hedges": "1;;;0;1", "hedge_wins": "1c"}
+        )
+        for i in range(500):
+            if slow.closed:
+                break
+
+            threading.Event().wait(0.01)
+
+        self.assertTrue(slow.closed)
+        self.assertEqual(slow.chunks_read, 0)
+        self.assertFalse(fast.closed)
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_hedges_capped_by_budget(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        requested = list()
+        lock = threading.Lock()
+
+        def mock_slow_first_request(url, *args, **kwargs):
+            with lock:
+                first = url not in requested
+                requested.append(url)
+
+            if first:
+                threading.Event().wait(0.2)
+
+            response = mock_check_status_result(url, *args, **kwargs)
+            return MockStreamResponse(
+                data=response.data, status_code=response.status_code
+            )
+
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": mock_reports1["data"]}
+        }
+        mock_get.side_effect = mock_slow_first_request
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["hedge_after"] = "0.01"
+        arguments["hedge_budget"] = 10
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(
+            results["TENANT1"]["results"],
+            {"REPORT1": "OK", "REPORT2": "OK", "TEST-REPORT3": "OK"}
+        )
+        self.assertEqual(
+            webapi.stats, {"hedges": "1;;;0;1", "hedge_wins": "1c"}
+        )
+
+    def test_hedge_delay_from_latencies(self):
+        arguments = self.arguments.copy()
+        arguments["hedge_after"] = "p95"
+        arguments["hedge_budget"] = 10
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        webapi.latencies = [0.2, 0.1, 0.4, 0.3]
+        self.assertIsNone(webapi._hedge_delay())
+        webapi.latencies.extend([1.2, 0.5, 0.2, 0.1, 0.4, 0.3])
+        self.assertEqual(webapi._hedge_delay(), 1.2)
+        webapi.latencies.extend(10 * [0.2])
+        self.assertEqual(webapi._hedge_delay(), 0.5)
+
+    def test_invalid_hedge_delay(self):
+        arguments = self.arguments.copy()
+        arguments["hedge_after"] = "slow"
+        arguments["hedge_budget"] = 10
+        with self.assertRaises(WebAPIReportsException) as context:
+            WebAPIReports(SimpleNamespace(**arguments))
+
+        self.assertEqual(str(context.exception), "Invalid hedge delay: slow")
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_history_timeouts(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        def mock_hung_core_result(url, *args, **kwargs):
+            if "/CORE/" in url:
+                raise requests.exceptions.ReadTimeout("Read timed out")
+
+            return mock_check_status_result(url, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.db")
+            history = LatencyHistory(path)
+            history.record(
+                "api.devel.argo.grnet.gr", "status", {
+                    ("TENANT1", "REPORT1"): 20 * [0.25],
+                    ("TENANT1", "REPORT2"): 5 * [0.25],
+                    ("TENANT2", "CORE"): 19 * [0.5] + [0.75]
+                }
+            )
+            mock_get_reports.return_value = {
+                "TENANT1": {
+                    "data": [
+                        mock_reports1["data"][0], mock_reports1["data"][1]
+                    ]
+                },
+                "TENANT2": {"data": mock_reports2["data"]}
+            }
+            mock_get.side_effect = mock_hung_core_result
+            mock_today.return_value = datetime.datetime(
+                2024, 2, 5, 15, 33, 24
+            )
+            mock_sleep.side_effect = mock_function
+            arguments = self.arguments.copy()
+            arguments["history"] = path
+            webapi = WebAPIReports(SimpleNamespace(**arguments))
+            results = webapi.check()
+            self.assertEqual(
+                [item[1]["timeout"] for item in mock_get.call_args_list],
+                [(30, 1.), 30, (30, 2.25)]
+            )
+            self.assertEqual(
+                results["TENANT1"]["results"],
+                {"REPORT1": "OK", "REPORT2": "OK"}
+            )
+            self.assertEqual(
+                results["TENANT2"]["results"], {
+                    "CORE": "CRITICAL - Unable to retrieve status for report "
+                            "CORE: first byte timed out after 2.25 s"
+                }
+            )
+            loaded = history.load("api.devel.argo.grnet.gr", "status")
+            history.close()
+            self.assertEqual(
+                [round(value, 4) for value in loaded[("TENANT1", "REPORT1")]],
+                20 * [0.25] + [0.3827]
+            )
+            self.assertEqual(
+                [round(value, 4) for value in loaded[("TENANT1", "REPORT2")]],
+                5 * [0.25] + [0.3827]
+            )
+            self.assertEqual(
+                loaded[("TENANT2", "CORE")], 19 * [0.5] + [0.75, 2.25]
+            )
+
+    def test_report_timeout_bounds(self):
+        arguments = self.arguments.copy()
+        arguments["read_timeout"] = 10
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        webapi.history_samples = {
+            ("TENANT1", "REPORT1"): 9 * [0.5],
+            ("TENANT1", "REPORT2"): 10 * [0.5],
+            ("TENANT1", "REPORT3"): 10 * [0.1],
+            ("TENANT2", "CORE"): 10 * [5.]
+        }
+        self.assertIsNone(webapi._report_timeout(("TENANT1", "REPORT1")))
+        self.assertEqual(webapi._report_timeout(("TENANT1", "REPORT2")), 1.5)
+        self.assertEqual(webapi._report_timeout(("TENANT1", "REPORT3")), 1.)
+        self.assertEqual(webapi._report_timeout(("TENANT2", "CORE")), 10)
+        self.assertIsNone(webapi._report_timeout(("TENANT2", "NEW")))
+
+    def test_invalid_history_path(self):
+        arguments = self.arguments.copy()
+        arguments["history"] = "/nonexisting/directory/history.db"
+        with self.assertRaises(WebAPIReportsException) as context:
+            WebAPIReports(SimpleNamespace(**arguments))
+
+        self.assertEqual(
+            str(context.exception),
+            "Unable to open latency history /nonexisting/directory/"
+            "history.db: unable to open database file"
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_longest_first(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.db")
+            history = LatencyHistory(path)
+            history.record(
+                "api.devel.argo.grnet.gr", "status", {
+                    ("TENANT1", "REPORT1"): [0.25, 0.5, 0.25],
+                    ("TENANT1", "REPORT2"): [4., 0.5, 5.],
+                    ("TENANT2", "CORE"): [1., 2., 1.5]
+                }
+            )
+            history.close()
+            mock_get_reports.return_value = {
+                "TENANT1": {"data": mock_reports1["data"]},
+                "TENANT2": {"data": mock_reports2["data"]}
+            }
+            mock_get.side_effect = mock_check_status_result
+            mock_today.return_value = datetime.datetime(
+                2024, 2, 5, 15, 33, 24
+            )
+            mock_sleep.side_effect = mock_function
+            arguments = self.arguments.copy()
+            arguments["history"] = path
+            arguments["order"] = "longest"
+            webapi = WebAPIReports(SimpleNamespace(**arguments))
+            results = webapi.check()
+            self.assertEqual(
+                [
+                    item[0][0].split("/")[6]
+                    for item in mock_get.call_args_list
+                ],
+                ["TEST-REPORT3", "REPORT2", "CORE", "REPORT1"]
+            )
+            self.assertEqual(
+                list(results["TENANT1"]["results"].keys()),
+                ["REPORT1", "REPORT2", "TEST-REPORT3"]
+            )
+
+    def test_order_without_history(self):
+        arguments = self.arguments.copy()
+        arguments["order"] = "longest"
+        with self.assertRaises(WebAPIReportsException) as context:
+            WebAPIReports(SimpleNamespace(**arguments))
+
+        self.assertEqual(
+            str(context.exception),
+            "Ordering of reports by longest requires --history"
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_failures_first_with_fail_fast(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.db")
+            history = LatencyHistory(path)
+            history.record_failures(
+                "api.devel.argo.grnet.gr", "status",
+                {("TENANT1", "REPORT1"): True, ("TENANT2", "CORE"): True}
+            )
+            history.record_failures(
+                "api.devel.argo.grnet.gr", "status",
+                {("TENANT1", "REPORT1"): True, ("TENANT2", "CORE"): False}
+            )
+            mock_get_reports.return_value = {
+                "TENANT1": {
+                    "data": [
+                        mock_reports1["data"][1], mock_reports1["data"][0]
+                    ]
+                },
+                "TENANT2": {"data": mock_reports2["data"]}
+            }
+            mock_get.side_effect = mock_check_status_result_with_response_error
+            mock_today.return_value = datetime.datetime(
+                2024, 2, 5, 15, 33, 24
+            )
+            mock_sleep.side_effect = mock_function
+            arguments = self.arguments.copy()
+            arguments["history"] = path
+            arguments["order"] = "failures"
+            arguments["fail_fast"] = 1
+            webapi = WebAPIReports(SimpleNamespace(**arguments))
+            results = webapi.check()
+            mock_get.assert_called_once_with(
+                "https://api.devel.argo.grnet.gr/api/v2/status/REPORT1/"
+                "SERVICEGROUPS?start_time=2024-02-04T00:00:00Z&"
+                "end_time=2024-02-04T23:59:59Z",
+                headers={
+                    "Accept": "application/json",
+                    "x-api-key": "tenant1-token"
+                },
+                timeout=30
+            )
+            self.assertEqual(
+                results, {
+                    "TENANT1": {
+                        "results": {
+                            "REPORT1": "CRITICAL - Unable to retrieve status "
+                                       "for report REPORT1: Error has "
+                                       "occurred"
+                        },
+                        "performance": dict()
+                    },
+                    "TENANT2": {
+                        "results": dict(),
+                        "performance": dict()
+                    }
+                }
+            )
+            self.assertEqual(webapi.stats, {"unchecked": "2"})
+            self.assertEqual(
+                history.load_failures("api.devel.argo.grnet.gr", "status"),
+                {("TENANT1", "REPORT1"): 7, ("TENANT2", "CORE"): 2}
+            )
+            history.close()
+
+    def test_order_jobs_by_most_recent_failure(self):
+        webapi = WebAPIReports(SimpleNamespace(**self.arguments))
+        webapi.order = "failures"
+        webapi.history_failures = {
+            ("TENANT1", "REPORT1"): 0b1000,
+            ("TENANT1", "REPORT2"): 0b1,
+            ("TENANT2", "CORE"): 0b110
+        }
+        jobs = [
+            ("TENANT2", {"info": {"name": "OTHER"}}),
+            ("TENANT1", {"info": {"name": "REPORT1"}}),
+            ("TENANT2", {"info": {"name": "CORE"}}),
+            ("TENANT1", {"info": {"name": "REPORT2"}})
+        ]
+        self.assertEqual(
+            [job[1]["info"]["name"] for job in webapi._order_jobs(jobs)],
+            ["REPORT2", "CORE", "REPORT1", "OTHER"]
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_fail_fast_not_reached(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": mock_reports1["data"]},
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = mock_check_status_result_with_response_error
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["fail_fast"] = 2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(
+            list(results["TENANT1"]["results"].keys()),
+            ["REPORT1", "REPORT2", "TEST-REPORT3"]
+        )
+        self.assertEqual(list(results["TENANT2"]["results"].keys()), ["CORE"])
+        self.assertEqual(webapi.failed, 1)
+        self.assertEqual(webapi.stats, dict())
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_sampled_rotation(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.db")
+            mock_get_reports.return_value = {
+                "TENANT1": {"data": mock_reports1["data"]},
+                "TENANT2": {"data": mock_reports2["data"]}
+            }
+            mock_get.side_effect = mock_check_status_result
+            mock_sleep.side_effect = mock_function
+            arguments = self.arguments.copy()
+            arguments["history"] = path
+            arguments["sample"] = "50%"
+            checked = list()
+            for hour in [15, 16, 17]:
+                mock_today.return_value = datetime.datetime(
+                    2024, 2, 5, hour, 33, 24
+                )
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+                results = webapi.check()
+                checked.append([
+                    report for tenant in ["TENANT1", "TENANT2"]
+                    for report in results[tenant]["results"].keys()
+                ])
+
+            self.assertEqual(
+                checked, [
+                    ["REPORT1", "REPORT2"],
+                    ["TEST-REPORT3", "CORE"],
+                    ["REPORT1", "REPORT2"]
+                ]
+            )
+            self.assertEqual(mock_get.call_count, 6)
+            self.assertEqual(
+                webapi.sampling, {
+                    "checked": 2,
+                    "total": 4,
+                    "coverage": 100.,
+                    "oldest": 3600.,
+                    "never": 0
+                }
+            )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_sampled_first_run(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        with tempfile.TemporaryDirectory() as directory:
+            mock_get_reports.return_value = {
+                "TENANT1": {"data": mock_reports1["data"]},
+                "TENANT2": {"data": mock_reports2["data"]}
+            }
+            mock_get.side_effect = mock_check_status_result
+            mock_today.return_value = datetime.datetime(
+                2024, 2, 5, 15, 33, 24
+            )
+            mock_sleep.side_effect = mock_function
+            arguments = self.arguments.copy()
+            arguments["history"] = os.path.join(directory, "history.db")
+            arguments["sample"] = "1"
+            webapi = WebAPIReports(SimpleNamespace(**arguments))
+            results = webapi.check()
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertEqual(
+                results["TENANT1"]["results"], {"REPORT1": "OK"}
+            )
+            self.assertEqual(results["TENANT2"]["results"], dict())
+            self.assertEqual(
+                webapi.sampling, {
+                    "checked": 1,
+                    "total": 4,
+                    "coverage": 25.,
+                    "oldest": 0.,
+                    "never": 3
+                }
+            )
+            status = Status(
+                rtype="status", data=results, verbosity=1,
+                sampling=webapi.sampling
+            )
+            self.assertEqual(
+                status.get_message(),
+                "OK - Status results available for all tenants and "
+                "reports; checked 1 of 4 reports, coverage 25%, 3 never "
+                "checked|time=0.382700s;size="
+                f"{len(json.dumps(mock_status_results11))}B "
+                "coverage=25%;;;0;100 oldest_check=0s never_checked=3\n"
+                "TENANT1:\n"
+                "Status for report REPORT1 - OK"
+            )
+
+    def test_invalid_sample_size(self):
+        arguments = self.arguments.copy()
+        arguments["history"] = ":memory:"
+        for sample in ["some", "0", "-10%", "%"]:
+            arguments["sample"] = sample
+            with self.assertRaises(WebAPIReportsException) as context:
+                WebAPIReports(SimpleNamespace(**arguments))
+
+            self.assertEqual(
+                str(context.exception), f"Invalid sample size: {sample}"
+            )
+
+    def test_sample_without_history(self):
+        arguments = self.arguments.copy()
+        arguments["sample"] = "10%"
+        with self.assertRaises(WebAPIReportsException) as context:
+            WebAPIReports(SimpleNamespace(**arguments))
+
+        self.assertEqual(
+            str(context.exception), "Sampling of reports requires --history"
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_preflight(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        def mock_version_and_status(url, *args, **kwargs):
+            if url.endswith("/api/v2/version"):
+                return MockResponse(
+                    data={"build_time": "", "version": "1.0"},
+                    status_code=404
+                )
+
+            return mock_check_status_result(url, *args, **kwargs)
+
+        mock_get_reports.return_value = {
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = mock_version_and_status
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["preflight"] = True
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(
+            mock_get.call_args_list[0], call(
+                "https://api.devel.argo.grnet.gr/api/v2/version",
+                headers={"Accept": "application/json"},
+                timeout=30
+            )
+        )
+        self.assertEqual(results["TENANT2"]["results"], {"CORE": "OK"})
+        self.assertIsNone(webapi.host_error)
+        self.assertRegex(webapi.stats["preflight"], r"^\d+\.\d+s$")
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_failed_preflight(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get.side_effect = requests.exceptions.ConnectionError(
+            "Failed to resolve 'api.devel.argo.grnet.gr'"
+        )
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["preflight"] = True
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        mock_get.assert_called_once()
+        self.assertFalse(mock_get_reports.called)
+        self.assertEqual(results, dict())
+        self.assertEqual(
+            webapi.host_error,
+            "Web-API host api.devel.argo.grnet.gr unavailable: Failed to "
+            "resolve 'api.devel.argo.grnet.gr'"
+        )
+        self.assertIn("preflight", webapi.stats)
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_preflight_server_error(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get.return_value = MockResponse(data=None, status_code=503)
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["preflight"] = True
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertFalse(mock_get_reports.called)
+        self.assertEqual(results, dict())
+        self.assertEqual(
+            webapi.host_error,
+            "Web-API host api.devel.argo.grnet.gr unavailable: Error has "
+            "occurred"
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_short_circuit_host(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": mock_reports1["data"]},
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = requests.exceptions.ConnectionError(
+            socket.gaierror(-2, "Name or service not known")
+        )
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["short_circuit"] = 2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        webapi.check()
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(
+            webapi.host_error,
+            "Web-API host api.devel.argo.grnet.gr unavailable: dns error for "
+            "2 report(s), 2 not checked: [Errno -2] Name or service not known"
+        )
+        self.assertEqual(webapi.stats, {"unchecked": "2"})
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_short_circuit_tenant(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        def mock_unauthorized_tenant1(url, *args, **kwargs):
+            if kwargs["headers"]["x-api-key"] == "tenant1-token":
+                return MockResponse(data=None, status_code=401)
+
+            return mock_check_status_result(url, *args, **kwargs)
+
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": mock_reports1["data"]},
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = mock_unauthorized_tenant1
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["short_circuit"] = 2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertIsNone(webapi.host_error)
+        self.assertEqual(
+            results, {
+                "TENANT1": {
+                    "REPORTS_EXCEPTION": "CRITICAL - auth error for 2 "
+                                         "report(s) of tenant TENANT1, 1 "
+                                         "not checked: Error has occurred"
+                },
+                "TENANT2": {
+                    "results": {
+                        "CORE": "OK"
+                    },
+                    "performance": {
+                        "CORE": {
+                            "time": 0.3827,
+                            "size": len(json.dumps(mock_status_results21))
+                        }
+                    }
+                }
+            }
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    def test_check_status_results_short_circuit_fetching_reports(
+            self, mock_get, mock_today, mock_sleep
+    ):
+        mock_get.side_effect = requests.exceptions.ConnectionError(
+            "Connection refused"
+        )
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["short_circuit"] = 1
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        mock_get.assert_called_once()
+        self.assertEqual(results, dict())
+        self.assertEqual(
+            webapi.host_error,
+            "Web-API host api.devel.argo.grnet.gr unavailable: connect error "
+            "for 1 tenant(s), 1 not checked: Connection refused"
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_short_circuit_not_systemic(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": mock_reports1["data"]},
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = [
+            requests.exceptions.ConnectionError("Connection refused"),
+            MockResponse(data=mock_status_results12, status_code=200),
+            requests.exceptions.ConnectionError("Connection refused"),
+            MockResponse(data=None, status_code=500)
+        ]
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["short_circuit"] = 2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertIsNone(webapi.host_error)
+        self.assertEqual(len(results["TENANT1"]["results"]), 3)
+        self.assertEqual(
+            webapi.error_classes, {
+                ("TENANT1", "REPORT1"): ("connect", "Connection refused"),
+                ("TENANT1", "TEST-REPORT3"): (
+                    "connect", "Connection refused"
+                ),
+                ("TENANT2", "CORE"): ("server", "Error has occurred")
+            }
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_short_circuit_server_error(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": mock_reports1["data"]},
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.return_value = MockResponse(data=None, status_code=503)
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["short_circuit"] = 2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        webapi.check()
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(
+            webapi.host_error,
+            "Web-API host api.devel.argo.grnet.gr unavailable: server error "
+            "for 2 report(s), 2 not checked: Error has occurred"
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_short_circuit_decode_error(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        class InvalidJSONResponse(MockResponse):
+            def json(self):
+                raise json.JSONDecodeError("Expecting value", "<html>", 0)
+
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": mock_reports1["data"]},
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.return_value = InvalidJSONResponse(
+            data=None, status_code=200
+        )
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["short_circuit"] = 2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        webapi.check()
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(
+            webapi.host_error,
+            "Web-API host api.devel.argo.grnet.gr unavailable: decode error "
+            "for 2 report(s), 2 not checked: JSON decode error"
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_short_circuit_invalid_results(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        def mock_invalid_tenant1(url, *args, **kwargs):
+            if kwargs["headers"]["x-api-key"] == "tenant1-token":
+                return MockResponse(
+                    data=mock_wrong_status_results12, status_code=200
+                )
+
+            return mock_check_status_result(url, *args, **kwargs)
+
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": mock_reports1["data"]},
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = mock_invalid_tenant1
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["short_circuit"] = 2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertIsNone(webapi.host_error)
+        self.assertEqual(
+            results["TENANT1"], {
+                "REPORTS_EXCEPTION": "CRITICAL - invalid error for 2 "
+                                     "report(s) of tenant TENANT1, 1 not "
+                                     "checked: Unable to retrieve status "
+                                     "from report REPORT1"
+            }
+        )
+        self.assertEqual(results["TENANT2"]["results"], {"CORE": "OK"})
+
+    def test_classify_verdict(self):
+        self.assertEqual(
+            classify_verdict(
+                "ar", "REPORT1", "CRITICAL - JSON decode error"
+            ), "decode"
+        )
+        self.assertEqual(
+            classify_verdict(
+                "ar", "REPORT1", "CRITICAL - Unable to retrieve availability "
+                                 "from report REPORT1"
+            ), "invalid"
+        )
+        self.assertIsNone(classify_verdict("status", "REPORT1", "OK"))
+        self.assertIsNone(classify_verdict("status", "REPORT1", None))
+
+    def test_classify_error(self):
+        response = requests.models.Response()
+        response.status_code = 403
+        self.assertEqual(
+            classify_error(requests.exceptions.HTTPError(
+                "403 Client Error", response=response
+            )), "auth"
+        )
+        self.assertEqual(
+            classify_error(requests.exceptions.RequestException(), 401),
+            "auth"
+        )
+        self.assertEqual(
+            classify_error(requests.exceptions.RequestException(), 404),
+            "client"
+        )
+        self.assertEqual(
+            classify_error(requests.exceptions.RequestException(), 502),
+            "server"
+        )
+        self.assertEqual(
+            classify_error(PhaseTimeoutException("download", 5), 200),
+            "timeout"
+        )
+        self.assertEqual(
+            classify_error(requests.exceptions.ConnectTimeout()), "timeout"
+        )
+        self.assertEqual(
+            classify_error(requests.exceptions.SSLError(
+                "certificate verify failed"
+            )), "tls"
+        )
+        self.assertEqual(
+            classify_error(requests.exceptions.ConnectionError(
+                "Connection refused"
+            )), "connect"
+        )
+        try:
+            try:
+                raise socket.gaierror(-2, "Name or service not known")
+
+            except socket.gaierror:
+                raise urllib3.exceptions.NewConnectionError(
+                    None, "Failed to resolve 'api.devel.argo.grnet.gr'"
+                )
+
+        except urllib3.exceptions.NewConnectionError as e:
+            error = requests.exceptions.ConnectionError(
+                urllib3.exceptions.MaxRetryError(None, "/", reason=e)
+            )
+
+        self.assertEqual(classify_error(error), "dns")
+        self.assertEqual(
+            classify_error(requests.exceptions.JSONDecodeError(
+                "Expecting value", "<html>", 0
+            )), "decode"
+        )
+        self.assertEqual(
+            classify_error(requests.exceptions.InvalidURL()), "request"
+        )
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_fair(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": mock_reports1["data"]},
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = mock_check_status_result
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["fair"] = True
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(
+            [item[0][0].split("/")[6] for item in mock_get.call_args_list],
+            ["REPORT1", "CORE", "REPORT2", "TEST-REPORT3"]
+        )
+        self.assertEqual(
+            list(results["TENANT1"]["results"].keys()),
+            ["REPORT1", "REPORT2", "TEST-REPORT3"]
+        )
+        self.assertEqual(
+            sorted(webapi.stats.keys()), [
+                "TENANT1::wait", "TENANT1::wait_max", "TENANT2::wait",
+                "TENANT2::wait_max"
+            ]
+        )
+        for value in webapi.stats.values():
+            self.assertRegex(value, r"^\d+\.\d{6}s$")
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.get_today")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    @patch("argo_probe_webapi.web_api.WebAPIReports._get_reports")
+    def test_check_status_results_with_tenant_concurrency(
+            self, mock_get_reports, mock_get, mock_today, mock_sleep
+    ):
+        lock = threading.Lock()
+        running = collections.Counter()
+        peaks = collections.Counter()
+        release = threading.Event()
+
+        def mock_counted_status_result(url, *args, **kwargs):
+            tenant = kwargs["headers"]["x-api-key"]
+            with lock:
+                running[tenant] += 1
+                peaks[tenant] = max(peaks[tenant], running[tenant])
+
+            release.wait(0.05)
+            with lock:
+                running[tenant] -= 1
+
+            return mock_check_status_result(url, *args, **kwargs)
+
+        mock_get_reports.return_value = {
+            "TENANT1": {"data": mock_reports1["data"]},
+            "TENANT2": {"data": mock_reports2["data"]}
+        }
+        mock_get.side_effect = mock_counted_status_result
+        mock_today.return_value = datetime.datetime(2024, 2, 5, 15, 33, 24)
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["concurrency"] = 4
+        arguments["tenant_concurrency"] = ["1", "TENANT2=2"]
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(
+            peaks, {"tenant1-token": 1, "tenant2-token": 1}
+        )
+        self.assertEqual(webapi.tenant_caps, {None: 1, "TENANT2": 2})
+        self.assertEqual(
+            list(results["TENANT1"]["results"].values()), ["OK", "OK", "OK"]
+        )
+        self.assertIn("TENANT1::wait_max", webapi.stats)
+
+    def test_invalid_tenant_concurrency(self):
+        arguments = self.arguments.copy()
+        arguments["tenant_concurrency"] = ["TENANT1=many"]
+        with self.assertRaises(WebAPIReportsException) as context:
+            WebAPIReports(SimpleNamespace(**arguments))
+
+        self.assertEqual(
+            str(context.exception), "Invalid tenant concurrency: TENANT1=many"
+        )
+
+    def test_negative_tenant_concurrency(self):
+        arguments = self.arguments.copy()
+        arguments["tenant_concurrency"] = ["2", "TENANT1=-1"]
+        with self.assertRaises(WebAPIReportsException) as context:
+            WebAPIReports(SimpleNamespace(**arguments))
+
+        self.assertEqual(
+            str(context.exception), "Invalid tenant concurrency: TENANT1=-1"
+        )
+
+    def test_dispatch_stops_when_no_report_can_be_started(self):
+        arguments = self.arguments.copy()
+        arguments["concurrency"] = 2
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        webapi.tenant_caps = {"TENANT1": -1}
+        jobs = [("TENANT1", report) for report in mock_reports1["data"]]
+        outcomes = webapi._dispatch(jobs, "status", "2024-02-04", None)
+        self.assertEqual(outcomes, dict())
+        self.assertEqual(webapi.stats["unchecked"], "3")
+
+    def test_report_queue_fair(self):
+        jobs = [
+            ("TENANT1", "REPORT1"), ("TENANT1", "REPORT2"),
+            ("TENANT1", "REPORT3"), ("TENANT2", "CORE"),
+            ("TENANT3", "REPORT1")
+        ]
+        pending = ReportQueue(jobs, fair=True)
+        self.assertEqual(len(pending), 5)
+        order = list()
+        while pending:
+            job, attempt = pending.get()
+            order.append(job)
+            pending.done(job[0])
+            if job == ("TENANT2", "CORE") and attempt == 1:
+                pending.put(job, 2)
+
+        self.assertEqual(
+            order, [
+                ("TENANT1", "REPORT1"), ("TENANT2", "CORE"),
+                ("TENANT3", "REPORT1"), ("TENANT1", "REPORT2"),
+                ("TENANT2", "CORE"), ("TENANT1", "REPORT3")
+            ]
+        )
+
+    def test_report_queue_caps(self):
+        jobs = [
+            ("TENANT1", "REPORT1"), ("TENANT1", "REPORT2"),
+            ("TENANT1", "REPORT3"), ("TENANT2", "CORE")
+        ]
+        pending = ReportQueue(jobs, caps={None: 1, "TENANT1": 2})
+        self.assertEqual(pending.get(), (("TENANT1", "REPORT1"), 1))
+        self.assertEqual(pending.get(), (("TENANT1", "REPORT2"), 1))
+        self.assertEqual(pending.get(), (("TENANT2", "CORE"), 1))
+        self.assertIsNone(pending.get())
+        pending.done("TENANT1")
+        self.assertEqual(pending.get(), (("TENANT1", "REPORT3"), 1))
+        self.assertEqual(len(pending), 0)
+        pending.put(("TENANT2", "CORE"), 2)
+        self.assertEqual(pending.drop("TENANT2"), 1)
+        self.assertEqual(pending.drop("TENANT3"), 0)
+        self.assertFalse(pending)
+
+    def test_check_status_results_with_warm_up(self):
+        server = MockWebAPI({
+            "TENANT1": {
+                "token": "tenant1-token",
+                "reports": ["REPORT1", "REPORT2", "REPORT3"]
+            },
+            "TENANT2": {"token": "tenant2-token", "reports": ["CORE"]}
+        })
+        server.start()
+        try:
+            arguments = self.arguments.copy()
+            arguments["hostname"] = server.hostname
+            arguments["buffer_time"] = 0
+            arguments["concurrency"] = 3
+            arguments["warm_up"] = True
+            with patch.dict(
+                    os.environ, {"REQUESTS_CA_BUNDLE": server.ca_file}
+            ):
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+                results = webapi.check()
+
+        finally:
+            server.stop()
+
+        self.assertEqual(
+            results["TENANT1"]["results"],
+            {"REPORT1": "OK", "REPORT2": "OK", "REPORT3": "OK"}
+        )
+        self.assertEqual(results["TENANT2"]["results"], {"CORE": "OK"})
+        self.assertEqual(server.connections, 3)
+        self.assertEqual(webapi.stats["warm_connections"], "3;;;0;3")
+        self.assertRegex(webapi.stats["warm_up"], r"^\d+\.\d{6}s$")
+
+    @patch("argo_probe_webapi.web_api.socket.getaddrinfo")
+    @patch("argo_probe_webapi.web_api.time.monotonic")
+    def test_dns_cache(self, mock_monotonic, mock_getaddrinfo):
+        mock_getaddrinfo.side_effect = [
+            [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 443))],
+            [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.2", 443))],
+            [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.3", 80))]
+        ]
+        mock_monotonic.side_effect = [100., 130., 161., 170.]
+        cache = DNSCache(ttl=60)
+        first = cache.resolve("api.devel.argo.grnet.gr", 443)
+        self.assertEqual(
+            cache.resolve("api.devel.argo.grnet.gr", 443), first
+        )
+        self.assertEqual(
+            cache.resolve("api.devel.argo.grnet.gr", 443)[0][4][0],
+            "10.0.0.2"
+        )
+        self.assertEqual(
+            cache.resolve("api.devel.argo.grnet.gr", 80)[0][4][0],
+            "10.0.0.3"
+        )
+        self.assertEqual(mock_getaddrinfo.call_count, 3)
+
+    def test_check_status_results_with_tls_session_reuse(self):
+        server = MockWebAPI({
+            "TENANT1": {
+                "token": "tenant1-token",
+                "reports": ["REPORT1", "REPORT2", "REPORT3"]
+            },
+            "TENANT2": {"token": "tenant2-token", "reports": ["CORE"]}
+        })
+        server.start()
+        try:
+            arguments = self.arguments.copy()
+            arguments["hostname"] = server.hostname
+            arguments["buffer_time"] = 0
+            arguments["concurrency"] = 3
+            arguments["tls_session_reuse"] = True
+            with patch.dict(
+                    os.environ, {"REQUESTS_CA_BUNDLE": server.ca_file}
+            ):
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+                results = webapi.check()
+
+        finally:
+            server.stop()
+
+        self.assertEqual(
+            results["TENANT1"]["results"],
+            {"REPORT1": "OK", "REPORT2": "OK", "REPORT3": "OK"}
+        )
+        self.assertEqual(results["TENANT2"]["results"], {"CORE": "OK"})
+        self.assertGreater(server.connections, 1)
+        self.assertEqual(webapi.stats["tls_full"], "1c")
+        self.assertEqual(
+            webapi.stats["tls_resumed"], f"{server.connections - 1}c"
+        )
+
+    def test_check_status_results_with_tls_session_reuse_and_warm_up(self):
+        server = MockWebAPI({
+            "TENANT1": {
+                "token": "tenant1-token",
+                "reports": ["REPORT1", "REPORT2", "REPORT3"]
+            },
+            "TENANT2": {"token": "tenant2-token", "reports": ["CORE"]}
+        })
+        server.start()
+        try:
+            arguments = self.arguments.copy()
+            arguments["hostname"] = server.hostname
+            arguments["buffer_time"] = 0
+            arguments["concurrency"] = 3
+            arguments["tls_session_reuse"] = True
+            arguments["warm_up"] = True
+            with patch.dict(
+                    os.environ, {"REQUESTS_CA_BUNDLE": server.ca_file}
+            ):
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+                results = webapi.check()
+
+        finally:
+            server.stop()
+
+        self.assertEqual(
+            results["TENANT1"]["results"],
+            {"REPORT1": "OK", "REPORT2": "OK", "REPORT3": "OK"}
+        )
+        self.assertEqual(results["TENANT2"]["results"], {"CORE": "OK"})
+        self.assertEqual(server.connections, 3)
+        self.assertEqual(webapi.stats["warm_connections"], "3;;;0;3")
+        self.assertEqual(webapi.stats["tls_full"], "1c")
+        self.assertEqual(webapi.stats["tls_resumed"], "2c")
+
+    def test_check_status_results_with_urllib3_transport(self):
+        server = MockWebAPI({
+            "TENANT1": {
+                "token": "tenant1-token",
+                "reports": ["REPORT1", "REPORT2", "REPORT3"]
+            },
+            "TENANT2": {"token": "tenant2-token", "reports": ["CORE"]}
+        })
+        server.start()
+        try:
+            arguments = self.arguments.copy()
+            arguments["hostname"] = server.hostname
+            arguments["buffer_time"] = 0
+            arguments["concurrency"] = 2
+            arguments["transport"] = "urllib3"
+            arguments["phase_timing"] = True
+            arguments["warm_up"] = True
+            with patch.dict(
+                    os.environ, {"REQUESTS_CA_BUNDLE": server.ca_file}
+            ):
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+                results = webapi.check()
+
+        finally:
+            server.stop()
+
+        self.assertEqual(
+            results["TENANT1"]["results"],
+            {"REPORT1": "OK", "REPORT2": "OK", "REPORT3": "OK"}
+        )
+        self.assertEqual(results["TENANT2"]["results"], {"CORE": "OK"})
+        self.assertEqual(server.connections, 2)
+        self.assertEqual(webapi.stats["warm_connections"], "2;;;0;2")
+        for performance in results["TENANT1"]["performance"].values():
+            self.assertEqual(
+                sorted(performance["phases"].keys()),
+                ["connect", "dns", "download", "tls", "wait"]
+            )
+            self.assertGreater(performance["size"], 0)
+
+    def test_urllib3_transport_errors(self):
+        server = MockWebAPI({
+            "TENANT1": {"token": "tenant1-token", "reports": ["REPORT1"]}
+        })
+        server.start()
+        arguments = self.arguments.copy()
+        arguments["transport"] = "urllib3"
+        try:
+            with patch.dict(
+                    os.environ, {"REQUESTS_CA_BUNDLE": server.ca_file}
+            ):
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+
+            url = f"https://{server.hostname}/api/v2/reports"
+            response, dispatched, phases = webapi._get(url, "wrong-token")
+            with self.assertRaises(
+                    requests.exceptions.HTTPError
+            ) as context:
+                response.raise_for_status()
+
+        finally:
+            server.stop()
+
+        self.assertEqual(classify_error(context.exception), "auth")
+        self.assertTrue(str(context.exception).startswith(
+            "401 Client Error: Unauthorized for url: "
+        ))
+        webapi.transport.close()
+        with self.assertRaises(
+                requests.exceptions.ConnectionError
+        ) as context:
+            webapi._get(url, "tenant1-token")
+
+        self.assertEqual(classify_error(context.exception), "connect")
+
+    def test_urllib3_transport_accept_encoding(self):
+        arguments = self.arguments.copy()
+        arguments["transport"] = "urllib3"
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        with patch.object(
+                webapi.transport.manager, "request",
+                side_effect=urllib3.exceptions.ProtocolError("closed")
+        ) as mock_request:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                webapi._get("https://api.devel.argo.grnet.gr", "token")
+
+        self.assertEqual(
+            mock_request.call_args.kwargs["headers"]["Accept-Encoding"],
+            ACCEPT_ENCODING
+        )
+
+    def _check_with_http2_transport(self, http2):
+        server = MockWebAPI({
+            "TENANT1": {
+                "token": "tenant1-token",
+                "reports": ["REPORT1", "REPORT2", "REPORT3"]
+            },
+            "TENANT2": {"token": "tenant2-token", "reports": ["CORE"]}
+        }, delays={
+            ("TENANT1", "REPORT1"): 0.2,
+            ("TENANT1", "REPORT2"): 0.2,
+            ("TENANT1", "REPORT3"): 0.2,
+            ("TENANT2", "CORE"): 0.2
+        }, http2=http2)
+        server.start()
+        try:
+            arguments = self.arguments.copy()
+            arguments["hostname"] = server.hostname
+            arguments["buffer_time"] = 0
+            arguments["concurrency"] = 4
+            arguments["transport"] = "http2"
+            with patch.dict(
+                    os.environ, {"REQUESTS_CA_BUNDLE": server.ca_file}
+            ):
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+                start = time.monotonic()
+                results = webapi.check()
+                elapsed = time.monotonic() - start
+
+        finally:
+            server.stop()
+
+        self.assertEqual(
+            results["TENANT1"]["results"],
+            {"REPORT1": "OK", "REPORT2": "OK", "REPORT3": "OK"}
+        )
+        self.assertEqual(results["TENANT2"]["results"], {"CORE": "OK"})
+        self.assertLess(elapsed, 0.6)
+        return server, webapi
+
+    @unittest.skipUnless(HTTP2, "httpx and h2 are required for HTTP/2")
+    def test_check_status_results_with_http2_transport(self):
+        server, webapi = self._check_with_http2_transport(http2=True)
+        self.assertEqual(server.connections, 1)
+        self.assertEqual(server.streams, 6)
+        self.assertEqual(webapi.stats["http2_responses"], "6c")
+        self.assertEqual(webapi.stats["http1_responses"], "0c")
+
+    @unittest.skipUnless(HTTP2, "httpx and h2 are required for HTTP/2")
+    def test_check_status_results_with_http2_transport_fallback(self):
+        server, webapi = self._check_with_http2_transport(http2=False)
+        self.assertGreater(server.connections, 1)
+        self.assertEqual(server.streams, 0)
+        self.assertEqual(webapi.stats["http2_responses"], "0c")
+        self.assertEqual(webapi.stats["http1_responses"], "6c")
+
+    @unittest.skipUnless(HTTP2, "httpx and h2 are required for HTTP/2")
+    def test_http2_transport_unsupported_options(self):
+        for option, value in [
+            ("phase_timing", True), ("warm_up", True),
+            ("download_timeout", 5.)
+        ]:
+            arguments = self.arguments.copy()
+            arguments["transport"] = "http2"
+            arguments[option] = value
+            with self.assertRaises(WebAPIReportsException) as context:
+                WebAPIReports(SimpleNamespace(**arguments))
+
+            self.assertEqual(
+                str(context.exception),
+                "Phase timing, warm-up and download timeout are not "
+                "supported with HTTP/2 transport"
+            )
+
+    @patch("argo_probe_webapi.web_api.importlib.util.find_spec")
+    def test_http2_transport_without_httpx(self, mock_find_spec):
+        mock_find_spec.return_value = None
+        arguments = self.arguments.copy()
+        arguments["transport"] = "http2"
+        with self.assertRaises(WebAPIReportsException) as context:
+            WebAPIReports(SimpleNamespace(**arguments))
+
+        self.assertEqual(
+            str(context.exception), "HTTP/2 transport requires httpx package"
+        )
+
+    def test_check_synthetic_tenants_with_errors(self):
+        server = MockWebAPI(
+            synthetic_tenants(2, 10), latency=latency_distribution(
+                "uniform:0:0.01"
+            ), error_rate=0.5, payload_size=10000, seed=1
+        )
+        server.start()
+        try:
+            arguments = self.arguments.copy()
+            arguments["hostname"] = server.hostname
+            arguments["buffer_time"] = 0
+            arguments["concurrency"] = 4
+            arguments["preflight"] = True
+            with patch.dict(
+                    os.environ, {"REQUESTS_CA_BUNDLE": server.ca_file}
+            ):
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+                results = webapi.check()
+
+        finally:
+            server.stop()
+
+        self.assertEqual(server.requests, 23)
+        self.assertGreater(server.errors, 0)
+        self.assertLess(server.errors, 20)
+        self.assertIsNone(webapi.host_error)
+        verdicts = [
+            verdict for tenant in ["TENANT1", "TENANT2"]
+            for verdict in results[tenant]["results"].values()
+        ]
+        self.assertEqual(verdicts.count("OK"), 20 - server.errors)
+        for name, performance in results["TENANT1"]["performance"].items():
+            if results["TENANT1"]["results"][name] == "OK":
+                self.assertGreater(performance["size"], 8000)
+                self.assertLess(performance["size"], 12000)
+
+    @patch("argo_probe_webapi.web_api.time.sleep")
+    @patch("argo_probe_webapi.web_api.requests.get")
+    def test_check_large_tenants(self, mock_get, mock_sleep):
+        generator = PayloadGenerator(seed=1, groups=2, endpoints=5)
+        names = [f"REPORT{i + 1}" for i in range(1000)]
+        tenants = {"tenant1-token": "TENANT1", "tenant2-token": "TENANT2"}
+
+        def mock_generated_result(url, *args, **kwargs):
+            tenant = tenants[kwargs["headers"]["x-api-key"]]
+            if url.endswith("/api/v2/reports"):
+                return MockResponse(
+                    data=generator.reports(tenant, names), status_code=200
+                )
+
+            name, group_type = url.split("?")[0].split("/")[-2:]
+            return MockResponse(
+                data=generator.status_results(tenant, name, group_type),
+                status_code=200
+            )
+
+        mock_get.side_effect = mock_generated_result
+        mock_sleep.side_effect = mock_function
+        arguments = self.arguments.copy()
+        arguments["concurrency"] = 8
+        webapi = WebAPIReports(SimpleNamespace(**arguments))
+        results = webapi.check()
+        for tenant in ["TENANT1", "TENANT2"]:
+            self.assertEqual(
+                results[tenant]["results"],
+                dict((name, "OK") for name in names)
+            )
+
+    def _check_with_faults(self, faults, **kwargs):
+        server = MockWebAPI(
+            synthetic_tenants(1, 3),
+            scenario=FaultScenario("test", faults)
+        )
+        server.start()
+        try:
+            arguments = self.arguments.copy()
+            arguments["hostname"] = server.hostname
+            arguments["tenant_token"] = [["TENANT1:tenant1-token"]]
+            arguments["buffer_time"] = 0
+            arguments.update(kwargs)
+            with patch.dict(
+                    os.environ, {"REQUESTS_CA_BUNDLE": server.ca_file}
+            ):
+                webapi = WebAPIReports(SimpleNamespace(**arguments))
+                results = webapi.check()
+
+        finally:
+            server.stop()
+
+        return results["TENANT1"]["results"]
+
+    def test_check_with_truncated_json(self):
+        results = self._check_with_faults([
+            {"route": "status", "report": "REPORT1", "truncate": 0.5}
+        ])
+        self.assertEqual(results, {
+            "REPORT1": "CRITICAL - JSON decode error",
+            "REPORT2": "OK",
+            "REPORT3": "OK"
+        })
+
+    def test_check_with_connection_cut_mid_body(self):
+        results = self._check_with_faults([
+            {"route": "status", "report": "REPORT2", "cut": 0.5}
+        ])
+        self.assertEqual(results["REPORT1"], "OK")
+        self.assertTrue(results["REPORT2"].startswith(
+            "CRITICAL - Unable to retrieve status for report REPORT2: "
+        ))
+        self.assertEqual(results["REPORT3"], "OK")
+
+    def test_check_with_drip_fed_body(self):
+        results = self._check_with_faults([
+            {
+                "route": "status", "report": "REPORT3",
+                "drip": {"chunk": 8, "interval": 0.1}
+            }
+        ], download_timeout=0.5)
+        self.assertEqual(results["REPORT1"], "OK")
+        self.assertEqual(results["REPORT2"], "OK")
+        self.assertEqual(
+            results["REPORT3"],
+            "CRITICAL - Unable to retrieve status for report REPORT3: "
+            "download timed out after 0.5 s"
+        )
+
+    def test_check_with_rate_limiting(self):
+        results = self._check_with_faults([
+            {
+                "route": "status", "report": "REPORT1", "times": 1,
+                "status": 429, "retry_after": 0.1
+            }
+        ], adaptive=True)
+        self.assertEqual(
+            results, {"REPORT1": "OK", "REPORT2": "OK", "REPORT3": "OK"}
+        )
+        results = self._check_with_faults([
+            {"route": "status", "report": "REPORT1", "status": 503}
+        ])
+        self.assertTrue(results["REPORT1"].startswith(
+            "CRITICAL - Unable to retrieve status for report REPORT1: "
+            "503 Server Error: Service Unavailable for url: "
+        ))
+
+
+class StatusTests(unittest.TestCase):
+    def test_ok_ar_reports(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "OK",
+                    "REPORT3": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
+            },
+            "TENANT2": {
+                "results": {
+                    "REPORT4": "OK",
+                    "REPORT5": "OK"
+                },
+                "performance": {
+                    "REPORT4": {
+                        "time": 0.079089,
+                        "size": 17968
+                    },
+                    "REPORT5": {
+                        "time": 0.565367,
+                        "size": 54741
+                    }
+                }
+            },
+            "TENANT3": {
+                "results": {
+                    "REPORT6": "OK"
+                },
+                "performance": {
+                    "REPORT6": {
+                        "time": 0.204673,
+                        "size": 54893
+                    }
+                }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=0)
+        self.assertEqual(
+            status.get_message(),
+            "OK - AR results available for all tenants and reports"
+            "|time=0.565367s;size=54741B"
+        )
+        self.assertEqual(status.get_code(), 0)
+
+    def test_ok_ar_reports_verbose(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "OK",
+                    "REPORT3": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
+            },
+            "TENANT2": {
+                "results": {
+                    "REPORT4": "OK",
+                    "REPORT5": "OK"
+                },
+                "performance": {
+                    "REPORT4": {
+                        "time": 0.079089,
+                        "size": 17968
+                    },
+                    "REPORT5": {
+                        "time": 0.565367,
+                        "size": 54741
+                    }
+                }
+            },
+            "TENANT3": {
+                "results": {
+                    "REPORT6": "OK"
+                },
+                "performance": {
+                    "REPORT6": {
+                        "time": 0.204673,
+                        "size": 54893
+                    }
+                }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=1)
+        self.assertEqual(
+            status.get_message(),
+            "OK - AR results available for all tenants and reports"
+            "|time=0.565367s;size=54741B\n"
+            "TENANT1:\n"
+            "AR for report REPORT1 - OK\n"
+            "AR for report REPORT2 - OK\n"
+            "AR for report REPORT3 - OK\n\n"
+            "TENANT2:\n"
+            "AR for report REPORT4 - OK\n"
+            "AR for report REPORT5 - OK\n\n"
+            "TENANT3:\n"
+            "AR for report REPORT6 - OK"
+        )
+        self.assertEqual(status.get_code(), 0)
+
+    def test_ok_ar_reports_single_tenant(self):
+        results = {
+            "TENANT": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "OK",
+                    "REPORT3": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=0)
+        self.assertEqual(
+            status.get_message(),
+            "OK - AR results available for all reports"
+            "|time=0.210245s;size=5987B"
+        )
+        self.assertEqual(status.get_code(), 0)
+
+    def test_ok_ar_reports_single_tenant_verbose(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "OK",
+                    "REPORT3": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=1)
+        self.assertEqual(
+            status.get_message(),
+            "OK - AR results available for all reports"
+            "|time=0.210245s;size=5987B\n"
+            "AR for report REPORT1 - OK\n"
+            "AR for report REPORT2 - OK\n"
+            "AR for report REPORT3 - OK"
+        )
+        self.assertEqual(status.get_code(), 0)
+
+    def test_error_fetching_all_reports_for_ar_reports(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve availability for "
+                               "report REPORT2",
+                    "REPORT3": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
+            },
+            "TENANT2": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            },
+            "TENANT3": {
+                "results": {
+                    "REPORT4": "OK",
+                    "REPORT5": "OK"
+                },
+                "performance": {
+                    "REPORT4": {
+                        "time": 0.079089,
+                        "size": 17968
+                    },
+                    "REPORT5": {
+                        "time": 0.565367,
+                        "size": 54741
+                    }
+                }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=0)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem with AR results for report(s) REPORT2 for "
+            "tenant TENANT1; problem fetching all reports for tenant(s) "
+            "TENANT2|time=0.565367s;size=54741B"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_error_fetching_all_reports_for_ar_reports_verbose(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve availability for "
+                               "report REPORT2",
+                    "REPORT3": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
+            },
+            "TENANT2": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            },
+            "TENANT3": {
+                "results": {
+                    "REPORT4": "OK",
+                    "REPORT5": "OK"
+                },
+                "performance": {
+                    "REPORT4": {
+                        "time": 0.079089,
+                        "size": 17968
+                    },
+                    "REPORT5": {
+                        "time": 0.565367,
+                        "size": 54741
+                    }
+                }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=1)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem with AR results for report(s) REPORT2 for "
+            "tenant TENANT1; problem fetching all reports for tenant(s) "
+            "TENANT2|time=0.565367s;size=54741B\n"
+            "TENANT1:\n"
+            "AR for report REPORT1 - OK\n"
+            "AR for report REPORT2 - CRITICAL - Unable to retrieve "
+            "availability for report REPORT2\n"
+            "AR for report REPORT3 - OK\n\n"
+            "TENANT2:\n"
+            "CRITICAL - Error fetching reports\n\n"
+            "TENANT3:\n"
+            "AR for report REPORT4 - OK\n"
+            "AR for report REPORT5 - OK"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_error_fetching_all_reports_for_ar_reports_single_tenant(self):
+        results = {
+            "TENANT": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=0)
+        self.assertEqual(
+            status.get_message(), "CRITICAL - Problem fetching all reports"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_error_fetching_all_reports_for_ar_reports_single_tenant_verbose(
+            self
+    ):
+        results = {
+            "TENANT": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=1)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem fetching all reports\n"
+            "CRITICAL - Error fetching reports"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_multiple_errors_fetching_all_reports_for_ar_reports(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "OK",
+                    "REPORT3": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
+            },
+            "TENANT2": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            },
+            "TENANT3": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports for "
+                                     "tenant TENANT3: 401 Unauthorized"
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=0)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem fetching all reports for tenant(s) TENANT2, "
+            "TENANT3|time=0.210245s;size=5987B"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_multiple_errors_fetching_all_reports_for_ar_reports_verbose(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "OK",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -2543,26 +5248,178 @@ class StatusTests(unittest.TestCase):
                         "size": 10413
                     }
                 }
+            },
+            "TENANT2": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            },
+            "TENANT3": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports for "
+                                     "tenant TENANT3: 401 Unauthorized"
             }
         }
         status = Status(rtype="ar", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "OK - AR results available for all reports"
-            "|time=0.210245s;size=5987B\n"
+            "CRITICAL - Problem fetching all reports for tenant(s) "
+            "TENANT2, TENANT3|time=0.210245s;size=5987B\n"
+            "TENANT1:\n"
             "AR for report REPORT1 - OK\n"
             "AR for report REPORT2 - OK\n"
-            "AR for report REPORT3 - OK"
+            "AR for report REPORT3 - OK\n\n"
+            "TENANT2:\n"
+            "CRITICAL - Error fetching reports\n\n"
+            "TENANT3:\n"
+            "CRITICAL - Error fetching reports for tenant TENANT3: 401 "
+            "Unauthorized"
         )
-        self.assertEqual(status.get_code(), 0)
+        self.assertEqual(status.get_code(), 2)
 
-    def test_error_fetching_all_reports_for_ar_reports(self):
+    def test_error_with_ar_reports(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability for "
-                               "report REPORT2",
+                    "REPORT2": "CRITICAL - Unable to retrieve availability "
+                               "from report REPORT2",
+                    "REPORT3": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
+            },
+            "TENANT2": {
+                "results": {
+                    "REPORT4": "OK",
+                    "REPORT5": "OK"
+                },
+                "performance": {
+                    "REPORT4": {
+                        "time": 0.079089,
+                        "size": 17968
+                    },
+                    "REPORT5": {
+                        "time": 0.565367,
+                        "size": 54741
+                    }
+                }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=0)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem with AR results for report(s) REPORT2 for "
+            "tenant TENANT1|time=0.565367s;size=54741B"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_error_with_ar_reports_verbose(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve availability "
+                               "for report REPORT2",
+                    "REPORT3": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
+            },
+            "TENANT2": {
+                "results": {
+                    "REPORT4": "OK",
+                    "REPORT5": "OK"
+                },
+                "performance": {
+                    "REPORT4": {
+                        "time": 0.079089,
+                        "size": 17968
+                    },
+                    "REPORT5": {
+                        "time": 0.565367,
+                        "size": 54741
+                    }
+                }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=1)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem with AR results for report(s) REPORT2 for "
+            "tenant TENANT1|time=0.565367s;size=54741B\n"
+            "TENANT1:\n"
+            "AR for report REPORT1 - OK\n"
+            "AR for report REPORT2 - CRITICAL - Unable to retrieve "
+            "availability for report REPORT2\n"
+            "AR for report REPORT3 - OK\n\n"
+            "TENANT2:\n"
+            "AR for report REPORT4 - OK\n"
+            "AR for report REPORT5 - OK"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_error_with_ar_reports_single_tenant(self):
+        results = {
+            "TENANT": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve availability "
+                               "from report REPORT2",
+                    "REPORT3": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=0)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem with AR results for report(s) REPORT2"
+            "|time=0.210245s;size=5987B"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_error_with_ar_reports_single_tenant_verbose(self):
+        results = {
+            "TENANT": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve availability "
+                               "for report REPORT2",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -2579,13 +5436,47 @@ class StatusTests(unittest.TestCase):
                         "size": 10413
                     }
                 }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=1)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem with AR results for report(s) REPORT2"
+            "|time=0.210245s;size=5987B\n"
+            "AR for report REPORT1 - OK\n"
+            "AR for report REPORT2 - CRITICAL - Unable to retrieve "
+            "availability for report REPORT2\n"
+            "AR for report REPORT3 - OK"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_multitple_errors_with_ar_reports(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve availability "
+                               "from report REPORT2",
+                    "REPORT3": "CRITICAL - BAD REQUEST"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
             },
             "TENANT2": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
-            },
-            "TENANT3": {
                 "results": {
-                    "REPORT4": "OK",
+                    "REPORT4": "CRITICAL - Unable to retrieve availability",
                     "REPORT5": "OK"
                 },
                 "performance": {
@@ -2603,20 +5494,20 @@ class StatusTests(unittest.TestCase):
         status = Status(rtype="ar", data=results, verbosity=0)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT2 for "
-            "tenant TENANT1; problem fetching all reports for tenant(s) "
-            "TENANT2|time=0.565367s;size=54741B"
+            "CRITICAL - Problem with AR results for report(s) REPORT2, REPORT3 "
+            "for tenant TENANT1; report(s) REPORT4 for tenant TENANT2"
+            "|time=0.565367s;size=54741B"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_error_fetching_all_reports_for_ar_reports_verbose(self):
+    def test_multiple_errors_with_ar_reports_verbose(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability for "
-                               "report REPORT2",
-                    "REPORT3": "OK"
+                    "REPORT2": "CRITICAL - Unable to retrieve availability "
+                               "for report REPORT2",
+                    "REPORT3": "CRITICAL - BAD REQUEST"
                 },
                 "performance": {
                     "REPORT1": {
@@ -2634,11 +5525,8 @@ class StatusTests(unittest.TestCase):
                 }
             },
             "TENANT2": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
-            },
-            "TENANT3": {
                 "results": {
-                    "REPORT4": "OK",
+                    "REPORT4": "CRITICAL - Unable to retrieve availability",
                     "REPORT5": "OK"
                 },
                 "performance": {
@@ -2656,57 +5544,29 @@ class StatusTests(unittest.TestCase):
         status = Status(rtype="ar", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT2 for "
-            "tenant TENANT1; problem fetching all reports for tenant(s) "
-            "TENANT2|time=0.565367s;size=54741B\n"
+            "CRITICAL - Problem with AR results for report(s) REPORT2, REPORT3 "
+            "for tenant TENANT1; report(s) REPORT4 for tenant TENANT2"
+            "|time=0.565367s;size=54741B\n"
             "TENANT1:\n"
             "AR for report REPORT1 - OK\n"
             "AR for report REPORT2 - CRITICAL - Unable to retrieve "
             "availability for report REPORT2\n"
-            "AR for report REPORT3 - OK\n\n"
+            "AR for report REPORT3 - CRITICAL - BAD REQUEST\n\n"
             "TENANT2:\n"
-            "CRITICAL - Error fetching reports\n\n"
-            "TENANT3:\n"
-            "AR for report REPORT4 - OK\n"
+            "AR for report REPORT4 - CRITICAL - Unable to retrieve "
+            "availability\n"
             "AR for report REPORT5 - OK"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_error_fetching_all_reports_for_ar_reports_single_tenant(self):
-        results = {
-            "TENANT": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
-            }
-        }
-        status = Status(rtype="ar", data=results, verbosity=0)
-        self.assertEqual(
-            status.get_message(), "CRITICAL - Problem fetching all reports"
-        )
-        self.assertEqual(status.get_code(), 2)
-
-    def test_error_fetching_all_reports_for_ar_reports_single_tenant_verbose(
-            self
-    ):
+    def test_multitple_errors_with_ar_reports_single_tenant(self):
         results = {
             "TENANT": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
-            }
-        }
-        status = Status(rtype="ar", data=results, verbosity=1)
-        self.assertEqual(
-            status.get_message(),
-            "CRITICAL - Problem fetching all reports\n"
-            "CRITICAL - Error fetching reports"
-        )
-        self.assertEqual(status.get_code(), 2)
-
-    def test_multiple_errors_fetching_all_reports_for_ar_reports(self):
-        results = {
-            "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "OK",
-                    "REPORT3": "OK"
+                    "REPORT2": "CRITICAL - Unable to retrieve availability "
+                               "from report REPORT2",
+                    "REPORT3": "CRITICAL - BAD REQUEST"
                 },
                 "performance": {
                     "REPORT1": {
@@ -2722,30 +5582,24 @@ class StatusTests(unittest.TestCase):
                         "size": 10413
                     }
                 }
-            },
-            "TENANT2": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
-            },
-            "TENANT3": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports for "
-                                     "tenant TENANT3: 401 Unauthorized"
             }
         }
         status = Status(rtype="ar", data=results, verbosity=0)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem fetching all reports for tenant(s) TENANT2, "
-            "TENANT3|time=0.210245s;size=5987B"
+            "CRITICAL - Problem with AR results for report(s) REPORT2, REPORT3"
+            "|time=0.210245s;size=5987B"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_multiple_errors_fetching_all_reports_for_ar_reports_verbose(self):
+    def test_multiple_errors_with_ar_reports_single_tenant_verbose(self):
         results = {
-            "TENANT1": {
+            "TENANT": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "OK",
-                    "REPORT3": "OK"
+                    "REPORT2": "CRITICAL - Unable to retrieve availability "
+                               "for report REPORT2",
+                    "REPORT3": "CRITICAL - BAD REQUEST"
                 },
                 "performance": {
                     "REPORT1": {
@@ -2761,39 +5615,99 @@ class StatusTests(unittest.TestCase):
                         "size": 10413
                     }
                 }
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=1)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem with AR results for report(s) REPORT2, REPORT3"
+            "|time=0.210245s;size=5987B\n"
+            "AR for report REPORT1 - OK\n"
+            "AR for report REPORT2 - CRITICAL - Unable to retrieve "
+            "availability for report REPORT2\n"
+            "AR for report REPORT3 - CRITICAL - BAD REQUEST"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_ar_reports_all_with_exception(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "CRITICAL - Unable to retrieve availability "
+                               "for report REPORT1",
+                    "REPORT2": "CRITICAL - Unable to retrieve availability "
+                               "for report REPORT2",
+                    "REPORT3": "CRITICAL - BAD REQUEST"
+                },
+                "performance": {}
             },
             "TENANT2": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+                "results": {
+                    "REPORT4": "CRITICAL - Unable to retrieve availability for "
+                               "report REPORT4",
+                    "REPORT5": "CRITICAL - Unable to retrieve availability for "
+                               "report REPORT5"
+                },
+                "performance": {}
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=0)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem with AR results for report(s) REPORT1, "
+            "REPORT2, REPORT3 for tenant TENANT1; report(s) REPORT4, REPORT5 "
+            "for tenant TENANT2"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_ar_reports_all_with_exceptions_verbose(self):
+        results = {
+            "TENANT1": {
+                "results": {
+                    "REPORT1": "CRITICAL - Unable to retrieve availability "
+                               "for report REPORT1",
+                    "REPORT2": "CRITICAL - Unable to retrieve availability "
+                               "for report REPORT2",
+                    "REPORT3": "CRITICAL - BAD REQUEST"
+                },
+                "performance": {}
             },
-            "TENANT3": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports for "
-                                     "tenant TENANT3: 401 Unauthorized"
+            "TENANT2": {
+                "results": {
+                    "REPORT4": "CRITICAL - Unable to retrieve availability for "
+                               "report REPORT4",
+                    "REPORT5": "CRITICAL - Unable to retrieve availability for "
+                               "report REPORT5"
+                },
+                "performance": {}
             }
         }
         status = Status(rtype="ar", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem fetching all reports for tenant(s) "
-            "TENANT2, TENANT3|time=0.210245s;size=5987B\n"
+            "CRITICAL - Problem with AR results for report(s) REPORT1, "
+            "REPORT2, REPORT3 for tenant TENANT1; report(s) REPORT4, REPORT5 "
+            "for tenant TENANT2\n"
             "TENANT1:\n"
-            "AR for report REPORT1 - OK\n"
-            "AR for report REPORT2 - OK\n"
-            "AR for report REPORT3 - OK\n\n"
+            "AR for report REPORT1 - CRITICAL - Unable to retrieve "
+            "availability for report REPORT1\n"
+            "AR for report REPORT2 - CRITICAL - Unable to retrieve "
+            "availability for report REPORT2\n"
+            "AR for report REPORT3 - CRITICAL - BAD REQUEST\n\n"
             "TENANT2:\n"
-            "CRITICAL - Error fetching reports\n\n"
-            "TENANT3:\n"
-            "CRITICAL - Error fetching reports for tenant TENANT3: 401 "
-            "Unauthorized"
+            "AR for report REPORT4 - CRITICAL - Unable to retrieve "
+            "availability for report REPORT4\n"
+            "AR for report REPORT5 - CRITICAL - Unable to retrieve "
+            "availability for report REPORT5"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_error_with_ar_reports(self):
+    def test_ok_status_reports(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability "
-                               "from report REPORT2",
+                    "REPORT2": "OK",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -2826,23 +5740,33 @@ class StatusTests(unittest.TestCase):
                         "size": 54741
                     }
                 }
+            },
+            "TENANT3": {
+                "results": {
+                    "REPORT6": "OK"
+                },
+                "performance": {
+                    "REPORT6": {
+                        "time": 0.204673,
+                        "size": 54893
+                    }
+                }
             }
         }
-        status = Status(rtype="ar", data=results, verbosity=0)
+        status = Status(rtype="status", data=results, verbosity=0)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT2 for "
-            "tenant TENANT1|time=0.565367s;size=54741B"
+            "OK - Status results available for all tenants and reports"
+            "|time=0.565367s;size=54741B"
         )
-        self.assertEqual(status.get_code(), 2)
+        self.assertEqual(status.get_code(), 0)
 
-    def test_error_with_ar_reports_verbose(self):
+    def test_ok_status_reports_verbose(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability "
-                               "for report REPORT2",
+                    "REPORT2": "OK",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -2875,31 +5799,42 @@ class StatusTests(unittest.TestCase):
                         "size": 54741
                     }
                 }
+            },
+            "TENANT3": {
+                "results": {
+                    "REPORT6": "OK"
+                },
+                "performance": {
+                    "REPORT6": {
+                        "time": 0.204673,
+                        "size": 54893
+                    }
+                }
             }
         }
-        status = Status(rtype="ar", data=results, verbosity=1)
+        status = Status(rtype="status", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT2 for "
-            "tenant TENANT1|time=0.565367s;size=54741B\n"
+            "OK - Status results available for all tenants and reports"
+            "|time=0.565367s;size=54741B\n"
             "TENANT1:\n"
-            "AR for report REPORT1 - OK\n"
-            "AR for report REPORT2 - CRITICAL - Unable to retrieve "
-            "availability for report REPORT2\n"
-            "AR for report REPORT3 - OK\n\n"
+            "Status for report REPORT1 - OK\n"
+            "Status for report REPORT2 - OK\n"
+            "Status for report REPORT3 - OK\n\n"
             "TENANT2:\n"
-            "AR for report REPORT4 - OK\n"
-            "AR for report REPORT5 - OK"
+            "Status for report REPORT4 - OK\n"
+            "Status for report REPORT5 - OK\n\n"
+            "TENANT3:\n"
+            "Status for report REPORT6 - OK"
         )
-        self.assertEqual(status.get_code(), 2)
+        self.assertEqual(status.get_code(), 0)
 
-    def test_error_with_ar_reports_single_tenant(self):
+    def test_ok_status_reports_single_tenant(self):
         results = {
             "TENANT": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability "
-                               "from report REPORT2",
+                    "REPORT2": "OK",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -2918,21 +5853,20 @@ class StatusTests(unittest.TestCase):
                 }
             }
         }
-        status = Status(rtype="ar", data=results, verbosity=0)
+        status = Status(rtype="status", data=results, verbosity=0)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT2"
+            "OK - Status results available for all reports"
             "|time=0.210245s;size=5987B"
         )
-        self.assertEqual(status.get_code(), 2)
+        self.assertEqual(status.get_code(), 0)
 
-    def test_error_with_ar_reports_single_tenant_verbose(self):
+    def test_ok_status_reports_single_tenants_verbose(self):
         results = {
             "TENANT": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability "
-                               "for report REPORT2",
+                    "REPORT2": "OK",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -2951,26 +5885,25 @@ class StatusTests(unittest.TestCase):
                 }
             }
         }
-        status = Status(rtype="ar", data=results, verbosity=1)
+        status = Status(rtype="status", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT2"
+            "OK - Status results available for all reports"
             "|time=0.210245s;size=5987B\n"
-            "AR for report REPORT1 - OK\n"
-            "AR for report REPORT2 - CRITICAL - Unable to retrieve "
-            "availability for report REPORT2\n"
-            "AR for report REPORT3 - OK"
+            "Status for report REPORT1 - OK\n"
+            "Status for report REPORT2 - OK\n"
+            "Status for report REPORT3 - OK"
         )
-        self.assertEqual(status.get_code(), 2)
+        self.assertEqual(status.get_code(), 0)
 
-    def test_multitple_errors_with_ar_reports(self):
+    def test_error_fetching_all_reports_for_status_reports(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability "
-                               "from report REPORT2",
-                    "REPORT3": "CRITICAL - BAD REQUEST"
+                    "REPORT2": "CRITICAL - Unable to retrieve status for "
+                               "report REPORT2",
+                    "REPORT3": "OK"
                 },
                 "performance": {
                     "REPORT1": {
@@ -2988,39 +5921,37 @@ class StatusTests(unittest.TestCase):
                 }
             },
             "TENANT2": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            },
+            "TENANT3": {
                 "results": {
-                    "REPORT4": "CRITICAL - Unable to retrieve availability",
-                    "REPORT5": "OK"
+                    "REPORT6": "OK"
                 },
                 "performance": {
-                    "REPORT4": {
+                    "REPORT6": {
                         "time": 0.079089,
                         "size": 17968
-                    },
-                    "REPORT5": {
-                        "time": 0.565367,
-                        "size": 54741
                     }
                 }
             }
         }
-        status = Status(rtype="ar", data=results, verbosity=0)
+        status = Status(rtype="status", data=results, verbosity=0)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT2, REPORT3 "
-            "for tenant TENANT1; report(s) REPORT4 for tenant TENANT2"
-            "|time=0.565367s;size=54741B"
+            "CRITICAL - Problem with status results for report(s) REPORT2 for "
+            "tenant TENANT1; problem fetching all reports for tenant(s) TENANT2"
+            "|time=0.210245s;size=5987B"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_multiple_errors_with_ar_reports_verbose(self):
+    def test_error_fetching_all_reports_for_status_reports_verbose(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability "
-                               "for report REPORT2",
-                    "REPORT3": "CRITICAL - BAD REQUEST"
+                    "REPORT2": "CRITICAL - Unable to retrieve status for "
+                               "report REPORT2",
+                    "REPORT3": "OK"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3038,48 +5969,73 @@ class StatusTests(unittest.TestCase):
                 }
             },
             "TENANT2": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            },
+            "TENANT3": {
                 "results": {
-                    "REPORT4": "CRITICAL - Unable to retrieve availability",
-                    "REPORT5": "OK"
+                    "REPORT6": "OK"
                 },
                 "performance": {
-                    "REPORT4": {
+                    "REPORT6": {
                         "time": 0.079089,
                         "size": 17968
-                    },
-                    "REPORT5": {
-                        "time": 0.565367,
-                        "size": 54741
                     }
                 }
             }
         }
-        status = Status(rtype="ar", data=results, verbosity=1)
+        status = Status(rtype="status", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT2, REPORT3 "
-            "for tenant TENANT1; report(s) REPORT4 for tenant TENANT2"
-            "|time=0.565367s;size=54741B\n"
+            "CRITICAL - Problem with status results for report(s) REPORT2 for "
+            "tenant TENANT1; problem fetching all reports for tenant(s) "
+            "TENANT2|time=0.210245s;size=5987B\n"
             "TENANT1:\n"
-            "AR for report REPORT1 - OK\n"
-            "AR for report REPORT2 - CRITICAL - Unable to retrieve "
-            "availability for report REPORT2\n"
-            "AR for report REPORT3 - CRITICAL - BAD REQUEST\n\n"
+            "Status for report REPORT1 - OK\n"
+            "Status for report REPORT2 - CRITICAL - Unable to retrieve status "
+            "for report REPORT2\n"
+            "Status for report REPORT3 - OK\n\n"
             "TENANT2:\n"
-            "AR for report REPORT4 - CRITICAL - Unable to retrieve "
-            "availability\n"
-            "AR for report REPORT5 - OK"
+            "CRITICAL - Error fetching reports\n\n"
+            "TENANT3:\n"
+            "Status for report REPORT6 - OK"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_multitple_errors_with_ar_reports_single_tenant(self):
+    def test_error_fetching_all_reports_for_status_reports_single_tenant(self):
+        results = {
+            "TENANT": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            }
+        }
+        status = Status(rtype="status", data=results, verbosity=0)
+        self.assertEqual(
+            status.get_message(), "CRITICAL - Problem fetching all reports"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_error_fetching_all_reports_status_reports_single_tenant_verbose(
+            self
+    ):
         results = {
             "TENANT": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            }
+        }
+        status = Status(rtype="status", data=results, verbosity=1)
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem fetching all reports\n"
+            "CRITICAL - Error fetching reports"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_multiple_errors_fetching_all_reports_for_status_reports(self):
+        results = {
+            "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability "
-                               "from report REPORT2",
-                    "REPORT3": "CRITICAL - BAD REQUEST"
+                    "REPORT2": "OK",
+                    "REPORT3": "OK"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3095,24 +6051,32 @@ class StatusTests(unittest.TestCase):
                         "size": 10413
                     }
                 }
+            },
+            "TENANT2": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+            },
+            "TENANT3": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports for "
+                                     "tenant TENANT3: 401 Unauthorized"
             }
         }
-        status = Status(rtype="ar", data=results, verbosity=0)
+        status = Status(rtype="status", data=results, verbosity=0)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT2, REPORT3"
-            "|time=0.210245s;size=5987B"
+            "CRITICAL - Problem fetching all reports for tenant(s) TENANT2, "
+            "TENANT3|time=0.210245s;size=5987B"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_multiple_errors_with_ar_reports_single_tenant_verbose(self):
+    def test_multiple_errors_fetching_all_reports_for_status_reports_verbose(
+            self
+    ):
         results = {
-            "TENANT": {
+            "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability "
-                               "for report REPORT2",
-                    "REPORT3": "CRITICAL - BAD REQUEST"
+                    "REPORT2": "OK",
+                    "REPORT3": "OK"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3128,99 +6092,39 @@ class StatusTests(unittest.TestCase):
                         "size": 10413
                     }
                 }
-            }
-        }
-        status = Status(rtype="ar", data=results, verbosity=1)
-        self.assertEqual(
-            status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT2, REPORT3"
-            "|time=0.210245s;size=5987B\n"
-            "AR for report REPORT1 - OK\n"
-            "AR for report REPORT2 - CRITICAL - Unable to retrieve "
-            "availability for report REPORT2\n"
-            "AR for report REPORT3 - CRITICAL - BAD REQUEST"
-        )
-        self.assertEqual(status.get_code(), 2)
-
-    def test_ar_reports_all_with_exception(self):
-        results = {
-            "TENANT1": {
-                "results": {
-                    "REPORT1": "CRITICAL - Unable to retrieve availability "
-                               "for report REPORT1",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability "
-                               "for report REPORT2",
-                    "REPORT3": "CRITICAL - BAD REQUEST"
-                },
-                "performance": {}
             },
             "TENANT2": {
-                "results": {
-                    "REPORT4": "CRITICAL - Unable to retrieve availability for "
-                               "report REPORT4",
-                    "REPORT5": "CRITICAL - Unable to retrieve availability for "
-                               "report REPORT5"
-                },
-                "performance": {}
-            }
-        }
-        status = Status(rtype="ar", data=results, verbosity=0)
-        self.assertEqual(
-            status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT1, "
-            "REPORT2, REPORT3 for tenant TENANT1; report(s) REPORT4, REPORT5 "
-            "for tenant TENANT2"
-        )
-        self.assertEqual(status.get_code(), 2)
-
-    def test_ar_reports_all_with_exceptions_verbose(self):
-        results = {
-            "TENANT1": {
-                "results": {
-                    "REPORT1": "CRITICAL - Unable to retrieve availability "
-                               "for report REPORT1",
-                    "REPORT2": "CRITICAL - Unable to retrieve availability "
-                               "for report REPORT2",
-                    "REPORT3": "CRITICAL - BAD REQUEST"
-                },
-                "performance": {}
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
             },
-            "TENANT2": {
-                "results": {
-                    "REPORT4": "CRITICAL - Unable to retrieve availability for "
-                               "report REPORT4",
-                    "REPORT5": "CRITICAL - Unable to retrieve availability for "
-                               "report REPORT5"
-                },
-                "performance": {}
+            "TENANT3": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports for "
+                                     "tenant TENANT3: 401 Unauthorized"
             }
         }
-        status = Status(rtype="ar", data=results, verbosity=1)
+        status = Status(rtype="status", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with AR results for report(s) REPORT1, "
-            "REPORT2, REPORT3 for tenant TENANT1; report(s) REPORT4, REPORT5 "
-            "for tenant TENANT2\n"
+            "CRITICAL - Problem fetching all reports for tenant(s) "
+            "TENANT2, TENANT3|time=0.210245s;size=5987B\n"
             "TENANT1:\n"
-            "AR for report REPORT1 - CRITICAL - Unable to retrieve "
-            "availability for report REPORT1\n"
-            "AR for report REPORT2 - CRITICAL - Unable to retrieve "
-            "availability for report REPORT2\n"
-            "AR for report REPORT3 - CRITICAL - BAD REQUEST\n\n"
+            "Status for report REPORT1 - OK\n"
+            "Status for report REPORT2 - OK\n"
+            "Status for report REPORT3 - OK\n\n"
             "TENANT2:\n"
-            "AR for report REPORT4 - CRITICAL - Unable to retrieve "
-            "availability for report REPORT4\n"
-            "AR for report REPORT5 - CRITICAL - Unable to retrieve "
-            "availability for report REPORT5"
+            "CRITICAL - Error fetching reports\n\n"
+            "TENANT3:\n"
+            "CRITICAL - Error fetching reports for tenant TENANT3: 401 "
+            "Unauthorized"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_ok_status_reports(self):
+    def test_error_with_status_reports(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve status for "
+                               "report REPORT2",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -3253,33 +6157,23 @@ class StatusTests(unittest.TestCase):
                         "size": 54741
                     }
                 }
-            },
-            "TENANT3": {
-                "results": {
-                    "REPORT6": "OK"
-                },
-                "performance": {
-                    "REPORT6": {
-                        "time": 0.204673,
-                        "size": 54893
-                    }
-                }
             }
         }
         status = Status(rtype="status", data=results, verbosity=0)
         self.assertEqual(
             status.get_message(),
-            "OK - Status results available for all tenants and reports"
-            "|time=0.565367s;size=54741B"
+            "CRITICAL - Problem with status results for report(s) REPORT2 for "
+            "tenant TENANT1|time=0.565367s;size=54741B"
         )
-        self.assertEqual(status.get_code(), 0)
+        self.assertEqual(status.get_code(), 2)
 
-    def test_ok_status_reports_verbose(self):
+    def test_error_with_status_reports_verbose(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve status for "
+                               "report REPORT2",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -3312,42 +6206,31 @@ class StatusTests(unittest.TestCase):
                         "size": 54741
                     }
                 }
-            },
-            "TENANT3": {
-                "results": {
-                    "REPORT6": "OK"
-                },
-                "performance": {
-                    "REPORT6": {
-                        "time": 0.204673,
-                        "size": 54893
-                    }
-                }
             }
         }
         status = Status(rtype="status", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "OK - Status results available for all tenants and reports"
-            "|time=0.565367s;size=54741B\n"
+            "CRITICAL - Problem with status results for report(s) REPORT2 for "
+            "tenant TENANT1|time=0.565367s;size=54741B\n"
             "TENANT1:\n"
             "Status for report REPORT1 - OK\n"
-            "Status for report REPORT2 - OK\n"
+            "Status for report REPORT2 - CRITICAL - Unable to retrieve status "
+            "for report REPORT2\n"
             "Status for report REPORT3 - OK\n\n"
             "TENANT2:\n"
             "Status for report REPORT4 - OK\n"
-            "Status for report REPORT5 - OK\n\n"
-            "TENANT3:\n"
-            "Status for report REPORT6 - OK"
+            "Status for report REPORT5 - OK"
         )
-        self.assertEqual(status.get_code(), 0)
+        self.assertEqual(status.get_code(), 2)
 
-    def test_ok_status_reports_single_tenant(self):
+    def test_error_with_status_reports_single_tenant(self):
         results = {
             "TENANT": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve status for "
+                               "report REPORT2",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -3369,17 +6252,18 @@ class StatusTests(unittest.TestCase):
         status = Status(rtype="status", data=results, verbosity=0)
         self.assertEqual(
             status.get_message(),
-            "OK - Status results available for all reports"
+            "CRITICAL - Problem with status results for report(s) REPORT2"
             "|time=0.210245s;size=5987B"
         )
-        self.assertEqual(status.get_code(), 0)
+        self.assertEqual(status.get_code(), 2)
 
-    def test_ok_status_reports_single_tenants_verbose(self):
+    def test_error_with_status_reports_single_tenant_verbose(self):
         results = {
             "TENANT": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve status for "
+                               "report REPORT2",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -3401,22 +6285,23 @@ class StatusTests(unittest.TestCase):
         status = Status(rtype="status", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "OK - Status results available for all reports"
+            "CRITICAL - Problem with status results for report(s) REPORT2"
             "|time=0.210245s;size=5987B\n"
             "Status for report REPORT1 - OK\n"
-            "Status for report REPORT2 - OK\n"
+            "Status for report REPORT2 - CRITICAL - Unable to retrieve status "
+            "for report REPORT2\n"
             "Status for report REPORT3 - OK"
         )
-        self.assertEqual(status.get_code(), 0)
+        self.assertEqual(status.get_code(), 2)
 
-    def test_error_fetching_all_reports_for_status_reports(self):
+    def test_multitple_errors_with_status_reports(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
                     "REPORT2": "CRITICAL - Unable to retrieve status for "
                                "report REPORT2",
-                    "REPORT3": "OK"
+                    "REPORT3": "CRITICAL - BAD REQUEST"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3434,16 +6319,18 @@ class StatusTests(unittest.TestCase):
                 }
             },
             "TENANT2": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
-            },
-            "TENANT3": {
                 "results": {
-                    "REPORT6": "OK"
+                    "REPORT4": "CRITICAL - Unable to retrieve status",
+                    "REPORT5": "OK"
                 },
                 "performance": {
-                    "REPORT6": {
+                    "REPORT4": {
                         "time": 0.079089,
                         "size": 17968
+                    },
+                    "REPORT5": {
+                        "time": 0.565367,
+                        "size": 54741
                     }
                 }
             }
@@ -3451,20 +6338,20 @@ class StatusTests(unittest.TestCase):
         status = Status(rtype="status", data=results, verbosity=0)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with status results for report(s) REPORT2 for "
-            "tenant TENANT1; problem fetching all reports for tenant(s) TENANT2"
-            "|time=0.210245s;size=5987B"
+            "CRITICAL - Problem with status results for report(s) REPORT2, "
+            "REPORT3 for tenant TENANT1; report(s) REPORT4 for tenant TENANT2"
+            "|time=0.565367s;size=54741B"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_error_fetching_all_reports_for_status_reports_verbose(self):
+    def test_multiple_errors_with_status_reports_verbose(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
                     "REPORT2": "CRITICAL - Unable to retrieve status for "
                                "report REPORT2",
-                    "REPORT3": "OK"
+                    "REPORT3": "CRITICAL - BAD REQUEST"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3482,16 +6369,18 @@ class StatusTests(unittest.TestCase):
                 }
             },
             "TENANT2": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
-            },
-            "TENANT3": {
                 "results": {
-                    "REPORT6": "OK"
+                    "REPORT4": "CRITICAL - Unable to retrieve status",
+                    "REPORT5": "OK"
                 },
                 "performance": {
-                    "REPORT6": {
+                    "REPORT4": {
                         "time": 0.079089,
                         "size": 17968
+                    },
+                    "REPORT5": {
+                        "time": 0.565367,
+                        "size": 54741
                     }
                 }
             }
@@ -3499,56 +6388,61 @@ class StatusTests(unittest.TestCase):
         status = Status(rtype="status", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with status results for report(s) REPORT2 for "
-            "tenant TENANT1; problem fetching all reports for tenant(s) "
-            "TENANT2|time=0.210245s;size=5987B\n"
+            "CRITICAL - Problem with status results for report(s) REPORT2, "
+            "REPORT3 for tenant TENANT1; report(s) REPORT4 for tenant TENANT2"
+            "|time=0.565367s;size=54741B\n"
             "TENANT1:\n"
             "Status for report REPORT1 - OK\n"
             "Status for report REPORT2 - CRITICAL - Unable to retrieve status "
             "for report REPORT2\n"
-            "Status for report REPORT3 - OK\n\n"
+            "Status for report REPORT3 - CRITICAL - BAD REQUEST\n\n"
             "TENANT2:\n"
-            "CRITICAL - Error fetching reports\n\n"
-            "TENANT3:\n"
-            "Status for report REPORT6 - OK"
+            "Status for report REPORT4 - CRITICAL - Unable to retrieve status\n"
+            "Status for report REPORT5 - OK"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_error_fetching_all_reports_for_status_reports_single_tenant(self):
+    def test_multitple_errors_with_status_reports_single_tenant(self):
         results = {
             "TENANT": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "CRITICAL - Unable to retrieve status for "
+                               "report REPORT2",
+                    "REPORT3": "CRITICAL - BAD REQUEST"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    },
+                    "REPORT2": {
+                        "time": 0.093002,
+                        "size": 1507
+                    },
+                    "REPORT3": {
+                        "time": 0.207804,
+                        "size": 10413
+                    }
+                }
             }
         }
         status = Status(rtype="status", data=results, verbosity=0)
-        self.assertEqual(
-            status.get_message(), "CRITICAL - Problem fetching all reports"
-        )
-        self.assertEqual(status.get_code(), 2)
-
-    def test_error_fetching_all_reports_status_reports_single_tenant_verbose(
-            self
-    ):
-        results = {
-            "TENANT": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
-            }
-        }
-        status = Status(rtype="status", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem fetching all reports\n"
-            "CRITICAL - Error fetching reports"
+            "CRITICAL - Problem with status results for report(s) REPORT2, "
+            "REPORT3|time=0.210245s;size=5987B"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_multiple_errors_fetching_all_reports_for_status_reports(self):
+    def test_multiple_errors_with_status_reports_single_tenant_verbose(self):
         results = {
-            "TENANT1": {
+            "TENANT": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "OK",
-                    "REPORT3": "OK"
+                    "REPORT2": "CRITICAL - Unable to retrieve status for "
+                               "report REPORT2",
+                    "REPORT3": "CRITICAL - BAD REQUEST"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3564,32 +6458,27 @@ class StatusTests(unittest.TestCase):
                         "size": 10413
                     }
                 }
-            },
-            "TENANT2": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
-            },
-            "TENANT3": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports for "
-                                     "tenant TENANT3: 401 Unauthorized"
             }
         }
-        status = Status(rtype="status", data=results, verbosity=0)
+        status = Status(rtype="status", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem fetching all reports for tenant(s) TENANT2, "
-            "TENANT3|time=0.210245s;size=5987B"
+            "CRITICAL - Problem with status results for report(s) REPORT2, "
+            "REPORT3|time=0.210245s;size=5987B\n"
+            "Status for report REPORT1 - OK\n"
+            "Status for report REPORT2 - CRITICAL - Unable to retrieve status "
+            "for report REPORT2\n"
+            "Status for report REPORT3 - CRITICAL - BAD REQUEST"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_multiple_errors_fetching_all_reports_for_status_reports_verbose(
-            self
-    ):
+    def test_error_with_status_reports_exceeding_max_size(self):
         results = {
-            "TENANT1": {
+            "TENANT": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "OK",
-                    "REPORT3": "OK"
+                    "REPORT2": "CRITICAL - Response for report REPORT2 "
+                               "exceeds maximum size of 10000 B"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3598,95 +6487,144 @@ class StatusTests(unittest.TestCase):
                     },
                     "REPORT2": {
                         "time": 0.093002,
-                        "size": 1507
-                    },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
+                        "size": 65536
                     }
                 }
-            },
-            "TENANT2": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports"
-            },
-            "TENANT3": {
-                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports for "
-                                     "tenant TENANT3: 401 Unauthorized"
             }
         }
-        status = Status(rtype="status", data=results, verbosity=1)
+        status = Status(
+            rtype="status", data=results, verbosity=1, max_size=10000
+        )
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem fetching all reports for tenant(s) "
-            "TENANT2, TENANT3|time=0.210245s;size=5987B\n"
-            "TENANT1:\n"
+            "CRITICAL - Problem with status results for report(s) REPORT2"
+            "|time=0.210245s;size=5987B max_body=65536B;;10000\n"
             "Status for report REPORT1 - OK\n"
-            "Status for report REPORT2 - OK\n"
-            "Status for report REPORT3 - OK\n\n"
-            "TENANT2:\n"
-            "CRITICAL - Error fetching reports\n\n"
-            "TENANT3:\n"
-            "CRITICAL - Error fetching reports for tenant TENANT3: 401 "
-            "Unauthorized"
+            "Status for report REPORT2 - CRITICAL - Response for report "
+            "REPORT2 exceeds maximum size of 10000 B"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_error_with_status_reports(self):
+    def test_ok_status_reports_with_wire_size_verbose(self):
         results = {
-            "TENANT1": {
+            "TENANT": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve status for "
-                               "report REPORT2",
-                    "REPORT3": "OK"
+                    "REPORT2": "OK"
                 },
                 "performance": {
                     "REPORT1": {
                         "time": 0.210245,
-                        "size": 5987
+                        "size": 5987,
+                        "wire_size": 812
                     },
                     "REPORT2": {
                         "time": 0.093002,
-                        "size": 1507
+                        "size": 1507,
+                        "wire_size": 402
+                    }
+                }
+            }
+        }
+        status = Status(rtype="status", data=results, verbosity=1)
+        self.assertEqual(
+            status.get_message(),
+            "OK - Status results available for all reports"
+            "|time=0.210245s;size=5987B wire_size=1214B decoded_size=7494B\n"
+            "Status for report REPORT1 - OK (812 B on wire, 5987 B decoded)\n"
+            "Status for report REPORT2 - OK (402 B on wire, 1507 B decoded)"
+        )
+        self.assertEqual(status.get_code(), 0)
+
+    def test_ok_ar_reports_with_timing_verbose(self):
+        results = {
+            "TENANT": {
+                "results": {
+                    "REPORT1": "OK",
+                    "REPORT2": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 2.5,
+                        "ttfb": 0.5,
+                        "throughput": 3000.,
+                        "size": 6000
                     },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
+                    "REPORT2": {
+                        "time": 0.75,
+                        "ttfb": 0.25,
+                        "throughput": 4000.,
+                        "size": 2000
                     }
                 }
-            },
-            "TENANT2": {
+            }
+        }
+        status = Status(rtype="ar", data=results, verbosity=1)
+        self.assertEqual(
+            status.get_message(),
+            "OK - AR results available for all reports"
+            "|time=2.500000s;size=6000B ttfb=0.500000s throughput=3200\n"
+            "AR for report REPORT1 - OK (2.500000 s total, 0.500000 s to "
+            "first byte, 3000 B/s)\n"
+            "AR for report REPORT2 - OK (0.750000 s total, 0.250000 s to "
+            "first byte, 4000 B/s)"
+        )
+        self.assertEqual(status.get_code(), 0)
+
+    def test_ok_status_reports_with_phase_timing_verbose(self):
+        results = {
+            "TENANT": {
                 "results": {
-                    "REPORT4": "OK",
-                    "REPORT5": "OK"
+                    "REPORT1": "OK",
+                    "REPORT2": "OK"
                 },
                 "performance": {
-                    "REPORT4": {
-                        "time": 0.079089,
-                        "size": 17968
+                    "REPORT1": {
+                        "time": 1.5,
+                        "size": 6000,
+                        "phases": {
+                            "dns": 0.125,
+                            "connect": 0.25,
+                            "tls": 0.5,
+                            "wait": 0.5,
+                            "download": 0.25
+                        }
                     },
-                    "REPORT5": {
-                        "time": 0.565367,
-                        "size": 54741
+                    "REPORT2": {
+                        "time": 0.75,
+                        "size": 2000,
+                        "phases": {
+                            "dns": 0.000012,
+                            "connect": 0,
+                            "tls": 0,
+                            "wait": 0.5,
+                            "download": 0.25
+                        }
                     }
                 }
             }
         }
-        status = Status(rtype="status", data=results, verbosity=0)
+        status = Status(rtype="status", data=results, verbosity=1)
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with status results for report(s) REPORT2 for "
-            "tenant TENANT1|time=0.565367s;size=54741B"
+            "OK - Status results available for all reports"
+            "|time=1.500000s;size=6000B dns=0.125012s connect=0.250000s "
+            "tls=0.500000s wait=1.000000s download=0.500000s\n"
+            "Status for report REPORT1 - OK (dns 0.125000 s, connect "
+            "0.250000 s, tls 0.500000 s, wait 0.500000 s, download "
+            "0.250000 s)\n"
+            "Status for report REPORT2 - OK (dns 0.000012 s, connect "
+            "0.000000 s, tls 0.000000 s, wait 0.500000 s, download "
+            "0.250000 s)"
         )
-        self.assertEqual(status.get_code(), 2)
+        self.assertEqual(status.get_code(), 0)
 
-    def test_error_with_status_reports_verbose(self):
+    def test_ok_ar_reports_with_summary_and_tenant_perfdata(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve status for "
-                               "report REPORT2",
+                    "REPORT2": "OK",
                     "REPORT3": "OK"
                 },
                 "performance": {
@@ -3719,65 +6657,43 @@ class StatusTests(unittest.TestCase):
                         "size": 54741
                     }
                 }
+            },
+            "TENANT3": {
+                "REPORTS_EXCEPTION": "CRITICAL - Error fetching reports for "
+                                     "tenant TENANT3: Error has occurred"
             }
         }
-        status = Status(rtype="status", data=results, verbosity=1)
+        status = Status(
+            rtype="ar", data=results, verbosity=0, perfdata="summary"
+        )
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with status results for report(s) REPORT2 for "
-            "tenant TENANT1|time=0.565367s;size=54741B\n"
-            "TENANT1:\n"
-            "Status for report REPORT1 - OK\n"
-            "Status for report REPORT2 - CRITICAL - Unable to retrieve status "
-            "for report REPORT2\n"
-            "Status for report REPORT3 - OK\n\n"
-            "TENANT2:\n"
-            "Status for report REPORT4 - OK\n"
-            "Status for report REPORT5 - OK"
+            "CRITICAL - Problem fetching all reports for tenant(s) TENANT3"
+            "|time=0.565367s;size=54741B reports=5 bytes=90616B "
+            "p50=0.207804s p95=0.565367s max=0.565367s"
         )
         self.assertEqual(status.get_code(), 2)
-
-    def test_error_with_status_reports_single_tenant(self):
-        results = {
-            "TENANT": {
-                "results": {
-                    "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve status for "
-                               "report REPORT2",
-                    "REPORT3": "OK"
-                },
-                "performance": {
-                    "REPORT1": {
-                        "time": 0.210245,
-                        "size": 5987
-                    },
-                    "REPORT2": {
-                        "time": 0.093002,
-                        "size": 1507
-                    },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
-                    }
-                }
-            }
-        }
-        status = Status(rtype="status", data=results, verbosity=0)
+        status = Status(
+            rtype="ar", data=results, verbosity=0, perfdata="tenant"
+        )
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with status results for report(s) REPORT2"
-            "|time=0.210245s;size=5987B"
+            "CRITICAL - Problem fetching all reports for tenant(s) TENANT3"
+            "|time=0.565367s;size=54741B reports=5 bytes=90616B "
+            "p50=0.207804s p95=0.565367s max=0.565367s "
+            "TENANT1::reports=3 TENANT1::bytes=17907B TENANT1::p50=0.207804s "
+            "TENANT1::p95=0.210245s TENANT1::max=0.210245s "
+            "TENANT2::reports=2 TENANT2::bytes=72709B TENANT2::p50=0.079089s "
+            "TENANT2::p95=0.565367s TENANT2::max=0.565367s"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_error_with_status_reports_single_tenant_verbose(self):
+    def test_ok_status_reports_with_report_perfdata(self):
         results = {
-            "TENANT": {
+            "TENANT 1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve status for "
-                               "report REPORT2",
-                    "REPORT3": "OK"
+                    "REPORT2": "OK"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3787,34 +6703,89 @@ class StatusTests(unittest.TestCase):
                     "REPORT2": {
                         "time": 0.093002,
                         "size": 1507
-                    },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
                     }
                 }
             }
         }
-        status = Status(rtype="status", data=results, verbosity=1)
+        status = Status(
+            rtype="status", data=results, verbosity=0, perfdata="report"
+        )
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with status results for report(s) REPORT2"
-            "|time=0.210245s;size=5987B\n"
-            "Status for report REPORT1 - OK\n"
-            "Status for report REPORT2 - CRITICAL - Unable to retrieve status "
-            "for report REPORT2\n"
-            "Status for report REPORT3 - OK"
+            "OK - Status results available for all reports"
+            "|time=0.210245s;size=5987B reports=2 bytes=7494B "
+            "p50=0.093002s p95=0.210245s max=0.210245s "
+            "'TENANT 1::reports'=2 'TENANT 1::bytes'=7494B "
+            "'TENANT 1::p50'=0.093002s 'TENANT 1::p95'=0.210245s "
+            "'TENANT 1::max'=0.210245s "
+            "'TENANT 1::REPORT1::time'=0.210245s "
+            "'TENANT 1::REPORT1::size'=5987B "
+            "'TENANT 1::REPORT2::time'=0.093002s "
+            "'TENANT 1::REPORT2::size'=1507B"
         )
-        self.assertEqual(status.get_code(), 2)
+        self.assertEqual(status.get_code(), 0)
 
-    def test_multitple_errors_with_status_reports(self):
+    def test_percentile(self):
+        values = sorted([0.5 * i for i in range(1, 1001)])
+        self.assertEqual(percentile(values, 50), 250.)
+        self.assertEqual(percentile(values, 95), 475.)
+        self.assertEqual(percentile(values, 99), 495.)
+        self.assertEqual(percentile(values, 100), 500.)
+        self.assertEqual(percentile([0.3], 95), 0.3)
+        self.assertEqual(percentile([], 95), 0)
+
+    def test_perfdata_label(self):
+        self.assertEqual(perfdata_label("TENANT::p95"), "TENANT::p95")
+        self.assertEqual(perfdata_label("TENANT 1::p95"), "'TENANT 1::p95'")
+        self.assertEqual(perfdata_label("it's"), "'it''s'")
+
+    def test_nagios_range(self):
+        self.assertTrue(NagiosRange("10").alert(10.5))
+        self.assertTrue(NagiosRange("10").alert(-1))
+        self.assertFalse(NagiosRange("10").alert(10))
+        self.assertFalse(NagiosRange("10").alert(0))
+        self.assertTrue(NagiosRange("10:").alert(9))
+        self.assertFalse(NagiosRange("10:").alert(100000))
+        self.assertTrue(NagiosRange("~:10").alert(11))
+        self.assertFalse(NagiosRange("~:10").alert(-100))
+        self.assertTrue(NagiosRange("10:20").alert(21))
+        self.assertFalse(NagiosRange("10:20").alert(15))
+        self.assertTrue(NagiosRange("@10:20").alert(15))
+        self.assertFalse(NagiosRange("@10:20").alert(21))
+        self.assertEqual(str(NagiosRange("@10:20")), "@10:20")
+        with self.assertRaises(WebAPIReportsException) as context:
+            NagiosRange("20:10")
+        self.assertEqual(
+            context.exception.__str__(), "Invalid threshold range: 20:10"
+        )
+        with self.assertRaises(WebAPIReportsException) as context:
+            NagiosRange("fast")
+        self.assertEqual(
+            context.exception.__str__(), "Invalid threshold range: fast"
+        )
+
+    def test_wrong_threshold_definition(self):
+        with self.assertRaises(WebAPIReportsException) as context:
+            Status(rtype="ar", data=dict(), verbosity=0, warning=["time"])
+        self.assertEqual(
+            context.exception.__str__(),
+            "Wrong threshold definition: time; threshold needs to be defined "
+            "as <METRIC>=<RANGE>"
+        )
+        with self.assertRaises(WebAPIReportsException) as context:
+            Status(rtype="ar", data=dict(), verbosity=0, critical=["ttfb=1"])
+        self.assertEqual(
+            context.exception.__str__(),
+            "Wrong threshold metric: ttfb; metric needs to be one of time, "
+            "size, p95, bytes"
+        )
+
+    def test_warning_ar_reports_time_threshold(self):
         results = {
             "TENANT1": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve status for "
-                               "report REPORT2",
-                    "REPORT3": "CRITICAL - BAD REQUEST"
+                    "REPORT2": "OK"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3824,16 +6795,12 @@ class StatusTests(unittest.TestCase):
                     "REPORT2": {
                         "time": 0.093002,
                         "size": 1507
-                    },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
                     }
                 }
             },
             "TENANT2": {
                 "results": {
-                    "REPORT4": "CRITICAL - Unable to retrieve status",
+                    "REPORT4": "OK",
                     "REPORT5": "OK"
                 },
                 "performance": {
@@ -3848,23 +6815,37 @@ class StatusTests(unittest.TestCase):
                 }
             }
         }
-        status = Status(rtype="status", data=results, verbosity=0)
+        status = Status(
+            rtype="ar", data=results, verbosity=0, warning=["time=0.2"],
+            critical=["time=1"]
+        )
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with status results for report(s) REPORT2, "
-            "REPORT3 for tenant TENANT1; report(s) REPORT4 for tenant TENANT2"
-            "|time=0.565367s;size=54741B"
+            "WARNING - AR results available for all tenants and reports; "
+            "time outside warning range 0.2 for report(s) REPORT1 (TENANT1), "
+            "REPORT5 (TENANT2)|time=0.565367s;0.2;1 size=54741B"
+        )
+        self.assertEqual(status.get_code(), 1)
+        status = Status(
+            rtype="ar", data=results, verbosity=0,
+            warning=["time=0.2", "size=50000"], critical=["time=0.5"]
+        )
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - AR results available for all tenants and reports; "
+            "time outside critical range 0.5 for report(s) REPORT5 (TENANT2); "
+            "time outside warning range 0.2 for report(s) REPORT1 (TENANT1); "
+            "size outside warning range 50000 for report(s) REPORT5 (TENANT2)"
+            "|time=0.565367s;0.2;0.5 size=54741B;50000;"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_multiple_errors_with_status_reports_verbose(self):
+    def test_warning_status_reports_aggregate_thresholds(self):
         results = {
-            "TENANT1": {
+            "TENANT": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve status for "
-                               "report REPORT2",
-                    "REPORT3": "CRITICAL - BAD REQUEST"
+                    "REPORT2": "OK"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3874,55 +6855,31 @@ class StatusTests(unittest.TestCase):
                     "REPORT2": {
                         "time": 0.093002,
                         "size": 1507
-                    },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
-                    }
-                }
-            },
-            "TENANT2": {
-                "results": {
-                    "REPORT4": "CRITICAL - Unable to retrieve status",
-                    "REPORT5": "OK"
-                },
-                "performance": {
-                    "REPORT4": {
-                        "time": 0.079089,
-                        "size": 17968
-                    },
-                    "REPORT5": {
-                        "time": 0.565367,
-                        "size": 54741
                     }
                 }
             }
         }
-        status = Status(rtype="status", data=results, verbosity=1)
+        status = Status(
+            rtype="status", data=results, verbosity=0,
+            warning=["p95=0.2", "bytes=5000"], critical=["bytes=10000"]
+        )
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with status results for report(s) REPORT2, "
-            "REPORT3 for tenant TENANT1; report(s) REPORT4 for tenant TENANT2"
-            "|time=0.565367s;size=54741B\n"
-            "TENANT1:\n"
-            "Status for report REPORT1 - OK\n"
-            "Status for report REPORT2 - CRITICAL - Unable to retrieve status "
-            "for report REPORT2\n"
-            "Status for report REPORT3 - CRITICAL - BAD REQUEST\n\n"
-            "TENANT2:\n"
-            "Status for report REPORT4 - CRITICAL - Unable to retrieve status\n"
-            "Status for report REPORT5 - OK"
+            "WARNING - Status results available for all reports; "
+            "p95 0.210245s outside warning range 0.2; "
+            "bytes 7494B outside warning range 5000"
+            "|time=0.210245s size=5987B reports=2 bytes=7494B;5000;10000 "
+            "p50=0.093002s p95=0.210245s;0.2; max=0.210245s"
         )
-        self.assertEqual(status.get_code(), 2)
+        self.assertEqual(status.get_code(), 1)
 
-    def test_multitple_errors_with_status_reports_single_tenant(self):
+    def test_error_with_status_reports_and_thresholds(self):
         results = {
             "TENANT": {
                 "results": {
                     "REPORT1": "OK",
                     "REPORT2": "CRITICAL - Unable to retrieve status for "
-                               "report REPORT2",
-                    "REPORT3": "CRITICAL - BAD REQUEST"
+                               "report REPORT2"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3932,30 +6889,52 @@ class StatusTests(unittest.TestCase):
                     "REPORT2": {
                         "time": 0.093002,
                         "size": 1507
-                    },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
                     }
                 }
             }
         }
-        status = Status(rtype="status", data=results, verbosity=0)
+        status = Status(
+            rtype="status", data=results, verbosity=0, warning=["time=0.1"]
+        )
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with status results for report(s) REPORT2, "
-            "REPORT3|time=0.210245s;size=5987B"
+            "CRITICAL - Problem with status results for report(s) REPORT2; "
+            "time outside warning range 0.1 for report(s) REPORT1"
+            "|time=0.210245s;0.1; size=5987B"
         )
         self.assertEqual(status.get_code(), 2)
 
-    def test_multiple_errors_with_status_reports_single_tenant_verbose(self):
+    def test_ok_ar_reports_with_run_stats(self):
+        results = {
+            "TENANT": {
+                "results": {
+                    "REPORT1": "OK"
+                },
+                "performance": {
+                    "REPORT1": {
+                        "time": 0.210245,
+                        "size": 5987
+                    }
+                }
+            }
+        }
+        status = Status(
+            rtype="ar", data=results, verbosity=0,
+            stats={"concurrency": "3;;;1;8", "backoffs": "2c"}
+        )
+        self.assertEqual(
+            status.get_message(),
+            "OK - AR results available for all reports"
+            "|time=0.210245s;size=5987B concurrency=3;;;1;8 backoffs=2c"
+        )
+        self.assertEqual(status.get_code(), 0)
+
+    def test_ok_status_reports_sampled(self):
         results = {
             "TENANT": {
                 "results": {
                     "REPORT1": "OK",
-                    "REPORT2": "CRITICAL - Unable to retrieve status for "
-                               "report REPORT2",
-                    "REPORT3": "CRITICAL - BAD REQUEST"
+                    "REPORT2": "OK"
                 },
                 "performance": {
                     "REPORT1": {
@@ -3963,24 +6942,215 @@ class StatusTests(unittest.TestCase):
                         "size": 5987
                     },
                     "REPORT2": {
-                        "time": 0.093002,
-                        "size": 1507
-                    },
-                    "REPORT3": {
-                        "time": 0.207804,
-                        "size": 10413
+                        "time": 0.112,
+                        "size": 1234
                     }
                 }
             }
         }
-        status = Status(rtype="status", data=results, verbosity=1)
+        status = Status(
+            rtype="status", data=results, verbosity=0,
+            sampling={
+                "checked": 2, "total": 30, "coverage": 66.6667,
+                "oldest": 3600.2, "never": 10
+            }
+        )
         self.assertEqual(
             status.get_message(),
-            "CRITICAL - Problem with status results for report(s) REPORT2, "
-            "REPORT3|time=0.210245s;size=5987B\n"
-            "Status for report REPORT1 - OK\n"
-            "Status for report REPORT2 - CRITICAL - Unable to retrieve status "
-            "for report REPORT2\n"
-            "Status for report REPORT3 - CRITICAL - BAD REQUEST"
+            "OK - Status results available for all reports; checked 2 of 30 "
+            "reports, coverage 66%, 10 never checked"
+            "|time=0.210245s;size=5987B coverage=66%;;;0;100 "
+            "oldest_check=3600s never_checked=10"
+        )
+        self.assertEqual(status.get_code(), 0)
+
+    def test_critical_status_reports_sampled(self):
+        results = {
+            "TENANT": {
+                "results": {
+                    "REPORT1": "CRITICAL - Unable to retrieve status for "
+                               "report REPORT1: Error has occurred"
+                },
+                "performance": dict()
+            }
+        }
+        status = Status(
+            rtype="status", data=results, verbosity=0,
+            sampling={
+                "checked": 1, "total": 2, "coverage": 100.,
+                "oldest": 60., "never": 0
+            }
+        )
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Problem with status results for report(s) REPORT1; "
+            "checked 1 of 2 reports, coverage 100%, oldest check 60 s ago"
+            "|coverage=100%;;;0;100 oldest_check=60s never_checked=0"
+        )
+        self.assertEqual(status.get_code(), 2)
+
+    def test_critical_host_unavailable(self):
+        status = Status(
+            rtype="ar", data=dict(), verbosity=1,
+            stats={"preflight": "5.002341s"},
+            host_error="Web-API host api.devel.argo.grnet.gr unavailable: "
+                       "connect timed out after 5 s"
+        )
+        self.assertEqual(
+            status.get_message(),
+            "CRITICAL - Web-API host api.devel.argo.grnet.gr unavailable: "
+            "connect timed out after 5 s|preflight=5.002341s"
         )
         self.assertEqual(status.get_code(), 2)
+
+
+class MockWebAPITests(unittest.TestCase):
+    def test_generated_payloads(self):
+        generator = PayloadGenerator(seed=1, groups=3, endpoints=4, days=2)
+        self.assertEqual(
+            generator.ar_results("TENANT1", "REPORT1"),
+            PayloadGenerator(seed=1, groups=3, endpoints=4, days=2).ar_results(
+                "TENANT1", "REPORT1"
+            )
+        )
+        self.assertNotEqual(
+            generator.ar_results("TENANT1", "REPORT1"),
+            PayloadGenerator(seed=2, groups=3, endpoints=4, days=2).ar_results(
+                "TENANT1", "REPORT1"
+            )
+        )
+        self.assertNotEqual(
+            generator.status_results("TENANT1", "REPORT1"),
+            generator.status_results("TENANT2", "REPORT1")
+        )
+        reports = generator.reports(
+            "TENANT1", [f"REPORT{i + 1}" for i in range(100)]
+        )
+        self.assertEqual(
+            len(set(report["id"] for report in reports["data"])), 100
+        )
+        ar = generator.ar_results("TENANT1", "REPORT1", "SERVICEGROUPS")
+        self.assertEqual(len(ar["results"]), 3)
+        self.assertEqual(len(ar["results"][0]["endpoints"]), 4)
+        self.assertEqual(
+            ar["results"][0]["endpoints"][0]["type"], "SERVICEGROUPS"
+        )
+        self.assertEqual(
+            [
+                result["date"]
+                for result in ar["results"][0]["endpoints"][0]["results"]
+            ],
+            ["2024-02-03", "2024-02-04"]
+        )
+        status = generator.status_results("TENANT1", "REPORT1")
+        self.assertEqual(len(status["groups"][0]["statuses"]), 12)
+        for rtype, payload in [("ar", ar), ("status", status)]:
+            verdict, performance = decode_and_validate(
+                rtype, "REPORT1", json.dumps(payload), dict()
+            )
+            self.assertEqual(verdict, "OK")
+
+    def test_fault_scenarios(self):
+        scenario = FaultScenario("test", [
+            {"route": "status", "tenant": "TENANT1", "latency": 1.},
+            {"route": "status", "report": "REPORT1", "times": 1,
+             "status": 429, "retry_after": 2},
+            {"route": "*", "probability": 0., "cut": 0.5}
+        ])
+        rng = random.Random(0)
+        self.assertEqual(
+            scenario.match("status", "TENANT1", "REPORT1", rng),
+            {"latency": 1., "status": 429, "retry_after": 2}
+        )
+        self.assertEqual(
+            scenario.match("status", "TENANT1", "REPORT1", rng),
+            {"latency": 1.}
+        )
+        self.assertEqual(
+            scenario.match("results", "TENANT1", "REPORT1", rng), dict()
+        )
+        scenario.reset()
+        self.assertEqual(
+            scenario.match("status", "TENANT2", "REPORT1", rng),
+            {"status": 429, "retry_after": 2}
+        )
+        scenarios = load_scenarios(os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "fault_scenarios.json"
+        ))
+        self.assertEqual(scenarios[0].name, "baseline")
+        self.assertEqual(scenarios[0].faults, list())
+
+
+class CommandLineTests(unittest.TestCase):
+    def setUp(self):
+        self.probe = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "src", "web-api"
+        )
+        self.env = dict(os.environ)
+        self.env.update({
+            "PYTHONPATH": os.path.dirname(os.path.abspath(__file__))
+        })
+
+    def test_help_does_not_import_http_stack(self):
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", self.probe, "--help"],
+            env=self.env, capture_output=True, text=True
+        )
+        self.assertEqual(output.returncode, 0)
+        self.assertIn("--transport", output.stdout)
+        imported = [
+            line.split("|")[-1].strip() for line in output.stderr.splitlines()
+        ]
+        self.assertIn("argparse", imported)
+        for module in ["argo_probe_webapi.web_api", "requests", "urllib3"]:
+            self.assertNotIn(module, imported)
+
+    def test_wrong_threshold_before_requests(self):
+        server = MockWebAPI(synthetic_tenants(1, 2))
+        server.start()
+        try:
+            self.env.update({"REQUESTS_CA_BUNDLE": server.ca_file})
+            output = subprocess.run([
+                sys.executable, self.probe, "-H", server.hostname,
+                "-k", "TENANT1:tenant1-token", "--rtype", "status",
+                "-t", "30", "-b", "0", "-w", "time=2", "-c", "tiem=5"
+            ], env=self.env, capture_output=True, text=True)
+
+        finally:
+            server.stop()
+
+        self.assertEqual(output.returncode, 3)
+        self.assertEqual(
+            output.stdout,
+            "UNKNOWN - Wrong threshold metric: tiem; metric needs to be one "
+            "of time, size, p95, bytes\n"
+        )
+        self.assertEqual(server.requests, 0)
+
+    def test_fail_fast_exits_without_waiting_for_requests(self):
+        server = MockWebAPI(
+            synthetic_tenants(1, 2), scenario=FaultScenario("test", [
+                {"route": "status", "report": "REPORT1", "status": 500},
+                {"route": "status", "report": "REPORT2", "latency": 5.}
+            ])
+        )
+        server.start()
+        try:
+            self.env.update({"REQUESTS_CA_BUNDLE": server.ca_file})
+            start = time.monotonic()
+            output = subprocess.run([
+                sys.executable, self.probe, "-H", server.hostname,
+                "-k", "TENANT1:tenant1-token", "--rtype", "status",
+                "-t", "30", "-b", "0", "--concurrency", "2",
+                "--fail-fast", "1"
+            ], env=self.env, capture_output=True, text=True)
+            elapsed = time.monotonic() - start
+
+        finally:
+            server.stop()
+
+        self.assertEqual(output.returncode, 2)
+        self.assertTrue(output.stdout.startswith("CRITICAL"))
+        self.assertLess(elapsed, 4.)